@@ -1,13 +1,14 @@
+import uuid
 from datetime import datetime, timedelta
 
 import pytest
 import pytz
-from foundation.models import User, db
+from foundation.models import User, db, index_registry
 from foundation.models.user import UserBanRecord
 from foundation.tests.factories import ORMUserDataFactory, ORMUserFactory
 from pomodoros.domain.value_objects import TaskStatus
 from pomodoros.tests.factories import ProjectFactory, TaskFactory
-from pomodoros_infrastructure import ProjectModel, TaskModel
+from pomodoros_infrastructure import ProjectModel, SubTaskModel, TaskModel
 from pomodoros_infrastructure.tests.factories import ORMProjectFactory, ORMTaskFactory
 from pony.orm import BindingError, db_session
 from web_app.marshallers.projects import ProjectRestSchema
@@ -22,6 +23,7 @@ def setup_teardown_tables() -> None:
         pass
     else:
         db.generate_mapping(create_tables=True)
+        index_registry.create_indexes(db)
         yield
         db.drop_all_tables(with_all_data=True)
         db.disconnect()
@@ -108,6 +110,17 @@ def orm_task(orm_project: ProjectModel) -> TaskModel:
         return ORMTaskFactory(project=orm_project.id)
 
 
+@pytest.fixture()
+def orm_task_with_sub_tasks(orm_project: ProjectModel) -> TaskModel:
+    with db_session:
+        orm_task = ORMTaskFactory(project=orm_project.id)
+        for ordering in range(1, 4):
+            SubTaskModel(
+                id=uuid.uuid4(), name=f"sub task {ordering}", task=orm_task, ordering=ordering, is_completed=False
+            )
+        return orm_task
+
+
 @pytest.fixture()
 def orm_second_task(orm_task: TaskModel, orm_project: ProjectModel) -> TaskModel:
     with db_session:
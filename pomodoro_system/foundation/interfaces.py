@@ -1,7 +1,7 @@
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Protocol, Type
+from typing import Optional, Protocol, Type
 
 from foundation.value_objects import UserDateFrameDefinition, UserId
 
@@ -23,7 +23,41 @@ class Paginator:
         return (self.page_size is not None and self.page is not None) and self.page > 0
 
 
+class OwnershipCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[UserId]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, owner_id: UserId) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+
+
 class ResourceProtector(ABC):
+    resource_name: str = "resource"
+
+    def __init__(self, ownership_cache: Optional[OwnershipCache] = None) -> None:
+        self.ownership_cache = ownership_cache
+
+    def _get_cache_key(self, resource_id: uuid.UUID) -> str:
+        return f"{self.resource_name}:{resource_id}"
+
+    def get_cached_owner_id(self, resource_id: uuid.UUID) -> Optional[UserId]:
+        if self.ownership_cache is not None:
+            return self.ownership_cache.get(self._get_cache_key(resource_id))
+
+    def cache_owner_id(self, resource_id: uuid.UUID, owner_id: Optional[UserId]) -> None:
+        if self.ownership_cache is not None and owner_id is not None:
+            self.ownership_cache.set(self._get_cache_key(resource_id), owner_id)
+
+    def forget(self, *resource_ids: uuid.UUID) -> None:
+        if self.ownership_cache is not None and resource_ids:
+            self.ownership_cache.delete(*map(self._get_cache_key, resource_ids))
+
     @abstractmethod
     def authorize(self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True) -> None:
         pass
@@ -1,3 +1,4 @@
-__all__ = ["db", "User", "UserDateFrameDefinitionModel"]
+__all__ = ["db", "User", "UserDateFrameDefinitionModel", "Index", "IndexRegistry", "index_registry"]
 
+from foundation.models.indexes import Index, IndexRegistry, index_registry
 from foundation.models.user import User, UserDateFrameDefinitionModel, db
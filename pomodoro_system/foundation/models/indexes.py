@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Type
+
+from pony.orm import Database, db_session
+
+POSTGRES_DIALECT = "PostgreSQL"
+SQLITE_DIALECT = "SQLite"
+
+
+@dataclass(frozen=True)
+class Index:
+    model: Type
+    attr_names: Tuple[str, ...]
+    name: Optional[str] = None
+    unique: bool = False
+    where: Optional[str] = None
+
+    @property
+    def table(self) -> str:
+        return self.model._table_
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(column for attr_name in self.attr_names for column in getattr(self.model, attr_name).columns)
+
+    @property
+    def index_name(self) -> str:
+        return self.name or f"idx_{self.table}__{'_'.join(self.columns)}"
+
+    def get_create_sql(self, database: Database) -> str:
+        provider = database.provider
+        columns = ", ".join(provider.quote_name(column) for column in self.columns)
+        sql = (
+            f"CREATE {'UNIQUE ' if self.unique else ''}INDEX IF NOT EXISTS {provider.quote_name(self.index_name)} "
+            f"ON {provider.quote_name(self.table)} ({columns})"
+        )
+
+        if self.where is not None and provider.dialect == POSTGRES_DIALECT:
+            sql += f" WHERE {self.where}"
+        return sql
+
+
+@dataclass(frozen=True)
+class DialectStatements:
+    dialect: str
+    statements: Tuple[str, ...]
+
+    def get_create_sql(self, database: Database) -> Tuple[str, ...]:
+        return self.statements if database.provider.dialect == self.dialect else ()
+
+
+class IndexRegistry:
+    def __init__(self) -> None:
+        self._indexes: List[Index] = []
+        self._dialect_statements: List[DialectStatements] = []
+
+    @property
+    def indexes(self) -> List[Index]:
+        return list(self._indexes)
+
+    def register(
+        self, model: Type, *attr_names: str, name: str = None, unique: bool = False, where: str = None
+    ) -> Index:
+        index = Index(model=model, attr_names=attr_names, name=name, unique=unique, where=where)
+        self._indexes.append(index)
+        return index
+
+    def register_statements(self, dialect: str, *statements: str) -> DialectStatements:
+        dialect_statements = DialectStatements(dialect=dialect, statements=statements)
+        self._dialect_statements.append(dialect_statements)
+        return dialect_statements
+
+    def create_indexes(self, database: Database) -> None:
+        with db_session:
+            for index in self._indexes:
+                database.execute(index.get_create_sql(database))
+            for dialect_statements in self._dialect_statements:
+                for statement in dialect_statements.get_create_sql(database):
+                    database.execute(statement)
+
+
+index_registry = IndexRegistry()
@@ -0,0 +1,23 @@
+from typing import List
+
+from foundation.models import db
+from foundation.models.indexes import POSTGRES_DIALECT
+from pony.orm.core import Query
+
+
+def get_query_plan(query: Query) -> List[str]:
+    sql, arguments, _, _ = query._construct_sql_and_arguments()
+
+    if db.provider.dialect == POSTGRES_DIALECT:
+        db.execute("SET LOCAL enable_seqscan = off")
+        cursor = db._exec_sql(f"EXPLAIN {sql}", arguments)
+        return [row[0] for row in cursor.fetchall()]
+
+    cursor = db._exec_sql(f"EXPLAIN QUERY PLAN {sql}", arguments)
+    return [row[-1] for row in cursor.fetchall()]
+
+
+def assert_uses_index(query: Query, index_name: str) -> None:
+    query_plan = get_query_plan(query)
+
+    assert any(index_name in line for line in query_plan), f"{index_name} is not used by: {query_plan}"
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+from foundation.models import Index, User
+from foundation.models.indexes import POSTGRES_DIALECT, SQLITE_DIALECT, DialectStatements
+
+
+def get_database(dialect: str) -> SimpleNamespace:
+    return SimpleNamespace(provider=SimpleNamespace(dialect=dialect, quote_name=lambda name: f'"{name}"'))
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestIndex:
+    def test_index_create_sql_on_postgres_is_partial(self):
+        index = Index(model=User, attr_names=("email",), name="idx_users__active_email", where="active = true")
+
+        assert index.get_create_sql(get_database(POSTGRES_DIALECT)) == (
+            'CREATE INDEX IF NOT EXISTS "idx_users__active_email" ON "users" ("email") WHERE active = true'
+        )
+
+    def test_index_create_sql_on_sqlite_ignores_partial_condition(self):
+        index = Index(model=User, attr_names=("email", "active"), unique=True, where="active = true")
+
+        assert index.get_create_sql(get_database(SQLITE_DIALECT)) == (
+            'CREATE UNIQUE INDEX IF NOT EXISTS "idx_users__email_active" ON "users" ("email", "active")'
+        )
+
+    def test_dialect_statements_are_created_only_for_their_dialect(self):
+        dialect_statements = DialectStatements(dialect=POSTGRES_DIALECT, statements=("CREATE EXTENSION pg_trgm",))
+
+        assert dialect_statements.get_create_sql(get_database(POSTGRES_DIALECT)) == ("CREATE EXTENSION pg_trgm",)
+        assert dialect_statements.get_create_sql(get_database(SQLITE_DIALECT)) == ()
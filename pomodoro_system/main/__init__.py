@@ -1,9 +1,10 @@
 import os
 from dataclasses import dataclass
+from datetime import timedelta
 
 import injector
 from dotenv import load_dotenv
-from foundation.models import db
+from foundation.models import db, index_registry
 from foundation.utils import get_config_file_path
 from main.settings_loader import LocalSetupStrategy, ProductionSetupStrategy, StagingSetupStrategy, TestingSetupStrategy
 from pomodoros import Pomodoros
@@ -16,8 +17,11 @@ class Application:
     injector: injector.Injector
 
 
-def inject_dependencies() -> injector.Injector:
-    return injector.Injector([Pomodoros(), PomodorosInfrastructure()], auto_bind=False)
+def inject_dependencies(settings: dict) -> injector.Injector:
+    return injector.Injector(
+        [Pomodoros(), PomodorosInfrastructure(event_sourced_pomodoros=settings["pomodoro_event_log"])],
+        auto_bind=False,
+    )
 
 
 def load_app_settings(settings: dict) -> dict:
@@ -39,6 +43,7 @@ def setup_database(database_settings: dict) -> None:
 
     if not db.schema:
         db.generate_mapping(create_tables=True, check_tables=True)
+        index_registry.create_indexes(db)
 
 
 def load_env_variables():
@@ -56,9 +61,11 @@ def initialize_application() -> Application:
         "testing": bool(int(os.getenv("TESTING", False))),
         "debug": bool(int(os.getenv("DEBUG", False))),
         "staging": bool(int(os.getenv("STAGING", False))),
+        "pomodoro_event_log": bool(int(os.getenv("POMODORO_EVENT_LOG", False))),
+        "task_renewal_horizon": timedelta(hours=int(os.getenv("TASK_RENEWAL_HORIZON_HOURS", 24))),
     }
 
-    dependency_injector = inject_dependencies()
+    dependency_injector = inject_dependencies(settings)
 
     additional_settings = load_app_settings(settings)
     settings.update(additional_settings)
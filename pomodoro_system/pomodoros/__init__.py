@@ -1,11 +1,27 @@
 import injector
 from foundation.application.repositories.user import UserRepository
-from pomodoros.application.queries.pomodoros import GetRecentPomodoros
-from pomodoros.application.queries.tasks import GetRecentTasksByProjectId, GetTaskListByOwnerId, QueryTaskDto
+from pomodoros.application.queries.pomodoros import (
+    GetActivePomodoro,
+    GetOverduePomodoros,
+    GetRecentPomodoros,
+    QueryOverduePomodoroDto,
+    QueryPomodoroDto,
+)
+from pomodoros.application.queries.stats import GetPomodoroStats, QueryStatsDto, StatsGranularity
+from pomodoros.application.queries.tasks import (
+    ClaimDueTaskReminders,
+    GetRecentTasksByProjectId,
+    GetTaskListByOwnerId,
+    QueryTaskDto,
+    QueryTaskReminderDto,
+    SearchTasksByOwnerId,
+)
 from pomodoros.application.repositories.pauses import PauseRepository
 from pomodoros.application.repositories.pomodoros import PomodoroRepository
 from pomodoros.application.repositories.projects import ProjectRepository
+from pomodoros.application.repositories.stats import StatsRepository
 from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.application.unit_of_work import UnitOfWork
 from pomodoros.application.use_cases.begin_pomodoro import (
     BeginPomodoro,
     BeginPomodoroInputDto,
@@ -18,6 +34,12 @@ from pomodoros.application.use_cases.complete_task import (
     CompleteTaskOutputBoundary,
     CompleteTaskOutputDto,
 )
+from pomodoros.application.use_cases.finish_overdue_pomodoros import (
+    FinishOverduePomodoros,
+    FinishOverduePomodorosInputDto,
+    FinishOverduePomodorosOutputBoundary,
+    FinishOverduePomodorosOutputDto,
+)
 from pomodoros.application.use_cases.finish_pomodoro import (
     FinishPomodoro,
     FinishPomodoroInputDto,
@@ -48,7 +70,24 @@ from pomodoros.application.use_cases.resume_pomodoro import (
     ResumePomodoroOutputBoundary,
     ResumePomodoroOutputDto,
 )
-from pomodoros.domain.value_objects import PauseId, PomodoroId, ProjectId, SubTaskId, TaskId
+from pomodoros.application.use_cases.sync_pomodoros import (
+    PomodoroEventDto,
+    PomodoroEventResultDto,
+    SyncPomodoros,
+    SyncPomodorosInputDto,
+    SyncPomodorosOutputBoundary,
+    SyncPomodorosOutputDto,
+)
+from pomodoros.domain.value_objects import (
+    PauseId,
+    PomodoroEvent,
+    PomodoroEventType,
+    PomodoroId,
+    PomodoroState,
+    ProjectId,
+    SubTaskId,
+    TaskId,
+)
 
 __all__ = [
     # injected module
@@ -59,49 +98,75 @@ __all__ = [
     "SubTaskId",
     "PomodoroId",
     "PauseId",
+    "PomodoroState",
+    "PomodoroEvent",
+    "PomodoroEventType",
     # repositories
     "PauseRepository",
     "PomodoroRepository",
     "ProjectRepository",
     "TaskRepository",
+    "StatsRepository",
+    # unit of work
+    "UnitOfWork",
     # use cases
     "BeginPomodoro",
     "PausePomodoro",
     "ResumePomodoro",
     "FinishPomodoro",
+    "FinishOverduePomodoros",
     "CompleteTask",
     "ReactivateTask",
     "PinTaskToProject",
+    "SyncPomodoros",
     # input dtos
     "BeginPomodoroInputDto",
     "PausePomodoroInputDto",
     "ResumePomodoroInputDto",
     "FinishPomodoroInputDto",
+    "FinishOverduePomodorosInputDto",
     "CompleteTaskInputDto",
     "ReactivateTaskInputDto",
     "PinTaskToProjectInputDto",
+    "SyncPomodorosInputDto",
+    "PomodoroEventDto",
     # output dtos
     "BeginPomodoroOutputDto",
     "PausePomodoroOutputDto",
     "ResumePomodoroOutputDto",
     "FinishPomodoroOutputDto",
+    "FinishOverduePomodorosOutputDto",
     "CompleteTaskOutputDto",
     "ReactivateTaskOutputDto",
     "PinTaskToProjectOutputDto",
+    "SyncPomodorosOutputDto",
+    "PomodoroEventResultDto",
     # output boundaries
     "BeginPomodoroOutputBoundary",
     "PausePomodoroOutputBoundary",
     "ResumePomodoroOutputBoundary",
     "FinishPomodoroOutputBoundary",
+    "FinishOverduePomodorosOutputBoundary",
     "CompleteTaskOutputBoundary",
     "ReactivateTaskOutputBoundary",
     "PinTaskToProjectOutputBoundary",
+    "SyncPomodorosOutputBoundary",
     # queries
     "GetRecentPomodoros",
+    "GetActivePomodoro",
+    "GetOverduePomodoros",
     "GetTaskListByOwnerId",
     "GetRecentTasksByProjectId",
+    "GetPomodoroStats",
+    "ClaimDueTaskReminders",
+    "SearchTasksByOwnerId",
     # queries dtos
     "QueryTaskDto",
+    "QueryTaskReminderDto",
+    "QueryPomodoroDto",
+    "QueryOverduePomodoroDto",
+    "QueryStatsDto",
+    "StatsGranularity",
 ]
 
 
@@ -110,50 +175,65 @@ class Pomodoros(injector.Module):
     def begin_pomodoro_uc(
         self,
         output_boundary: BeginPomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
+        users_repository: UserRepository,
         recent_pomodoros_query: GetRecentPomodoros,
     ) -> BeginPomodoro:
-        return BeginPomodoro(
-            output_boundary,
-            pomodoros_repository,
-            tasks_repository,
-            recent_pomodoros_query,
-        )
+        return BeginPomodoro(output_boundary, unit_of_work, users_repository, recent_pomodoros_query)
 
     @injector.provider
     def pause_pomodoro_uc(
         self,
         output_boundary: PausePomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
     ) -> PausePomodoro:
-        return PausePomodoro(output_boundary, pomodoros_repository, tasks_repository)
+        return PausePomodoro(output_boundary, unit_of_work)
 
     @injector.provider
     def resume_pomodoro_uc(
         self,
         output_boundary: ResumePomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
+        users_repository: UserRepository,
     ) -> ResumePomodoro:
-        return ResumePomodoro(output_boundary, pomodoros_repository, tasks_repository)
+        return ResumePomodoro(output_boundary, unit_of_work, users_repository)
 
     @injector.provider
     def finish_pomodoro_uc(
         self,
         output_boundary: FinishPomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
         users_repository: UserRepository,
         recent_pomodoros_query: GetRecentPomodoros,
+        stats_repository: StatsRepository,
     ) -> FinishPomodoro:
         return FinishPomodoro(
+            output_boundary,
+            unit_of_work,
+            users_repository,
+            recent_pomodoros_query,
+            stats_repository,
+        )
+
+    @injector.provider
+    def finish_overdue_pomodoros_uc(
+        self,
+        output_boundary: FinishOverduePomodorosOutputBoundary,
+        pomodoros_repository: PomodoroRepository,
+        tasks_repository: TaskRepository,
+        users_repository: UserRepository,
+        overdue_pomodoros_query: GetOverduePomodoros,
+        recent_pomodoros_query: GetRecentPomodoros,
+        stats_repository: StatsRepository,
+    ) -> FinishOverduePomodoros:
+        return FinishOverduePomodoros(
             output_boundary,
             pomodoros_repository,
             tasks_repository,
             users_repository,
+            overdue_pomodoros_query,
             recent_pomodoros_query,
+            stats_repository,
         )
 
     @injector.provider
@@ -177,7 +257,26 @@ class Pomodoros(injector.Module):
     def pin_task_to_project_provider(
         self,
         output_boundary: PinTaskToProjectOutputBoundary,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
         get_recent_tasks_by_project_id_query: GetRecentTasksByProjectId,
     ) -> PinTaskToProject:
-        return PinTaskToProject(output_boundary, tasks_repository, get_recent_tasks_by_project_id_query)
+        return PinTaskToProject(output_boundary, unit_of_work, get_recent_tasks_by_project_id_query)
+
+    @injector.provider
+    def sync_pomodoros_uc(
+        self,
+        output_boundary: SyncPomodorosOutputBoundary,
+        pomodoros_repository: PomodoroRepository,
+        tasks_repository: TaskRepository,
+        users_repository: UserRepository,
+        recent_pomodoros_query: GetRecentPomodoros,
+        stats_repository: StatsRepository,
+    ) -> SyncPomodoros:
+        return SyncPomodoros(
+            output_boundary,
+            pomodoros_repository,
+            tasks_repository,
+            users_repository,
+            recent_pomodoros_query,
+            stats_repository,
+        )
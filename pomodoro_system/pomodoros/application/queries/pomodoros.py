@@ -1,11 +1,45 @@
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
 
+from foundation.value_objects import UserId
+from pomodoros.domain.date_frame_index import DateFrameIndex
 from pomodoros.domain.entities.pomodoro import Pomodoro
-from pomodoros.domain.value_objects import TaskId
+from pomodoros.domain.value_objects import PomodoroId, PomodoroState, TaskId
+
+
+@dataclass
+class QueryPomodoroDto:
+    id: PomodoroId
+    task_id: TaskId
+    start_date: datetime
+    state: PomodoroState
+
+
+@dataclass
+class QueryOverduePomodoroDto:
+    id: PomodoroId
+    owner_id: UserId
 
 
 class GetRecentPomodoros(ABC):
     @abstractmethod
-    def query(self, task_id: TaskId) -> List[Pomodoro]:
+    def query(self, owner_id: UserId) -> List[Pomodoro]:
+        pass
+
+    @abstractmethod
+    def query_index(self, owner_id: UserId) -> DateFrameIndex:
+        pass
+
+
+class GetActivePomodoro(ABC):
+    @abstractmethod
+    def query(self, owner_id: UserId) -> Optional[QueryPomodoroDto]:
+        pass
+
+
+class GetOverduePomodoros(ABC):
+    @abstractmethod
+    def query(self, now: datetime, limit: int) -> List[QueryOverduePomodoroDto]:
         pass
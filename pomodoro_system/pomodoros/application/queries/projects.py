@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 from foundation.value_objects import UserId
 from pomodoros.domain.entities import Project
@@ -9,3 +9,7 @@ class GetProjectsByOwnerId(ABC):
     @abstractmethod
     def query(self, owner_id: UserId) -> List[Project]:
         pass
+
+    @abstractmethod
+    def iterate(self, owner_id: UserId, chunk_size: int = 500) -> Iterator[Project]:
+        pass
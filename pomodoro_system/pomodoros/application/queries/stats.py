@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from typing import List
+
+from foundation.value_objects import UserId
+
+
+class StatsGranularity(Enum):
+    DAY = 0
+    WEEK = 1
+    MONTH = 2
+
+
+@dataclass
+class QueryStatsDto:
+    period_start: date
+    completed_pomodoros: int
+    focus_seconds: int
+    pause_seconds: int
+
+
+class GetPomodoroStats(ABC):
+    @abstractmethod
+    def query(
+        self, owner_id: UserId, date_from: date, date_to: date, granularity: StatsGranularity
+    ) -> List[QueryStatsDto]:
+        pass
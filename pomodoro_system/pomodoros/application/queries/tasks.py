@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Union
+from datetime import datetime
+from typing import Iterator, List, Union
 
 from foundation.value_objects import UserId
 from pomodoros.domain.entities import Task
@@ -9,6 +10,8 @@ from pomodoros.domain.value_objects import ProjectId, TaskId, TaskStatus
 
 @dataclass
 class QueryTaskDto:
+    __slots__ = ("id", "name", "status", "project_id")
+
     id: TaskId
     name: str
     status: TaskStatus
@@ -19,13 +22,37 @@ class QueryTaskDto:
         return self.status == TaskStatus.ACTIVE
 
 
+@dataclass
+class QueryTaskReminderDto:
+    task_id: TaskId
+    task_name: str
+    reminder_date: datetime
+    owner_email: str
+
+
 class GetTaskListByOwnerId(ABC):
     @abstractmethod
     def query(self, owner_id: UserId, return_full_entity: bool = False, **kwargs) -> List[Union[QueryTaskDto, Task]]:
         pass
 
+    @abstractmethod
+    def iterate(self, owner_id: UserId, chunk_size: int = 500, **kwargs) -> Iterator[Task]:
+        pass
+
+
+class SearchTasksByOwnerId(ABC):
+    @abstractmethod
+    def query(self, owner_id: UserId, phrase: str) -> List[Task]:
+        pass
+
 
 class GetRecentTasksByProjectId(ABC):
     @abstractmethod
     def query(self, project_id: ProjectId, return_full_entity: bool = False) -> List[QueryTaskDto]:
         pass
+
+
+class ClaimDueTaskReminders(ABC):
+    @abstractmethod
+    def query(self, now: datetime, limit: int) -> List[QueryTaskReminderDto]:
+        pass
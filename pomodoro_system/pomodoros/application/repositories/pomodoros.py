@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
 
+from foundation.value_objects import UserId
 from pomodoros.domain.entities.pomodoro import Pomodoro
 from pomodoros.domain.value_objects import PomodoroId
 
@@ -9,6 +11,14 @@ class PomodoroRepository(ABC):
     def get(self, pomodoro_id: PomodoroId) -> Pomodoro:
         pass
 
+    @abstractmethod
+    def get_with_owner_id(self, pomodoro_id: PomodoroId, for_update: bool = False) -> Tuple[Pomodoro, Optional[UserId]]:
+        pass
+
+    @abstractmethod
+    def get_many(self, pomodoro_ids: Iterable[PomodoroId]) -> List[Pomodoro]:
+        pass
+
     @abstractmethod
     def save(self, pomodoro: Pomodoro, create: bool = False) -> None:
         pass
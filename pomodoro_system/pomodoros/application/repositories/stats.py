@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from foundation.value_objects import UserId
+from pomodoros.domain.entities.pomodoro import Pomodoro
+from pomodoros.domain.value_objects import ProjectId
+
+
+class StatsRepository(ABC):
+    @abstractmethod
+    def record_finished_pomodoro(self, owner_id: UserId, project_id: ProjectId, pomodoro: Pomodoro) -> None:
+        pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
 
+from foundation.value_objects import UserId
 from pomodoros.domain.entities import Task
 from pomodoros.domain.value_objects import TaskId
 
@@ -9,6 +11,14 @@ class TaskRepository(ABC):
     def get(self, task_id: TaskId) -> Task:
         pass
 
+    @abstractmethod
+    def get_with_owner_id(self, task_id: TaskId, for_update: bool = False) -> Tuple[Task, Optional[UserId]]:
+        pass
+
+    @abstractmethod
+    def get_many(self, task_ids: Iterable[TaskId]) -> List[Task]:
+        pass
+
     @abstractmethod
     def save(self, task: Task, create: bool = False) -> None:
         pass
@@ -16,3 +26,7 @@ class TaskRepository(ABC):
     @abstractmethod
     def delete(self, task_id: TaskId) -> None:
         pass
+
+    @abstractmethod
+    def increment_pomodoros_burn_down(self, task_id: TaskId) -> None:
+        pass
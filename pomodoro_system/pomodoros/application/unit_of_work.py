@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from pomodoros.application.repositories.pomodoros import PomodoroRepository
+from pomodoros.application.repositories.tasks import TaskRepository
+
+
+class UnitOfWork(ABC):
+    pomodoros: PomodoroRepository
+    tasks: TaskRepository
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        pass
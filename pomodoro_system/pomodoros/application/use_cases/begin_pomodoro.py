@@ -4,10 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from foundation.value_objects import T
+from foundation.application.repositories.user import UserRepository
+from foundation.value_objects import DateFrameDefinition, T, UserId
 from pomodoros.application.queries.pomodoros import GetRecentPomodoros
-from pomodoros.application.repositories.pomodoros import PomodoroRepository
-from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.application.unit_of_work import UnitOfWork
+from pomodoros.domain.entities import Task
 from pomodoros.domain.entities.pomodoro import Pomodoro
 from pomodoros.domain.value_objects import FrameType, PomodoroId, TaskId
 
@@ -16,6 +17,7 @@ from pomodoros.domain.value_objects import FrameType, PomodoroId, TaskId
 class BeginPomodoroInputDto:
     task_id: TaskId
     start_date: datetime
+    owner_id: UserId
 
 
 @dataclass
@@ -37,27 +39,36 @@ class BeginPomodoro:
     def __init__(
         self,
         output_boundary: BeginPomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
+        user_repository: UserRepository,
         recent_pomodoros_query: GetRecentPomodoros,
     ) -> None:
         self.output_boundary = output_boundary
-        self.pomodoros_repository = pomodoros_repository
-        self.tasks_repository = tasks_repository
+        self.unit_of_work = unit_of_work
+        self.user_repository = user_repository
         self.recent_pomodoros_query = recent_pomodoros_query
 
+    def _get_date_frame_definition(self, task: Task, user_id: UserId) -> DateFrameDefinition:
+        if task.date_frame_definition is not None and task.date_frame_definition.pomodoro_length is not None:
+            return task.date_frame_definition
+
+        task_owner = self.user_repository.get(user_id=user_id)
+        return task_owner.date_frame_definition
+
     @staticmethod
     def _produce_pomodoro(task_id: TaskId) -> Pomodoro:
         return Pomodoro(id=uuid.uuid4(), task_id=task_id)
 
     def execute(self, input_dto: BeginPomodoroInputDto) -> None:
-        task = self.tasks_repository.get(input_dto.task_id)
-        recent_pomodoros = self.recent_pomodoros_query.query(input_dto.task_id)
+        with self.unit_of_work as unit_of_work:
+            task = unit_of_work.tasks.get(input_dto.task_id)
+            recent_pomodoros = self.recent_pomodoros_query.query_index(input_dto.owner_id)
 
-        new_pomodoro = self._produce_pomodoro(task.id)
-        new_pomodoro.begin(task, recent_pomodoros, input_dto.start_date)
+            new_pomodoro = self._produce_pomodoro(task.id)
+            new_pomodoro.begin(task, recent_pomodoros, input_dto.start_date)
+            new_pomodoro.schedule_due_date(self._get_date_frame_definition(task, input_dto.owner_id))
 
-        self.pomodoros_repository.save(new_pomodoro, create=True)
+            unit_of_work.pomodoros.save(new_pomodoro, create=True)
 
         output_dto = BeginPomodoroOutputDto(new_pomodoro.id, new_pomodoro.start_date, new_pomodoro.frame_type)
         self.output_boundary.present(output_dto)
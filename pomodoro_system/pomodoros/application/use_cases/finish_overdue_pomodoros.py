@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from foundation.application.repositories.user import UserRepository
+from foundation.exceptions import DomainValidationError
+from foundation.value_objects import DateFrameDefinition, T, UserId
+from pomodoros.application.queries.pomodoros import GetOverduePomodoros, GetRecentPomodoros
+from pomodoros.application.repositories.pomodoros import PomodoroRepository
+from pomodoros.application.repositories.stats import StatsRepository
+from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.domain.date_frame_index import DateFrameIndex
+from pomodoros.domain.entities import Task
+from pomodoros.domain.value_objects import PomodoroId
+
+
+@dataclass
+class FinishOverduePomodorosInputDto:
+    now: datetime
+    limit: int = 500
+
+
+@dataclass
+class FinishOverduePomodorosOutputDto:
+    finished_pomodoro_ids: List[PomodoroId]
+
+
+class FinishOverduePomodorosOutputBoundary(ABC):
+    response: Optional[T]
+
+    @abstractmethod
+    def present(self, output_dto: FinishOverduePomodorosOutputDto) -> None:
+        pass
+
+
+class FinishOverduePomodoros:
+    def __init__(
+        self,
+        output_boundary: FinishOverduePomodorosOutputBoundary,
+        pomodoros_repository: PomodoroRepository,
+        tasks_repository: TaskRepository,
+        users_repository: UserRepository,
+        overdue_pomodoros_query: GetOverduePomodoros,
+        recent_pomodoros_query: GetRecentPomodoros,
+        stats_repository: StatsRepository,
+    ) -> None:
+        self.output_boundary = output_boundary
+        self.pomodoros_repository = pomodoros_repository
+        self.tasks_repository = tasks_repository
+        self.users_repository = users_repository
+        self.overdue_pomodoros_query = overdue_pomodoros_query
+        self.recent_pomodoros_query = recent_pomodoros_query
+        self.stats_repository = stats_repository
+
+    def _get_date_frame_definition(
+        self, task: Task, user_id: UserId, owners_date_frame_definitions: Dict[UserId, DateFrameDefinition]
+    ) -> DateFrameDefinition:
+        if task.date_frame_definition is not None and task.date_frame_definition.pomodoro_length is not None:
+            return task.date_frame_definition
+
+        if user_id not in owners_date_frame_definitions:
+            task_owner = self.users_repository.get(user_id=user_id)
+            owners_date_frame_definitions[user_id] = task_owner.date_frame_definition
+        return owners_date_frame_definitions[user_id]
+
+    def _get_recent_pomodoros(
+        self, user_id: UserId, owners_recent_pomodoros: Dict[UserId, DateFrameIndex]
+    ) -> DateFrameIndex:
+        if user_id not in owners_recent_pomodoros:
+            owners_recent_pomodoros[user_id] = self.recent_pomodoros_query.query_index(user_id)
+        return owners_recent_pomodoros[user_id]
+
+    def execute(self, input_dto: FinishOverduePomodorosInputDto) -> None:
+        owner_ids = {
+            overdue_pomodoro.id: overdue_pomodoro.owner_id
+            for overdue_pomodoro in self.overdue_pomodoros_query.query(input_dto.now, input_dto.limit)
+        }
+        pomodoros = self.pomodoros_repository.get_many(owner_ids.keys())
+        tasks = {task.id: task for task in self.tasks_repository.get_many({pomodoro.task_id for pomodoro in pomodoros})}
+
+        owners_date_frame_definitions: Dict[UserId, DateFrameDefinition] = {}
+        owners_recent_pomodoros: Dict[UserId, DateFrameIndex] = {}
+        finished_pomodoro_ids = []
+
+        for pomodoro in pomodoros:
+            owner_id = owner_ids[pomodoro.id]
+            task = tasks[pomodoro.task_id]
+            date_frame_definition = self._get_date_frame_definition(task, owner_id, owners_date_frame_definitions)
+            due_date = pomodoro.get_due_date(date_frame_definition)
+
+            if due_date is None or due_date > input_dto.now:
+                # The stored due date went stale, e.g. after the pomodoro length was changed.
+                pomodoro.due_date = due_date
+                self.pomodoros_repository.save(pomodoro)
+                continue
+
+            recent_pomodoros = self._get_recent_pomodoros(owner_id, owners_recent_pomodoros)
+            try:
+                pomodoro.finish(date_frame_definition, task, recent_pomodoros, due_date)
+            except DomainValidationError:
+                # Drop the pomodoro from the sweep so that it does not keep taking up the batch.
+                pomodoro.due_date = None
+                self.pomodoros_repository.save(pomodoro)
+                continue
+
+            recent_pomodoros.add(pomodoro)
+            self.pomodoros_repository.save(pomodoro)
+            self.tasks_repository.increment_pomodoros_burn_down(task.id)
+            self.stats_repository.record_finished_pomodoro(owner_id, task.project_id, pomodoro)
+            finished_pomodoro_ids.append(pomodoro.id)
+
+        self.output_boundary.present(FinishOverduePomodorosOutputDto(finished_pomodoro_ids))
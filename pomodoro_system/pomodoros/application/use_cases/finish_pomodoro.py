@@ -6,8 +6,8 @@ from typing import Optional
 from foundation.application.repositories.user import UserRepository
 from foundation.value_objects import DateFrameDefinition, T, UserId
 from pomodoros.application.queries.pomodoros import GetRecentPomodoros
-from pomodoros.application.repositories.pomodoros import PomodoroRepository
-from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.application.repositories.stats import StatsRepository
+from pomodoros.application.unit_of_work import UnitOfWork
 from pomodoros.domain.entities import Task
 from pomodoros.domain.value_objects import FrameType, PomodoroId
 
@@ -39,16 +39,16 @@ class FinishPomodoro:
     def __init__(
         self,
         output_boundary: FinishPomodoroOutputBoundary,
-        pomodoro_repository: PomodoroRepository,
-        task_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
         user_repository: UserRepository,
         recent_pomodoros_query: GetRecentPomodoros,
+        stats_repository: StatsRepository,
     ) -> None:
         self.output_boundary = output_boundary
-        self.pomodoro_repository = pomodoro_repository
-        self.task_repository = task_repository
+        self.unit_of_work = unit_of_work
         self.user_repository = user_repository
         self.recent_pomodoros_query = recent_pomodoros_query
+        self.stats_repository = stats_repository
 
     def _get_date_frame_definition(self, task: Task, user_id: UserId) -> DateFrameDefinition:
         if task.date_frame_definition is not None:
@@ -58,13 +58,16 @@ class FinishPomodoro:
         return task_owner.date_frame_definition
 
     def execute(self, input_dto: FinishPomodoroInputDto) -> None:
-        pomodoro = self.pomodoro_repository.get(input_dto.id)
-        task = self.task_repository.get(pomodoro.task_id)
-        date_frame_definition = self._get_date_frame_definition(task, input_dto.owner_id)
-        recent_pomodoros = self.recent_pomodoros_query.query(task.id)
+        with self.unit_of_work as unit_of_work:
+            pomodoro = unit_of_work.pomodoros.get(input_dto.id)
+            task = unit_of_work.tasks.get(pomodoro.task_id)
+            date_frame_definition = self._get_date_frame_definition(task, input_dto.owner_id)
+            recent_pomodoros = self.recent_pomodoros_query.query_index(input_dto.owner_id)
 
-        pomodoro.finish(date_frame_definition, task, recent_pomodoros, input_dto.end_date)
-        self.pomodoro_repository.save(pomodoro)
+            pomodoro.finish(date_frame_definition, task, recent_pomodoros, input_dto.end_date)
+            unit_of_work.pomodoros.save(pomodoro)
+            unit_of_work.tasks.increment_pomodoros_burn_down(task.id)
+            self.stats_repository.record_finished_pomodoro(input_dto.owner_id, task.project_id, pomodoro)
 
         output_dto = FinishPomodoroOutputDto(pomodoro.id, pomodoro.start_date, pomodoro.end_date, pomodoro.frame_type)
         self.output_boundary.present(output_dto)
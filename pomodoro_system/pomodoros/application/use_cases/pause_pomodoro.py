@@ -4,8 +4,7 @@ from datetime import datetime
 from typing import Optional
 
 from foundation.value_objects import T
-from pomodoros.application.repositories.pomodoros import PomodoroRepository
-from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.application.unit_of_work import UnitOfWork
 from pomodoros.domain.value_objects import PomodoroId
 
 
@@ -33,19 +32,18 @@ class PausePomodoro:
     def __init__(
         self,
         output_boundary: PausePomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.output_boundary = output_boundary
-        self.pomodoros_repository = pomodoros_repository
-        self.tasks_repository = tasks_repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, input_dto: PausePomodoroInputDto) -> None:
-        pomodoro = self.pomodoros_repository.get(input_dto.pomodoro_id)
-        task = self.tasks_repository.get(pomodoro.task_id)
+        with self.unit_of_work as unit_of_work:
+            pomodoro = unit_of_work.pomodoros.get(input_dto.pomodoro_id)
+            task = unit_of_work.tasks.get(pomodoro.task_id)
 
-        pomodoro.pause(task, input_dto.pause_date)
-        self.pomodoros_repository.save(pomodoro)
+            pomodoro.pause(task, input_dto.pause_date)
+            unit_of_work.pomodoros.save(pomodoro)
 
         output_dto = PausePomodoroOutputDto(pomodoro.id, input_dto.pause_date)
         self.output_boundary.present(output_dto)
@@ -4,7 +4,7 @@ from typing import Optional
 
 from foundation.value_objects import T
 from pomodoros.application.queries.tasks import GetRecentTasksByProjectId
-from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.application.unit_of_work import UnitOfWork
 from pomodoros.domain.value_objects import ProjectId, TaskId
 
 
@@ -32,19 +32,20 @@ class PinTaskToProject:
     def __init__(
         self,
         output_boundary: PinTaskToProjectOutputBoundary,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
         get_recent_tasks_by_pomodoro_id_query: GetRecentTasksByProjectId,
     ) -> None:
         self.output_boundary = output_boundary
-        self.tasks_repository = tasks_repository
+        self.unit_of_work = unit_of_work
         self.get_recent_tasks_by_pomodoro_id_query = get_recent_tasks_by_pomodoro_id_query
 
     def execute(self, input_dto: PinTaskToProjectInputDto) -> None:
-        task = self.tasks_repository.get(input_dto.id)
-        new_project_tasks = self.get_recent_tasks_by_pomodoro_id_query.query(input_dto.new_project_id)
+        with self.unit_of_work as unit_of_work:
+            task = unit_of_work.tasks.get(input_dto.id)
+            new_project_tasks = self.get_recent_tasks_by_pomodoro_id_query.query(input_dto.new_project_id)
 
-        task.pin_to_new_project(input_dto.new_project_id, new_project_tasks)
-        self.tasks_repository.save(task)
+            task.pin_to_new_project(input_dto.new_project_id, new_project_tasks)
+            unit_of_work.tasks.save(task)
 
         output_dto = PinTaskToProjectOutputDto(input_dto.id, input_dto.new_project_id)
         self.output_boundary.present(output_dto)
@@ -3,9 +3,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from foundation.value_objects import T
-from pomodoros.application.repositories.pomodoros import PomodoroRepository
-from pomodoros.application.repositories.tasks import TaskRepository
+from foundation.application.repositories.user import UserRepository
+from foundation.value_objects import DateFrameDefinition, T, UserId
+from pomodoros.application.unit_of_work import UnitOfWork
+from pomodoros.domain.entities import Task
 from pomodoros.domain.value_objects import PomodoroId
 
 
@@ -13,6 +14,7 @@ from pomodoros.domain.value_objects import PomodoroId
 class ResumePomodoroInputDto:
     pomodoro_id: PomodoroId
     resume_date: datetime
+    owner_id: UserId
 
 
 @dataclass
@@ -33,19 +35,28 @@ class ResumePomodoro:
     def __init__(
         self,
         output_boundary: ResumePomodoroOutputBoundary,
-        pomodoros_repository: PomodoroRepository,
-        tasks_repository: TaskRepository,
+        unit_of_work: UnitOfWork,
+        user_repository: UserRepository,
     ) -> None:
         self.output_boundary = output_boundary
-        self.pomodoros_repository = pomodoros_repository
-        self.tasks_repository = tasks_repository
+        self.unit_of_work = unit_of_work
+        self.user_repository = user_repository
+
+    def _get_date_frame_definition(self, task: Task, user_id: UserId) -> DateFrameDefinition:
+        if task.date_frame_definition is not None and task.date_frame_definition.pomodoro_length is not None:
+            return task.date_frame_definition
+
+        task_owner = self.user_repository.get(user_id=user_id)
+        return task_owner.date_frame_definition
 
     def execute(self, input_dto: ResumePomodoroInputDto) -> None:
-        pomodoro = self.pomodoros_repository.get(input_dto.pomodoro_id)
-        task = self.tasks_repository.get(pomodoro.task_id)
+        with self.unit_of_work as unit_of_work:
+            pomodoro = unit_of_work.pomodoros.get(input_dto.pomodoro_id)
+            task = unit_of_work.tasks.get(pomodoro.task_id)
 
-        pomodoro.resume(task, input_dto.resume_date)
-        self.pomodoros_repository.save(pomodoro)
+            pomodoro.resume(task, input_dto.resume_date)
+            pomodoro.schedule_due_date(self._get_date_frame_definition(task, input_dto.owner_id))
+            unit_of_work.pomodoros.save(pomodoro)
 
         output_dto = ResumePomodoroOutputDto(pomodoro.id, input_dto.resume_date)
         self.output_boundary.present(output_dto)
@@ -0,0 +1,152 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from foundation.application.repositories.user import UserRepository
+from foundation.exceptions import AlreadyExists, DomainValidationError, NotFound, RepositoryError
+from foundation.i18n import N_
+from foundation.value_objects import DateFrameDefinition, T, UserId
+from pomodoros.application.queries.pomodoros import GetRecentPomodoros
+from pomodoros.application.repositories.pomodoros import PomodoroRepository
+from pomodoros.application.repositories.stats import StatsRepository
+from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.domain.entities import Task
+from pomodoros.domain.entities.pomodoro import Pomodoro
+from pomodoros.domain.value_objects import PomodoroEventType, PomodoroId, TaskId
+
+
+@dataclass
+class PomodoroEventDto:
+    type: PomodoroEventType
+    pomodoro_id: PomodoroId
+    date: datetime
+    task_id: Optional[TaskId] = None
+
+
+@dataclass
+class SyncPomodorosInputDto:
+    owner_id: UserId
+    events: List[PomodoroEventDto]
+
+
+@dataclass
+class PomodoroEventResultDto:
+    pomodoro_id: PomodoroId
+    type: PomodoroEventType
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def is_applied(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class SyncPomodorosOutputDto:
+    results: List[PomodoroEventResultDto]
+
+
+class SyncPomodorosOutputBoundary(ABC):
+    response: Optional[T]
+
+    @abstractmethod
+    def present(self, output_dto: SyncPomodorosOutputDto) -> None:
+        pass
+
+
+class SyncPomodoros:
+    def __init__(
+        self,
+        output_boundary: SyncPomodorosOutputBoundary,
+        pomodoros_repository: PomodoroRepository,
+        tasks_repository: TaskRepository,
+        users_repository: UserRepository,
+        recent_pomodoros_query: GetRecentPomodoros,
+        stats_repository: StatsRepository,
+    ) -> None:
+        self.output_boundary = output_boundary
+        self.pomodoros_repository = pomodoros_repository
+        self.tasks_repository = tasks_repository
+        self.users_repository = users_repository
+        self.recent_pomodoros_query = recent_pomodoros_query
+        self.stats_repository = stats_repository
+
+    def _get_date_frame_definition(self, task: Task, user_id: UserId) -> DateFrameDefinition:
+        if task.date_frame_definition is not None and task.date_frame_definition.pomodoro_length is not None:
+            return task.date_frame_definition
+
+        task_owner = self.users_repository.get(user_id=user_id)
+        return task_owner.date_frame_definition
+
+    @staticmethod
+    def _get_pomodoro(pomodoros: Dict[PomodoroId, Pomodoro], pomodoro_id: PomodoroId) -> Pomodoro:
+        try:
+            return pomodoros[pomodoro_id]
+        except KeyError:
+            raise NotFound(N_("Pomodoro does not exist."))
+
+    @staticmethod
+    def _get_task(tasks: Dict[TaskId, Task], task_id: TaskId) -> Task:
+        try:
+            return tasks[task_id]
+        except KeyError:
+            raise NotFound(N_("Task does not exist."))
+
+    def execute(self, input_dto: SyncPomodorosInputDto) -> None:
+        events = input_dto.events
+        pomodoros = {
+            pomodoro.id: pomodoro
+            for pomodoro in self.pomodoros_repository.get_many({event.pomodoro_id for event in events})
+        }
+        task_ids = {event.task_id for event in events if event.type == PomodoroEventType.BEGIN}
+        task_ids.update(pomodoro.task_id for pomodoro in pomodoros.values())
+        tasks = {task.id: task for task in self.tasks_repository.get_many(task_ids)}
+        recent_pomodoros = self.recent_pomodoros_query.query_index(input_dto.owner_id)
+
+        new_pomodoro_ids = set()
+        modified_pomodoros: Dict[PomodoroId, Pomodoro] = {}
+        finished_pomodoros: List[Pomodoro] = []
+        results = []
+
+        for event in events:
+            try:
+                if event.type == PomodoroEventType.BEGIN:
+                    if event.pomodoro_id in pomodoros:
+                        raise AlreadyExists(N_("Pomodoro already exists."))
+
+                    task = self._get_task(tasks, event.task_id)
+                    pomodoro = Pomodoro(id=event.pomodoro_id, task_id=task.id)
+                    pomodoro.begin(task, recent_pomodoros, event.date)
+                    pomodoro.schedule_due_date(self._get_date_frame_definition(task, input_dto.owner_id))
+                    pomodoros[pomodoro.id] = pomodoro
+                    new_pomodoro_ids.add(pomodoro.id)
+                else:
+                    pomodoro = self._get_pomodoro(pomodoros, event.pomodoro_id)
+                    task = self._get_task(tasks, pomodoro.task_id)
+
+                    if event.type == PomodoroEventType.PAUSE:
+                        pomodoro.pause(task, event.date)
+                    elif event.type == PomodoroEventType.RESUME:
+                        pomodoro.resume(task, event.date)
+                        pomodoro.schedule_due_date(self._get_date_frame_definition(task, input_dto.owner_id))
+                    else:
+                        date_frame_definition = self._get_date_frame_definition(task, input_dto.owner_id)
+                        pomodoro.finish(date_frame_definition, task, recent_pomodoros, event.date)
+                        recent_pomodoros.add(pomodoro)
+                        finished_pomodoros.append(pomodoro)
+            except (DomainValidationError, RepositoryError) as error:
+                results.append(PomodoroEventResultDto(event.pomodoro_id, event.type, list(map(str, error.messages))))
+            else:
+                modified_pomodoros[pomodoro.id] = pomodoro
+                results.append(PomodoroEventResultDto(event.pomodoro_id, event.type))
+
+        for pomodoro in modified_pomodoros.values():
+            self.pomodoros_repository.save(pomodoro, create=pomodoro.id in new_pomodoro_ids)
+
+        for pomodoro in finished_pomodoros:
+            self.tasks_repository.increment_pomodoros_burn_down(pomodoro.task_id)
+            self.stats_repository.record_finished_pomodoro(
+                input_dto.owner_id, tasks[pomodoro.task_id].project_id, pomodoro
+            )
+
+        self.output_boundary.present(SyncPomodorosOutputDto(results))
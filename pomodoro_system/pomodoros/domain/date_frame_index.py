@@ -0,0 +1,54 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple
+
+from pomodoros.domain.entities import DateFrame
+
+
+class DateFrameIndex:
+    def __init__(self, date_frames: Optional[Iterable[DateFrame]] = None) -> None:
+        finished_date_frames = sorted(
+            filter(lambda date_frame: date_frame.is_finished, date_frames or []),
+            key=lambda date_frame: date_frame.start_date,
+        )
+        self._start_dates: List[datetime] = [date_frame.start_date for date_frame in finished_date_frames]
+        self._end_dates: List[datetime] = [date_frame.end_date for date_frame in finished_date_frames]
+        self._max_end_dates: List[datetime] = list(accumulate(self._end_dates, max))
+
+    @classmethod
+    def from_date_ranges(cls, date_ranges: Iterable[Tuple[datetime, datetime]]) -> "DateFrameIndex":
+        date_frame_index = cls()
+        sorted_date_ranges = sorted(date_ranges, key=lambda date_range: date_range[0])
+        date_frame_index._start_dates = [start_date for start_date, _end_date in sorted_date_ranges]
+        date_frame_index._end_dates = [end_date for _start_date, end_date in sorted_date_ranges]
+        date_frame_index._max_end_dates = list(accumulate(date_frame_index._end_dates, max))
+        return date_frame_index
+
+    def __len__(self) -> int:
+        return len(self._start_dates)
+
+    def add(self, date_frame: DateFrame) -> None:
+        if not date_frame.is_finished:
+            return
+
+        position = bisect_right(self._start_dates, date_frame.start_date)
+        self._start_dates.insert(position, date_frame.start_date)
+        self._end_dates.insert(position, date_frame.end_date)
+
+        preceding_max_end_date = self._max_end_dates[position - 1] if position else date_frame.end_date
+        self._max_end_dates[position:] = list(
+            accumulate(self._end_dates[position:], max, initial=preceding_max_end_date)
+        )[1:]
+
+    def overlaps(self, start_date: datetime, end_date: Optional[datetime] = None) -> bool:
+        # Frames starting before the checked end date are the only candidates, and since the running maximum
+        # of their end dates is kept alongside, a single bisection tells whether any of them reaches past start_date.
+        if end_date is None:
+            candidates_count = len(self._start_dates)
+        else:
+            candidates_count = bisect_left(self._start_dates, end_date)
+
+        if not candidates_count:
+            return False
+        return self._max_end_dates[candidates_count - 1] > start_date
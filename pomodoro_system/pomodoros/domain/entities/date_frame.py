@@ -15,14 +15,7 @@ class DateFrame:
 
     @property
     def is_finished(self) -> bool:
-        return all(
-            [
-                self.start_date,
-                self.start_date is not None,
-                self.end_date,
-                self.end_date is not None,
-            ]
-        )
+        return self.start_date is not None and self.end_date is not None
 
     def run_begin_date_frame_validations(self, start_date: datetime) -> None:
         pass
@@ -32,14 +25,7 @@ class DateFrame:
         self._check_start_date_greater_than_end_date(start_date=self.start_date, end_date=end_date)
 
     def _check_date_frame_is_already_finished(self) -> None:
-        if all(
-            [
-                self.start_date,
-                self.start_date is not None,
-                self.end_date,
-                self.end_date is not None,
-            ]
-        ):
+        if self.is_finished:
             raise DateFrameIsAlreadyFinished(N_("Date frame is already finished."))
 
     @staticmethod
@@ -1,11 +1,10 @@
-import operator
 import uuid
 from datetime import datetime, timedelta
-from functools import reduce
 from typing import List, Optional, Union
 
 from foundation.i18n import N_
 from foundation.value_objects import DateFrameDefinition, UserDateFrameDefinition
+from pomodoros.domain.date_frame_index import DateFrameIndex
 from pomodoros.domain.entities import DateFrame, Task
 from pomodoros.domain.entities.pause import Pause
 from pomodoros.domain.exceptions import (
@@ -13,7 +12,15 @@ from pomodoros.domain.exceptions import (
     NoActionAllowedOnFinishedPomodoro,
     PomodoroErrorMarginExceeded,
 )
-from pomodoros.domain.value_objects import AcceptablePomodoroErrorMargin, FrameType, PomodoroId, TaskId
+from pomodoros.domain.value_objects import (
+    AcceptablePomodoroErrorMargin,
+    FrameType,
+    PomodoroEvent,
+    PomodoroEventType,
+    PomodoroId,
+    PomodoroState,
+    TaskId,
+)
 
 
 class Pomodoro(DateFrame):
@@ -26,39 +33,71 @@ class Pomodoro(DateFrame):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         contained_pauses: Optional[List[Pause]] = None,
+        state: Optional[PomodoroState] = None,
+        paused_duration: Optional[timedelta] = None,
+        due_date: Optional[datetime] = None,
     ) -> None:
         super().__init__(start_date=start_date, end_date=end_date)
         self.id = id
         self.task_id = task_id
         self.contained_pauses = (
-            sorted(contained_pauses, key=lambda pause: pause.end_date) if contained_pauses is not None else []
+            sorted(contained_pauses, key=lambda pause: pause.start_date) if contained_pauses is not None else []
         )
+        self.state = state if state is not None else self._resolve_state()
+        self.paused_duration = paused_duration if paused_duration is not None else self._resolve_paused_duration()
+        self.due_date = due_date
         self.modified_pauses: List[Pause] = []
-        self.new_pause = None
+        self.new_pauses: List[Pause] = []
+        self.new_events: List[PomodoroEvent] = []
+
+    def _resolve_state(self) -> Optional[PomodoroState]:
+        if self.start_date is None:
+            return None
+        elif self.end_date is not None:
+            return PomodoroState.FINISHED
+        elif self.contained_pauses and not self.contained_pauses[-1].is_finished:
+            return PomodoroState.PAUSED
+        return PomodoroState.RUNNING
+
+    def _resolve_paused_duration(self) -> timedelta:
+        finished_pauses = filter(lambda pause: pause.is_finished, self.contained_pauses)
+        return sum((pause.end_date - pause.start_date for pause in finished_pauses), timedelta(0))
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state is PomodoroState.FINISHED
+
+    @property
+    def new_pause(self) -> Optional[Pause]:
+        if self.new_pauses:
+            return self.new_pauses[-1]
 
     @property
     def current_pause(self) -> Optional[Pause]:
-        ongoing_pauses = list(filter(lambda pause: not pause.is_finished, self.contained_pauses))
-        if len(ongoing_pauses):
-            return ongoing_pauses[-1]
+        if self.state is PomodoroState.PAUSED and self.contained_pauses:
+            return self.contained_pauses[-1]
 
     @staticmethod
     def _get_maximal_duration(date_frame_definition: Union[DateFrameDefinition, UserDateFrameDefinition]) -> timedelta:
         return date_frame_definition.pomodoro_length
 
+    def get_due_date(self, date_frame_definition: DateFrameDefinition) -> Optional[datetime]:
+        if self.state is PomodoroState.RUNNING:
+            return self.start_date + self.paused_duration + self._get_maximal_duration(date_frame_definition)
+
+    def schedule_due_date(self, date_frame_definition: Optional[DateFrameDefinition]) -> None:
+        if date_frame_definition is None or date_frame_definition.pomodoro_length is None:
+            self.due_date = None
+        else:
+            self.due_date = self.get_due_date(date_frame_definition)
+
     def _check_can_perform_actions(self) -> None:
         if self.is_finished:
             raise NoActionAllowedOnFinishedPomodoro(N_("No action is allowed on finished pomodoro."))
 
     def _check_pomodoro_length(self, maximal_duration: timedelta, checked_end_date: datetime) -> None:
         pomodoro_duration = checked_end_date - self.start_date
-        pauses_duration = reduce(
-            operator.add,
-            (pause.end_date - pause.end_date for pause in self.contained_pauses),
-            timedelta(0),
-        )
-
-        total_duration = pomodoro_duration - pauses_duration
+        total_duration = pomodoro_duration - self.paused_duration
         duration_difference = total_duration - maximal_duration
 
         if duration_difference > AcceptablePomodoroErrorMargin:
@@ -66,65 +105,28 @@ class Pomodoro(DateFrame):
 
     @staticmethod
     def _check_for_colliding_pomodoros(
-        recent_pomodoros: Optional[List["Pomodoro"]],
-        start_date: datetime,
-        end_date: Optional[datetime] = None,
-    ):
-        def check_if_finished(date_frame: DateFrame) -> bool:
-            return all(
-                [
-                    date_frame.start_date,
-                    date_frame.start_date is not None,
-                    date_frame.end_date,
-                    date_frame.end_date is not None,
-                ]
-            )
-
-        def check_if_overlaps(pomodoro: Pomodoro, checked_date: datetime) -> bool:
-            return pomodoro.start_date > checked_date or pomodoro.end_date > checked_date
-
-        def validate_against_unfinished_pomodoro() -> List[Pomodoro]:
-            return list(
-                filter(
-                    lambda pomodoro: check_if_finished(pomodoro) and check_if_overlaps(pomodoro, start_date),
-                    recent_pomodoros,
-                )
-            )
-
-        def validate_against_finished_pomodoro() -> List[Pomodoro]:
-            return list(
-                filter(
-                    lambda pomodoro: check_if_finished(pomodoro)
-                    and (check_if_overlaps(pomodoro, start_date) or check_if_overlaps(pomodoro, end_date)),
-                    recent_pomodoros,
-                )
-            )
-
-        if end_date is None:
-            colliding_date_frames = validate_against_unfinished_pomodoro()
-        else:
-            colliding_date_frames = validate_against_finished_pomodoro()
-
-        if len(colliding_date_frames):
+        recent_pomodoros: DateFrameIndex, start_date: datetime, end_date: Optional[datetime] = None
+    ) -> None:
+        if recent_pomodoros.overlaps(start_date, end_date):
             raise CollidingPomodoroWasFound(N_("Colliding pomodoro was found."))
 
     def begin(
         self,
         related_task: Task,
-        recent_pomodoros: List["Pomodoro"],
+        recent_pomodoros: DateFrameIndex,
         start_date: datetime,
     ) -> None:
         related_task.check_can_perform_actions()
         super(Pomodoro, self).run_begin_date_frame_validations(start_date)
         self._check_for_colliding_pomodoros(recent_pomodoros, start_date)
 
-        self.start_date = start_date
+        self._record_event(PomodoroEvent(PomodoroEventType.BEGIN, start_date))
 
     def finish(
         self,
         date_frame_definition: DateFrameDefinition,
         related_task: Task,
-        recent_pomodoros: Optional[List["Pomodoro"]],
+        recent_pomodoros: DateFrameIndex,
         end_date: datetime,
     ) -> None:
         related_task.check_can_perform_actions()
@@ -133,7 +135,7 @@ class Pomodoro(DateFrame):
         self._check_pomodoro_length(maximal_duration, end_date)
         self._check_for_colliding_pomodoros(recent_pomodoros, self.start_date, end_date)
 
-        self.end_date = end_date
+        self._record_event(PomodoroEvent(PomodoroEventType.FINISH, end_date))
 
     @staticmethod
     def _produce_new_pause_object(start_date: datetime) -> Pause:
@@ -146,7 +148,9 @@ class Pomodoro(DateFrame):
         self._check_can_perform_actions()
 
         if self.current_pause is None:
-            self.new_pause = self._produce_new_pause_object(start_date)
+            new_pause = self._produce_new_pause_object(start_date)
+            self._record_event(PomodoroEvent(PomodoroEventType.PAUSE, start_date, new_pause.id))
+            self.new_pauses.append(self.current_pause)
 
     def resume(self, related_task: Task, end_date: datetime):
         related_task.check_can_perform_actions()
@@ -154,8 +158,31 @@ class Pomodoro(DateFrame):
         pause_to_finish = self.current_pause
         if pause_to_finish is not None:
             pause_to_finish.run_finish_date_frame_validations(end_date)
-            pause_to_finish.end_date = end_date
-            self.modified_pauses.append(pause_to_finish)
+            self._record_event(PomodoroEvent(PomodoroEventType.RESUME, end_date, pause_to_finish.id))
+            if not any(new_pause is pause_to_finish for new_pause in self.new_pauses):
+                self.modified_pauses.append(pause_to_finish)
+
+    def _record_event(self, event: PomodoroEvent) -> None:
+        self.apply_event(event)
+        self.new_events.append(event)
+
+    def apply_event(self, event: PomodoroEvent) -> None:
+        if event.type == PomodoroEventType.BEGIN:
+            self.start_date = event.date
+            self.state = PomodoroState.RUNNING
+        elif event.type == PomodoroEventType.PAUSE:
+            self.contained_pauses.append(Pause(id=event.pause_id, start_date=event.date))
+            self.state = PomodoroState.PAUSED
+            self.due_date = None
+        elif event.type == PomodoroEventType.RESUME:
+            finished_pause = self.current_pause
+            finished_pause.end_date = event.date
+            self.paused_duration += event.date - finished_pause.start_date
+            self.state = PomodoroState.RUNNING
+        elif event.type == PomodoroEventType.FINISH:
+            self.end_date = event.date
+            self.state = PomodoroState.FINISHED
+            self.due_date = None
 
     def __eq__(self, other) -> bool:
         return [
@@ -33,8 +33,9 @@ class Task:
     sub_tasks: Optional[List[SubTask]]
 
     @property
-    def next_due_date(self) -> datetime:
-        return self.due_date + self.renewal_interval
+    def next_due_date(self) -> Optional[datetime]:
+        if self.due_date is not None:
+            return self.due_date + self.renewal_interval
 
     @property
     def is_completed(self) -> bool:
@@ -1,6 +1,8 @@
 import uuid
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum
+from typing import Optional
 
 ProjectId = uuid.UUID
 TaskId = uuid.UUID
@@ -23,3 +25,23 @@ class TaskStatus(Enum):
 class FrameType(Enum):
     TYPE_POMODORO = 0
     TYPE_PAUSE = 1
+
+
+class PomodoroState(Enum):
+    RUNNING = 0
+    PAUSED = 1
+    FINISHED = 2
+
+
+class PomodoroEventType(Enum):
+    BEGIN = 0
+    PAUSE = 1
+    RESUME = 2
+    FINISH = 3
+
+
+@dataclass
+class PomodoroEvent:
+    type: PomodoroEventType
+    date: datetime
+    pause_id: Optional[PauseId] = None
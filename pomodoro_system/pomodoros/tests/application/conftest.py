@@ -5,23 +5,30 @@ import pytest
 from foundation.application.repositories.user import UserRepository
 from foundation.interfaces import AbstractUser
 from foundation.tests.factories import UserFactory
-from pomodoros.application.queries.pomodoros import GetRecentPomodoros
+from pomodoros.application.queries.pomodoros import GetOverduePomodoros, GetRecentPomodoros
 from pomodoros.application.queries.tasks import GetTaskListByOwnerId
 from pomodoros.application.repositories.pomodoros import PomodoroRepository
+from pomodoros.application.repositories.stats import StatsRepository
 from pomodoros.application.repositories.tasks import TaskRepository
 from pomodoros.application.use_cases.begin_pomodoro import BeginPomodoro, BeginPomodoroOutputBoundary
 from pomodoros.application.use_cases.complete_task import CompleteTask, CompleteTaskOutputBoundary
+from pomodoros.application.use_cases.finish_overdue_pomodoros import (
+    FinishOverduePomodoros,
+    FinishOverduePomodorosOutputBoundary,
+)
 from pomodoros.application.use_cases.finish_pomodoro import FinishPomodoro, FinishPomodoroOutputBoundary
 from pomodoros.application.use_cases.pause_pomodoro import PausePomodoro, PausePomodoroOutputBoundary
 from pomodoros.application.use_cases.pin_task_to_project import PinTaskToProject, PinTaskToProjectOutputBoundary
 from pomodoros.application.use_cases.reactivate_task import ReactivateTaskOutputBoundary
 from pomodoros.application.use_cases.resume_pomodoro import ResumePomodoro, ResumePomodoroOutputBoundary
+from pomodoros.application.use_cases.sync_pomodoros import SyncPomodoros, SyncPomodorosOutputBoundary
 from pomodoros.domain.entities import Task
 from pomodoros.domain.entities.pomodoro import Pomodoro
 from pomodoros.tests.application.get_recent_pomodoros_query import GetRecentPomodorosStub
 from pomodoros.tests.application.get_tasks_by_pomodoro_id_query import GetRecentTasksByProjectIdStub
 from pomodoros.tests.application.in_memory_pomodoros_repository import InMemoryPomodorosRepository
 from pomodoros.tests.application.in_memory_task_repository import InMemoryTaskRepository
+from pomodoros.tests.application.in_memory_unit_of_work import InMemoryUnitOfWork
 from pomodoros.tests.factories import PomodoroFactory
 
 
@@ -92,6 +99,13 @@ def recent_pomodoros_list(task: Task) -> List[Pomodoro]:
     return pomodoros
 
 
+@pytest.fixture()
+def populated_unit_of_work(
+    populated_pomodoros_repository: PomodoroRepository, populated_tasks_repository: TaskRepository
+) -> InMemoryUnitOfWork:
+    return InMemoryUnitOfWork(populated_pomodoros_repository, populated_tasks_repository)
+
+
 @pytest.fixture()
 def populated_recent_pomodoros_query(
     recent_pomodoros_list: List[Pomodoro],
@@ -104,12 +118,13 @@ def begin_pomodoro_use_case(
     begin_pomodoro_output_boundary,
     pomodoros_repository,
     populated_tasks_repository,
+    users_repository,
     populated_recent_pomodoros_query,
 ) -> BeginPomodoro:
     return BeginPomodoro(
         output_boundary=begin_pomodoro_output_boundary,
-        pomodoros_repository=pomodoros_repository,
-        tasks_repository=populated_tasks_repository,
+        unit_of_work=InMemoryUnitOfWork(pomodoros_repository, populated_tasks_repository),
+        user_repository=users_repository,
         recent_pomodoros_query=populated_recent_pomodoros_query,
     )
 
@@ -119,6 +134,11 @@ def users_repository(user: AbstractUser) -> Mock:
     return Mock(spec_set=UserRepository, get=Mock(return_value=user))
 
 
+@pytest.fixture()
+def stats_repository() -> Mock:
+    return Mock(spec_set=StatsRepository)
+
+
 @pytest.fixture()
 def finish_pomodoro_output_boundary() -> Mock:
     return Mock(spec_set=FinishPomodoroOutputBoundary)
@@ -127,17 +147,17 @@ def finish_pomodoro_output_boundary() -> Mock:
 @pytest.fixture()
 def finish_pomodoro_use_case(
     finish_pomodoro_output_boundary,
-    populated_pomodoros_repository,
-    populated_tasks_repository,
+    populated_unit_of_work,
     users_repository,
     populated_recent_pomodoros_query,
+    stats_repository,
 ) -> FinishPomodoro:
     return FinishPomodoro(
         output_boundary=finish_pomodoro_output_boundary,
-        pomodoro_repository=populated_pomodoros_repository,
-        task_repository=populated_tasks_repository,
+        unit_of_work=populated_unit_of_work,
         user_repository=users_repository,
         recent_pomodoros_query=populated_recent_pomodoros_query,
+        stats_repository=stats_repository,
     )
 
 
@@ -162,13 +182,11 @@ def pause_pomodoro_output_boundary() -> Mock:
 @pytest.fixture()
 def pause_pomodoro_use_case(
     pause_pomodoro_output_boundary,
-    populated_pomodoros_repository,
-    populated_tasks_repository,
+    populated_unit_of_work,
 ) -> PausePomodoro:
     return PausePomodoro(
         output_boundary=pause_pomodoro_output_boundary,
-        pomodoros_repository=populated_pomodoros_repository,
-        tasks_repository=populated_tasks_repository,
+        unit_of_work=populated_unit_of_work,
     )
 
 
@@ -180,13 +198,13 @@ def resume_pomodoro_output_boundary() -> Mock:
 @pytest.fixture()
 def resume_pomodoro_use_case(
     resume_pomodoro_output_boundary,
-    populated_pomodoros_repository,
-    populated_tasks_repository,
+    populated_unit_of_work,
+    users_repository,
 ) -> ResumePomodoro:
     return ResumePomodoro(
         output_boundary=resume_pomodoro_output_boundary,
-        pomodoros_repository=populated_pomodoros_repository,
-        tasks_repository=populated_tasks_repository,
+        unit_of_work=populated_unit_of_work,
+        user_repository=users_repository,
     )
 
 
@@ -223,12 +241,12 @@ def pin_task_to_project_output_boundary() -> Mock:
 @pytest.fixture()
 def pin_task_to_project_use_case(
     pin_task_to_project_output_boundary,
-    populated_tasks_repository,
+    populated_unit_of_work,
     populated_tasks_by_project_id_query,
 ) -> PinTaskToProject:
     return PinTaskToProject(
         output_boundary=pin_task_to_project_output_boundary,
-        tasks_repository=populated_tasks_repository,
+        unit_of_work=populated_unit_of_work,
         get_recent_tasks_by_pomodoro_id_query=populated_tasks_by_project_id_query,
     )
 
@@ -236,3 +254,58 @@ def pin_task_to_project_use_case(
 @pytest.fixture()
 def reactivate_task_output_boundary() -> Mock:
     return Mock(ReactivateTaskOutputBoundary)
+
+
+@pytest.fixture()
+def sync_pomodoros_output_boundary() -> Mock:
+    return Mock(spec_set=SyncPomodorosOutputBoundary)
+
+
+@pytest.fixture()
+def sync_pomodoros_use_case(
+    sync_pomodoros_output_boundary,
+    populated_pomodoros_repository,
+    populated_tasks_repository,
+    users_repository,
+    recent_pomodoros_query,
+    stats_repository,
+) -> SyncPomodoros:
+    return SyncPomodoros(
+        output_boundary=sync_pomodoros_output_boundary,
+        pomodoros_repository=populated_pomodoros_repository,
+        tasks_repository=populated_tasks_repository,
+        users_repository=users_repository,
+        recent_pomodoros_query=recent_pomodoros_query,
+        stats_repository=stats_repository,
+    )
+
+
+@pytest.fixture()
+def overdue_pomodoros_query() -> Mock:
+    return Mock(spec_set=GetOverduePomodoros)
+
+
+@pytest.fixture()
+def finish_overdue_pomodoros_output_boundary() -> Mock:
+    return Mock(spec_set=FinishOverduePomodorosOutputBoundary)
+
+
+@pytest.fixture()
+def finish_overdue_pomodoros_use_case(
+    finish_overdue_pomodoros_output_boundary,
+    populated_pomodoros_repository,
+    populated_tasks_repository,
+    users_repository,
+    overdue_pomodoros_query,
+    recent_pomodoros_query,
+    stats_repository,
+) -> FinishOverduePomodoros:
+    return FinishOverduePomodoros(
+        output_boundary=finish_overdue_pomodoros_output_boundary,
+        pomodoros_repository=populated_pomodoros_repository,
+        tasks_repository=populated_tasks_repository,
+        users_repository=users_repository,
+        overdue_pomodoros_query=overdue_pomodoros_query,
+        recent_pomodoros_query=recent_pomodoros_query,
+        stats_repository=stats_repository,
+    )
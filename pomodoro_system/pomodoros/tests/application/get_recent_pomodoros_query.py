@@ -1,10 +1,11 @@
 from typing import List, Optional
 
 from foundation.utils import with_tzinfo
+from foundation.value_objects import UserId
 from pomodoros.application.queries.pomodoros import GetRecentPomodoros
+from pomodoros.domain.date_frame_index import DateFrameIndex
 from pomodoros.domain.entities.pause import Pause
 from pomodoros.domain.entities.pomodoro import Pomodoro
-from pomodoros.domain.value_objects import TaskId
 
 
 class GetRecentPomodorosStub(GetRecentPomodoros):
@@ -33,14 +34,8 @@ class GetRecentPomodorosStub(GetRecentPomodoros):
             ),
         )
 
-    def query(self, task_id: TaskId) -> Optional[List[Pomodoro]]:
-        return (
-            list(
-                map(
-                    lambda pomodoro: self._to_pomodoro_dto(pomodoro),
-                    filter(lambda row: row.id == task_id, self._rows),
-                )
-            )
-            if self._rows
-            else []
-        )
+    def query(self, owner_id: UserId) -> Optional[List[Pomodoro]]:
+        return list(map(lambda pomodoro: self._to_pomodoro_dto(pomodoro), self._rows)) if self._rows else []
+
+    def query_index(self, owner_id: UserId) -> DateFrameIndex:
+        return DateFrameIndex(self.query(owner_id))
@@ -1,20 +1,30 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from foundation.value_objects import UserId
 from pomodoros.application.repositories.pomodoros import PomodoroRepository
 from pomodoros.domain.entities.pomodoro import Pomodoro
 from pomodoros.domain.value_objects import PomodoroId
 
 
 class InMemoryPomodorosRepository(PomodoroRepository):
-    def __init__(self, initial_data: Optional[List[Pomodoro]] = None):
+    def __init__(
+        self, initial_data: Optional[List[Pomodoro]] = None, owner_ids: Optional[Dict[PomodoroId, UserId]] = None
+    ):
         if initial_data is not None:
             self._rows = dict(map(lambda pomodoro: (pomodoro.id, pomodoro), initial_data))
         else:
             self._rows = {}
+        self._owner_ids = owner_ids or {}
 
     def get(self, pomodoro_id: PomodoroId) -> Pomodoro:
         return self._rows[pomodoro_id]
 
+    def get_with_owner_id(self, pomodoro_id: PomodoroId, for_update: bool = False) -> Tuple[Pomodoro, Optional[UserId]]:
+        return self._rows[pomodoro_id], self._owner_ids.get(pomodoro_id)
+
+    def get_many(self, pomodoro_ids: Iterable[PomodoroId]) -> List[Pomodoro]:
+        return [self._rows[pomodoro_id] for pomodoro_id in pomodoro_ids if pomodoro_id in self._rows]
+
     def save(self, pomodoro: Pomodoro, create: bool = False) -> None:
         self._rows[pomodoro.id] = pomodoro
 
@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from foundation.value_objects import UserId
 from pomodoros.application.repositories.tasks import TaskRepository
 from pomodoros.domain.entities import Task
 from pomodoros.domain.entities.pomodoro import Pomodoro
@@ -7,15 +8,22 @@ from pomodoros.domain.value_objects import TaskId
 
 
 class InMemoryTaskRepository(TaskRepository):
-    def __init__(self, initial_data: Optional[List[Task]] = None):
+    def __init__(self, initial_data: Optional[List[Task]] = None, owner_ids: Optional[Dict[TaskId, UserId]] = None):
         if initial_data is not None:
             self._rows = dict(map(lambda task: (task.id, task), initial_data))
         else:
             self._rows = {}
+        self._owner_ids = owner_ids or {}
 
     def get(self, task_id: TaskId) -> Optional[Pomodoro]:
         return self._rows[task_id]
 
+    def get_with_owner_id(self, task_id: TaskId, for_update: bool = False) -> Tuple[Task, Optional[UserId]]:
+        return self._rows[task_id], self._owner_ids.get(task_id)
+
+    def get_many(self, task_ids: Iterable[TaskId]) -> List[Task]:
+        return [self._rows[task_id] for task_id in task_ids if task_id in self._rows]
+
     def save(self, task: Task, create: bool = True) -> None:
         self._rows[task.id] = task
 
@@ -25,3 +33,6 @@ class InMemoryTaskRepository(TaskRepository):
 
     def delete(self, task_id: Task) -> None:
         self._rows.pop(task_id)
+
+    def increment_pomodoros_burn_down(self, task_id: TaskId) -> None:
+        self._rows[task_id].pomodoros_burn_down += 1
@@ -0,0 +1,17 @@
+from pomodoros.application.repositories.pomodoros import PomodoroRepository
+from pomodoros.application.repositories.tasks import TaskRepository
+from pomodoros.application.unit_of_work import UnitOfWork
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    def __init__(self, pomodoros: PomodoroRepository, tasks: TaskRepository) -> None:
+        self.pomodoros = pomodoros
+        self.tasks = tasks
+        self.commits_count = 0
+        self.rollbacks_count = 0
+
+    def commit(self) -> None:
+        self.commits_count += 1
+
+    def rollback(self) -> None:
+        self.rollbacks_count += 1
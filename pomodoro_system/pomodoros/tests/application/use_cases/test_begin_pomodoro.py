@@ -4,9 +4,11 @@ from pomodoros.application.use_cases.begin_pomodoro import BeginPomodoroInputDto
 from pomodoros.domain.value_objects import FrameType
 
 
-def test_begin_pomodoro_use_case(task, begin_pomodoro_output_boundary, begin_pomodoro_use_case, pomodoros_repository):
+def test_begin_pomodoro_use_case(
+    user, task, begin_pomodoro_output_boundary, begin_pomodoro_use_case, pomodoros_repository
+):
     now = datetime.now()
-    begin_pomodoro_input_dto = BeginPomodoroInputDto(task_id=task.id, start_date=now)
+    begin_pomodoro_input_dto = BeginPomodoroInputDto(task_id=task.id, start_date=now, owner_id=user.id)
 
     begin_pomodoro_use_case.execute(input_dto=begin_pomodoro_input_dto)
     new_pomodoro = list(pomodoros_repository.rows.values())[0]
@@ -11,27 +11,25 @@ def test_complete_task_use_case_with_one_time_task(
     complete_task_input_dto = CompleteTaskInputDto(id=one_time_task.id, completed_at=now)
     complete_task_use_case.execute(input_dto=complete_task_input_dto)
 
-    expected_output_dto = CompleteTaskOutputDto(id=one_time_task.id, status=TaskStatus.COMPLETED, new_task_id=None)
+    expected_output_dto = CompleteTaskOutputDto(id=one_time_task.id, status=TaskStatus.COMPLETED)
 
     assert one_time_task.status == TaskStatus.COMPLETED
     complete_task_output_boundary.present.assert_called_once_with(expected_output_dto)
 
 
-def test_complete_task_use_case_with_repeatable_task(
+def test_complete_task_use_case_with_repeatable_task_does_not_create_next_task(
     task,
     complete_task_output_boundary,
     complete_task_use_case,
     populated_tasks_repository,
 ):
+    tasks_count = len(populated_tasks_repository.rows)
     now = datetime.now()
     complete_task_input_dto = CompleteTaskInputDto(id=task.id, completed_at=now)
     complete_task_use_case.execute(input_dto=complete_task_input_dto)
 
-    next_due_date_task = list(populated_tasks_repository.rows.values())[-1]
-    expected_output_dto = CompleteTaskOutputDto(
-        id=task.id, status=TaskStatus.COMPLETED, new_task_id=next_due_date_task.id
-    )
+    expected_output_dto = CompleteTaskOutputDto(id=task.id, status=TaskStatus.COMPLETED)
 
-    assert task.id != next_due_date_task.id
+    assert len(populated_tasks_repository.rows) == tasks_count
     assert task.status == TaskStatus.COMPLETED
     complete_task_output_boundary.present.assert_called_once_with(expected_output_dto)
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from pomodoros.application.queries.pomodoros import QueryOverduePomodoroDto
+from pomodoros.application.use_cases.finish_overdue_pomodoros import (
+    FinishOverduePomodorosInputDto,
+    FinishOverduePomodorosOutputDto,
+)
+from pomodoros.domain.value_objects import PomodoroState
+
+
+def test_finish_overdue_pomodoros_finishes_pomodoro_at_its_due_date(
+    user,
+    started_pomodoro,
+    finish_overdue_pomodoros_use_case,
+    finish_overdue_pomodoros_output_boundary,
+    overdue_pomodoros_query,
+    populated_pomodoros_repository,
+    populated_tasks_repository,
+    stats_repository,
+):
+    related_task = populated_tasks_repository.get(started_pomodoro.task_id)
+    initial_pomodoros_burn_down = related_task.pomodoros_burn_down
+    started_pomodoro.start_date = datetime.now() - timedelta(hours=2)
+    started_pomodoro.paused_duration = timedelta(minutes=10)
+    expected_end_date = (
+        started_pomodoro.start_date + timedelta(minutes=10) + related_task.date_frame_definition.pomodoro_length
+    )
+    overdue_pomodoros_query.query.return_value = [QueryOverduePomodoroDto(id=started_pomodoro.id, owner_id=user.id)]
+
+    finish_overdue_pomodoros_use_case.execute(FinishOverduePomodorosInputDto(now=datetime.now()))
+
+    mutated_pomodoro = populated_pomodoros_repository.get(started_pomodoro.id)
+
+    assert mutated_pomodoro.state == PomodoroState.FINISHED
+    assert mutated_pomodoro.end_date == expected_end_date
+    assert related_task.pomodoros_burn_down == initial_pomodoros_burn_down + 1
+    stats_repository.record_finished_pomodoro.assert_called_once_with(
+        user.id, related_task.project_id, mutated_pomodoro
+    )
+    finish_overdue_pomodoros_output_boundary.present.assert_called_once_with(
+        FinishOverduePomodorosOutputDto([started_pomodoro.id])
+    )
+
+
+def test_finish_overdue_pomodoros_skips_pomodoros_which_are_not_due_yet(
+    user,
+    started_pomodoro,
+    paused_pomodoro,
+    finish_overdue_pomodoros_use_case,
+    finish_overdue_pomodoros_output_boundary,
+    overdue_pomodoros_query,
+    populated_pomodoros_repository,
+    stats_repository,
+):
+    overdue_pomodoros_query.query.return_value = [
+        QueryOverduePomodoroDto(id=started_pomodoro.id, owner_id=user.id),
+        QueryOverduePomodoroDto(id=paused_pomodoro.id, owner_id=user.id),
+    ]
+
+    finish_overdue_pomodoros_use_case.execute(FinishOverduePomodorosInputDto(now=datetime.now()))
+
+    assert populated_pomodoros_repository.get(started_pomodoro.id).state == PomodoroState.RUNNING
+    assert populated_pomodoros_repository.get(paused_pomodoro.id).state == PomodoroState.PAUSED
+    stats_repository.record_finished_pomodoro.assert_not_called()
+    finish_overdue_pomodoros_output_boundary.present.assert_called_once_with(FinishOverduePomodorosOutputDto([]))
+
+
+def test_finish_overdue_pomodoros_unschedules_pomodoros_which_cannot_be_finished(
+    user,
+    started_pomodoro,
+    finish_overdue_pomodoros_use_case,
+    finish_overdue_pomodoros_output_boundary,
+    overdue_pomodoros_query,
+    populated_pomodoros_repository,
+    populated_tasks_repository,
+    stats_repository,
+):
+    related_task = populated_tasks_repository.get(started_pomodoro.task_id)
+    related_task.complete()
+    started_pomodoro.start_date = datetime.now() - timedelta(hours=2)
+    started_pomodoro.due_date = started_pomodoro.start_date + related_task.date_frame_definition.pomodoro_length
+    overdue_pomodoros_query.query.return_value = [QueryOverduePomodoroDto(id=started_pomodoro.id, owner_id=user.id)]
+
+    finish_overdue_pomodoros_use_case.execute(FinishOverduePomodorosInputDto(now=datetime.now()))
+
+    mutated_pomodoro = populated_pomodoros_repository.get(started_pomodoro.id)
+
+    assert mutated_pomodoro.state == PomodoroState.RUNNING
+    assert mutated_pomodoro.due_date is None
+    stats_repository.record_finished_pomodoro.assert_not_called()
+    finish_overdue_pomodoros_output_boundary.present.assert_called_once_with(FinishOverduePomodorosOutputDto([]))
@@ -9,8 +9,12 @@ def test_finish_pomodoro_use_case(
     finish_pomodoro_output_boundary,
     finish_pomodoro_use_case,
     populated_pomodoros_repository,
+    populated_tasks_repository,
+    stats_repository,
 ):
     now = datetime.now()
+    related_task = populated_tasks_repository.get(started_pomodoro.task_id)
+    initial_pomodoros_burn_down = related_task.pomodoros_burn_down
     finish_pomodoro_input_dto = FinishPomodoroInputDto(id=started_pomodoro.id, end_date=now, owner_id=user.id)
 
     finish_pomodoro_use_case.execute(input_dto=finish_pomodoro_input_dto)
@@ -24,4 +28,8 @@ def test_finish_pomodoro_use_case(
     mutated_pomodoro = populated_pomodoros_repository.get(started_pomodoro.id)
 
     assert mutated_pomodoro.end_date == now
+    assert related_task.pomodoros_burn_down == initial_pomodoros_burn_down + 1
     finish_pomodoro_output_boundary.present.assert_called_once_with(expected_dto)
+    stats_repository.record_finished_pomodoro.assert_called_once_with(
+        user.id, related_task.project_id, mutated_pomodoro
+    )
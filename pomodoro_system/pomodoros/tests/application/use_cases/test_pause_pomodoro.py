@@ -1,6 +1,8 @@
 from datetime import datetime
 
+import pytest
 from pomodoros.application.use_cases.pause_pomodoro import PausePomodoroInputDto, PausePomodoroOutputDto
+from pomodoros.domain.exceptions import NoActionAllowedOnCompletedTask
 
 
 def test_pause_pomodoro(started_pomodoro, pause_pomodoro_output_boundary, pause_pomodoro_use_case):
@@ -12,3 +14,25 @@ def test_pause_pomodoro(started_pomodoro, pause_pomodoro_output_boundary, pause_
     expected_output_dto = PausePomodoroOutputDto(pomodoro_id=started_pomodoro.id, pause_date=now)
     pause_pomodoro_output_boundary.present.assert_called_once_with(expected_output_dto)
     assert started_pomodoro.contained_pauses is not None
+
+
+def test_pause_pomodoro_commits_unit_of_work_once(started_pomodoro, pause_pomodoro_use_case, populated_unit_of_work):
+    pause_pomodoro_input_dto = PausePomodoroInputDto(pomodoro_id=started_pomodoro.id, pause_date=datetime.now())
+
+    pause_pomodoro_use_case.execute(input_dto=pause_pomodoro_input_dto)
+
+    assert populated_unit_of_work.commits_count == 1
+    assert populated_unit_of_work.rollbacks_count == 0
+
+
+def test_pause_pomodoro_rolls_back_unit_of_work_on_error(
+    started_pomodoro, pause_pomodoro_use_case, populated_unit_of_work, populated_tasks_repository
+):
+    populated_tasks_repository.get(started_pomodoro.task_id).complete()
+    pause_pomodoro_input_dto = PausePomodoroInputDto(pomodoro_id=started_pomodoro.id, pause_date=datetime.now())
+
+    with pytest.raises(NoActionAllowedOnCompletedTask):
+        pause_pomodoro_use_case.execute(input_dto=pause_pomodoro_input_dto)
+
+    assert populated_unit_of_work.commits_count == 0
+    assert populated_unit_of_work.rollbacks_count == 1
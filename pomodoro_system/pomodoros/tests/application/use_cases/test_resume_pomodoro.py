@@ -3,9 +3,11 @@ from datetime import datetime
 from pomodoros.application.use_cases.resume_pomodoro import ResumePomodoroInputDto, ResumePomodoroOutputDto
 
 
-def test_resume_pomodoro_use_case(paused_pomodoro, resume_pomodoro_output_boundary, resume_pomodoro_use_case):
+def test_resume_pomodoro_use_case(user, paused_pomodoro, resume_pomodoro_output_boundary, resume_pomodoro_use_case):
     now = datetime.now()
-    resume_pomodoro_input_dto = ResumePomodoroInputDto(pomodoro_id=paused_pomodoro.id, resume_date=now)
+    resume_pomodoro_input_dto = ResumePomodoroInputDto(
+        pomodoro_id=paused_pomodoro.id, resume_date=now, owner_id=user.id
+    )
 
     resume_pomodoro_use_case.execute(input_dto=resume_pomodoro_input_dto)
 
@@ -14,4 +16,5 @@ def test_resume_pomodoro_use_case(paused_pomodoro, resume_pomodoro_output_bounda
     assert paused_pomodoro.contained_pauses is not None
     assert len(paused_pomodoro.contained_pauses) == 1
     assert paused_pomodoro.contained_pauses[-1].is_finished
+    assert paused_pomodoro.due_date is not None
     resume_pomodoro_output_boundary.present.assert_called_once_with(expected_output_dto)
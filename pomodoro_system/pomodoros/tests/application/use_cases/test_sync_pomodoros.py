@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime, timedelta
+
+from pomodoros.application.use_cases.sync_pomodoros import (
+    PomodoroEventDto,
+    PomodoroEventResultDto,
+    PomodoroEventType,
+    SyncPomodorosInputDto,
+    SyncPomodorosOutputDto,
+)
+from pomodoros.domain.value_objects import PomodoroState
+
+
+def test_sync_pomodoros_applies_events_in_order(
+    user,
+    task,
+    sync_pomodoros_use_case,
+    sync_pomodoros_output_boundary,
+    populated_pomodoros_repository,
+    stats_repository,
+):
+    now = datetime.now()
+    new_pomodoro_id = uuid.uuid4()
+    initial_pomodoros_burn_down = task.pomodoros_burn_down
+    events = [
+        PomodoroEventDto(PomodoroEventType.BEGIN, new_pomodoro_id, now, task.id),
+        PomodoroEventDto(PomodoroEventType.PAUSE, new_pomodoro_id, now + timedelta(minutes=1)),
+        PomodoroEventDto(PomodoroEventType.RESUME, new_pomodoro_id, now + timedelta(minutes=2)),
+        PomodoroEventDto(PomodoroEventType.FINISH, new_pomodoro_id, now + timedelta(minutes=3)),
+    ]
+
+    sync_pomodoros_use_case.execute(SyncPomodorosInputDto(owner_id=user.id, events=events))
+
+    synced_pomodoro = populated_pomodoros_repository.get(new_pomodoro_id)
+    expected_output_dto = SyncPomodorosOutputDto(
+        [PomodoroEventResultDto(new_pomodoro_id, event.type) for event in events]
+    )
+
+    sync_pomodoros_output_boundary.present.assert_called_once_with(expected_output_dto)
+    assert synced_pomodoro.state == PomodoroState.FINISHED
+    assert synced_pomodoro.paused_duration == timedelta(minutes=1)
+    assert task.pomodoros_burn_down == initial_pomodoros_burn_down + 1
+    stats_repository.record_finished_pomodoro.assert_called_once_with(user.id, task.project_id, synced_pomodoro)
+
+
+def test_sync_pomodoros_reports_failed_events_without_dropping_the_others(
+    user,
+    started_pomodoro,
+    sync_pomodoros_use_case,
+    sync_pomodoros_output_boundary,
+):
+    now = datetime.now()
+    events = [
+        PomodoroEventDto(PomodoroEventType.PAUSE, uuid.uuid4(), now),
+        PomodoroEventDto(PomodoroEventType.PAUSE, started_pomodoro.id, now),
+    ]
+
+    sync_pomodoros_use_case.execute(SyncPomodorosInputDto(owner_id=user.id, events=events))
+
+    output_dto = sync_pomodoros_output_boundary.present.call_args[0][0]
+
+    assert [result.is_applied for result in output_dto.results] == [False, True]
+    assert output_dto.results[0].errors
+    assert started_pomodoro.state == PomodoroState.PAUSED
@@ -140,6 +140,15 @@ def overlapping_finished_pomodoros() -> List[Pomodoro]:
     return [first_overlapping_pomodoro, second_overlapping_pomodoro]
 
 
+@pytest.fixture()
+def finished_pomodoros_colliding_with_started_pomodoro(started_pomodoro: Pomodoro) -> List[Pomodoro]:
+    colliding_pomodoro = PomodoroFactory(
+        start_date=started_pomodoro.start_date - timedelta(minutes=10),
+        end_date=started_pomodoro.start_date + timedelta(seconds=1),
+    )
+    return [colliding_pomodoro]
+
+
 @pytest.fixture()
 def date_frame_definition() -> DateFrameDefinition:
     return DateFrameDefinitionFactory()
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pomodoros.domain.date_frame_index import DateFrameIndex
+from pomodoros.tests.factories import PomodoroFactory
+
+
+@pytest.fixture()
+def now() -> datetime:
+    return datetime.now()
+
+
+@pytest.fixture()
+def date_frame_index(now) -> DateFrameIndex:
+    return DateFrameIndex(
+        [
+            PomodoroFactory(start_date=now + timedelta(minutes=30), end_date=now + timedelta(minutes=55)),
+            PomodoroFactory(start_date=now, end_date=now + timedelta(minutes=25)),
+            PomodoroFactory(start_date=now + timedelta(minutes=60)),
+        ]
+    )
+
+
+def test_index_skips_unfinished_date_frames(date_frame_index):
+    assert len(date_frame_index) == 2
+
+
+@pytest.mark.parametrize(
+    "start_offset, end_offset",
+    [
+        (timedelta(minutes=-10), timedelta(minutes=5)),
+        (timedelta(minutes=20), timedelta(minutes=35)),
+        (timedelta(minutes=5), timedelta(minutes=10)),
+        (timedelta(minutes=-5), timedelta(minutes=90)),
+    ],
+)
+def test_index_finds_overlapping_date_frames(date_frame_index, now, start_offset, end_offset):
+    assert date_frame_index.overlaps(now + start_offset, now + end_offset)
+
+
+@pytest.mark.parametrize(
+    "start_offset, end_offset",
+    [
+        (timedelta(minutes=-30), timedelta(minutes=-5)),
+        (timedelta(minutes=25), timedelta(minutes=30)),
+        (timedelta(minutes=56), timedelta(minutes=90)),
+    ],
+)
+def test_index_ignores_date_frames_outside_checked_range(date_frame_index, now, start_offset, end_offset):
+    assert not date_frame_index.overlaps(now + start_offset, now + end_offset)
+
+
+def test_index_treats_missing_end_date_as_open_range(date_frame_index, now):
+    assert date_frame_index.overlaps(now + timedelta(minutes=50))
+    assert not date_frame_index.overlaps(now + timedelta(minutes=55))
+
+
+def test_index_finds_overlaps_of_added_date_frames(date_frame_index, now):
+    date_frame_index.add(PomodoroFactory(start_date=now - timedelta(minutes=60), end_date=now - timedelta(minutes=35)))
+
+    assert len(date_frame_index) == 3
+    assert date_frame_index.overlaps(now - timedelta(minutes=40), now - timedelta(minutes=30))
+    assert not date_frame_index.overlaps(now - timedelta(minutes=30), now - timedelta(minutes=5))
+
+
+def test_index_built_from_date_ranges_finds_overlaps(now):
+    date_frame_index = DateFrameIndex.from_date_ranges(
+        [(now + timedelta(minutes=30), now + timedelta(minutes=55)), (now, now + timedelta(minutes=25))]
+    )
+
+    assert len(date_frame_index) == 2
+    assert date_frame_index.overlaps(now + timedelta(minutes=20), now + timedelta(minutes=28))
+    assert not date_frame_index.overlaps(now + timedelta(minutes=26), now + timedelta(minutes=29))
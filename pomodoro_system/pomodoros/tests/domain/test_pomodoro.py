@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 
 import pytest
+from pomodoros.domain.date_frame_index import DateFrameIndex
 from pomodoros.domain.exceptions import (
     CollidingPomodoroWasFound,
     DateFrameIsAlreadyFinished,
@@ -9,7 +10,7 @@ from pomodoros.domain.exceptions import (
     PomodoroErrorMarginExceeded,
     StartDateGreaterThanEndDate,
 )
-from pomodoros.domain.value_objects import AcceptablePomodoroErrorMargin
+from pomodoros.domain.value_objects import AcceptablePomodoroErrorMargin, PomodoroEventType, PomodoroState
 from pomodoros.tests.factories import PomodoroFactory
 from pytest_lazyfixture import lazy_fixture
 
@@ -25,7 +26,7 @@ def test_begin_pomodoro_successfully(pomodoro, task, recent_potentially_collidin
     now = datetime.now()
     pomodoro.begin(
         related_task=task,
-        recent_pomodoros=recent_potentially_colliding_pomodoros,
+        recent_pomodoros=DateFrameIndex(recent_potentially_colliding_pomodoros),
         start_date=now,
     )
 
@@ -37,7 +38,7 @@ def test_begin_pomodoro_on_completed_task_fails(completed_task):
     now = datetime.now()
 
     with pytest.raises(NoActionAllowedOnCompletedTask):
-        pomodoro.begin(related_task=completed_task, recent_pomodoros=[], start_date=now)
+        pomodoro.begin(related_task=completed_task, recent_pomodoros=DateFrameIndex(), start_date=now)
 
 
 def test_begin_pomodoro_along_colliding_pomodoros_fails(pomodoro, task, overlapping_finished_pomodoros):
@@ -46,7 +47,7 @@ def test_begin_pomodoro_along_colliding_pomodoros_fails(pomodoro, task, overlapp
     with pytest.raises(CollidingPomodoroWasFound):
         pomodoro.begin(
             related_task=task,
-            recent_pomodoros=overlapping_finished_pomodoros,
+            recent_pomodoros=DateFrameIndex(overlapping_finished_pomodoros),
             start_date=now,
         )
 
@@ -56,6 +57,7 @@ def test_begin_pomodoro_along_colliding_pomodoros_fails(pomodoro, task, overlapp
     [
         lazy_fixture("overlapping_unfinished_pomodoros"),
         lazy_fixture("finished_non_overlapping_pomodoros"),
+        lazy_fixture("overlapping_finished_pomodoros"),
     ],
 )
 def test_finish_pomodoro_successfully(
@@ -68,7 +70,7 @@ def test_finish_pomodoro_successfully(
     started_pomodoro.finish(
         date_frame_definition=date_frame_definition,
         related_task=task,
-        recent_pomodoros=recent_potentially_colliding_pomodoros,
+        recent_pomodoros=DateFrameIndex(recent_potentially_colliding_pomodoros),
         end_date=now,
     )
 
@@ -83,7 +85,7 @@ def test_finish_pomodoro_on_completed_task_fails(date_frame_definition, complete
         started_pomodoro.finish(
             date_frame_definition=date_frame_definition,
             related_task=completed_task,
-            recent_pomodoros=[],
+            recent_pomodoros=DateFrameIndex(),
             end_date=now,
         )
 
@@ -95,7 +97,7 @@ def test_finish_already_finished_pomodoro_fails(date_frame_definition, finished_
         finished_pomodoro.finish(
             date_frame_definition=date_frame_definition,
             related_task=task,
-            recent_pomodoros=[],
+            recent_pomodoros=DateFrameIndex(),
             end_date=now,
         )
 
@@ -107,7 +109,7 @@ def test_pomodoro_with_start_date_greater_than_end_date_fails(date_frame_definit
         started_pomodoro.finish(
             date_frame_definition=date_frame_definition,
             related_task=task,
-            recent_pomodoros=[],
+            recent_pomodoros=DateFrameIndex(),
             end_date=end_date,
         )
 
@@ -122,7 +124,7 @@ def test_finish_pomodoro_with_exceeding_duration_fails(date_frame_definition, st
         started_pomodoro.finish(
             date_frame_definition=date_frame_definition,
             related_task=task,
-            recent_pomodoros=[],
+            recent_pomodoros=DateFrameIndex(),
             end_date=exceeded_end_date,
         )
 
@@ -136,15 +138,33 @@ def test_finish_pomodoro_with_exceeding_duration_fitting_within_error_margin_suc
     started_pomodoro.finish(
         date_frame_definition=date_frame_definition,
         related_task=task,
-        recent_pomodoros=[],
+        recent_pomodoros=DateFrameIndex(),
         end_date=maximal_valid_end_date,
     )
 
     assert started_pomodoro.end_date == maximal_valid_end_date
 
 
+def test_finish_pomodoro_excludes_paused_duration_from_its_length(date_frame_definition, started_pomodoro, task):
+    pause_start_date = started_pomodoro.start_date + timedelta(minutes=5)
+    pause_end_date = pause_start_date + timedelta(minutes=30)
+    started_pomodoro.pause(related_task=task, start_date=pause_start_date)
+    started_pomodoro.resume(related_task=task, end_date=pause_end_date)
+    end_date = started_pomodoro.start_date + date_frame_definition.pomodoro_length + timedelta(minutes=30)
+
+    started_pomodoro.finish(
+        date_frame_definition=date_frame_definition,
+        related_task=task,
+        recent_pomodoros=DateFrameIndex(),
+        end_date=end_date,
+    )
+
+    assert started_pomodoro.paused_duration == timedelta(minutes=30)
+    assert started_pomodoro.end_date == end_date
+
+
 def test_finish_pomodoro_along_colliding_pomodoros_fails(
-    date_frame_definition, started_pomodoro, task, overlapping_finished_pomodoros
+    date_frame_definition, started_pomodoro, task, finished_pomodoros_colliding_with_started_pomodoro
 ):
     now = datetime.now()
 
@@ -152,7 +172,22 @@ def test_finish_pomodoro_along_colliding_pomodoros_fails(
         started_pomodoro.finish(
             date_frame_definition=date_frame_definition,
             related_task=task,
-            recent_pomodoros=overlapping_finished_pomodoros,
+            recent_pomodoros=DateFrameIndex(finished_pomodoros_colliding_with_started_pomodoro),
+            end_date=now,
+        )
+
+
+def test_finish_pomodoro_along_colliding_pomodoros_index_fails(
+    date_frame_definition, started_pomodoro, task, finished_pomodoros_colliding_with_started_pomodoro
+):
+    now = datetime.now()
+    recent_pomodoros_index = DateFrameIndex(finished_pomodoros_colliding_with_started_pomodoro)
+
+    with pytest.raises(CollidingPomodoroWasFound):
+        started_pomodoro.finish(
+            date_frame_definition=date_frame_definition,
+            related_task=task,
+            recent_pomodoros=recent_pomodoros_index,
             end_date=now,
         )
 
@@ -191,6 +226,7 @@ def test_resume_pomodoro_mutates_current_pause(paused_pomodoro, pause, task):
 
     assert pause.is_finished
     assert pause.end_date == now
+    assert paused_pomodoro.paused_duration == now - pause.start_date
 
 
 def test_resume_pomodoro_on_completed_task_fails(pomodoro_on_completed_task, completed_task):
@@ -212,3 +248,82 @@ def test_resume_pomodoro_with_date_lower_than_date_paused_fails(paused_pomodoro,
 
     with pytest.raises(StartDateGreaterThanEndDate):
         paused_pomodoro.resume(related_task=task, end_date=yesterday)
+
+
+def test_pomodoro_state_follows_begin_pause_resume_and_finish(pomodoro, task, date_frame_definition):
+    now = datetime.now()
+
+    pomodoro.begin(related_task=task, recent_pomodoros=DateFrameIndex(), start_date=now)
+    assert pomodoro.state == PomodoroState.RUNNING
+
+    pomodoro.pause(related_task=task, start_date=now + timedelta(minutes=5))
+    assert pomodoro.state == PomodoroState.PAUSED
+    assert pomodoro.current_pause is pomodoro.new_pause
+
+    pomodoro.resume(related_task=task, end_date=now + timedelta(minutes=10))
+    assert pomodoro.state == PomodoroState.RUNNING
+    assert pomodoro.current_pause is None
+
+    pomodoro.finish(
+        date_frame_definition=date_frame_definition,
+        related_task=task,
+        recent_pomodoros=DateFrameIndex(),
+        end_date=now + timedelta(minutes=20),
+    )
+    assert pomodoro.state == PomodoroState.FINISHED
+    assert pomodoro.is_finished
+
+
+def test_pomodoro_records_events_which_replay_to_the_same_state(pomodoro, task, date_frame_definition):
+    now = datetime.now()
+
+    pomodoro.begin(related_task=task, recent_pomodoros=DateFrameIndex(), start_date=now)
+    pomodoro.pause(related_task=task, start_date=now + timedelta(minutes=5))
+    pomodoro.resume(related_task=task, end_date=now + timedelta(minutes=10))
+    pomodoro.finish(
+        date_frame_definition=date_frame_definition,
+        related_task=task,
+        recent_pomodoros=DateFrameIndex(),
+        end_date=now + timedelta(minutes=20),
+    )
+
+    assert [event.type for event in pomodoro.new_events] == [
+        PomodoroEventType.BEGIN,
+        PomodoroEventType.PAUSE,
+        PomodoroEventType.RESUME,
+        PomodoroEventType.FINISH,
+    ]
+
+    replayed_pomodoro = PomodoroFactory(task_id=pomodoro.task_id)
+    for event in pomodoro.new_events:
+        replayed_pomodoro.apply_event(event)
+
+    assert replayed_pomodoro.state == pomodoro.state
+    assert replayed_pomodoro.start_date == pomodoro.start_date
+    assert replayed_pomodoro.end_date == pomodoro.end_date
+    assert replayed_pomodoro.paused_duration == pomodoro.paused_duration == timedelta(minutes=5)
+    assert replayed_pomodoro.contained_pauses == pomodoro.contained_pauses
+
+
+def test_pomodoro_due_date_excludes_paused_duration(pomodoro, task, date_frame_definition):
+    now = datetime.now()
+
+    pomodoro.begin(related_task=task, recent_pomodoros=DateFrameIndex(), start_date=now)
+    pomodoro.pause(related_task=task, start_date=now + timedelta(minutes=5))
+    assert pomodoro.get_due_date(date_frame_definition) is None
+
+    pomodoro.resume(related_task=task, end_date=now + timedelta(minutes=15))
+    assert pomodoro.get_due_date(date_frame_definition) == (
+        now + timedelta(minutes=10) + date_frame_definition.pomodoro_length
+    )
+
+
+def test_pomodoro_due_date_is_unscheduled_when_paused(pomodoro, task, date_frame_definition):
+    now = datetime.now()
+
+    pomodoro.begin(related_task=task, recent_pomodoros=DateFrameIndex(), start_date=now)
+    pomodoro.schedule_due_date(date_frame_definition)
+    assert pomodoro.due_date == now + date_frame_definition.pomodoro_length
+
+    pomodoro.pause(related_task=task, start_date=now + timedelta(minutes=5))
+    assert pomodoro.due_date is None
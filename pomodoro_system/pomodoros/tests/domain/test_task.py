@@ -15,6 +15,12 @@ def test_task_returns_proper_next_due_date(task):
     assert task.next_due_date == expected_next_due_date
 
 
+def test_task_without_due_date_has_no_next_due_date():
+    task = TaskFactory(due_date=None, reminder_date=None)
+
+    assert task.next_due_date is None
+
+
 def test_complete_task_successfully(task):
     task.complete()
 
@@ -1,19 +1,53 @@
 import injector
 from pomodoros import (
+    ClaimDueTaskReminders,
+    GetActivePomodoro,
+    GetOverduePomodoros,
+    GetPomodoroStats,
     GetRecentPomodoros,
     GetTaskListByOwnerId,
     PauseRepository,
     PomodoroRepository,
     ProjectRepository,
+    SearchTasksByOwnerId,
+    StatsRepository,
     TaskRepository,
+    UnitOfWork,
 )
 from pomodoros.application.queries.projects import GetProjectsByOwnerId
 from pomodoros.application.queries.tasks import GetRecentTasksByProjectId
 
-from .models import PauseModel, PomodoroModel, ProjectModel, SubTaskModel, TaskModel
-from .queries import SQLGetRecentPomodoros, SQLGetRecentTasksByProjectId, SQLGetTaskListByOwnerId
+from .models import (
+    DailyStatsModel,
+    PauseModel,
+    PomodoroEventModel,
+    PomodoroModel,
+    ProjectModel,
+    SubTaskModel,
+    TaskModel,
+    TaskSearchDocumentModel,
+)
+from .queries import (
+    SQLClaimDueTaskReminders,
+    SQLGetActivePomodoro,
+    SQLGetEventSourcedOverduePomodoros,
+    SQLGetOverduePomodoros,
+    SQLGetPomodoroStats,
+    SQLGetRecentPomodoros,
+    SQLGetRecentTasksByProjectId,
+    SQLGetTaskListByOwnerId,
+    SQLSearchTasksByOwnerId,
+)
 from .queries.projects import SQLGetProjectsByOwnerId
-from .repositories import SQLPauseRepository, SQLPomodoroRepository, SQLProjectRepository, SQLTaskRepository
+from .repositories import (
+    SQLEventSourcedPomodoroRepository,
+    SQLPauseRepository,
+    SQLPomodoroRepository,
+    SQLProjectRepository,
+    SQLStatsRepository,
+    SQLTaskRepository,
+)
+from .unit_of_work import SQLUnitOfWork
 
 __all__ = [
     # injected module
@@ -24,18 +58,32 @@ __all__ = [
     "SubTaskModel",
     "PauseModel",
     "PomodoroModel",
+    "PomodoroEventModel",
+    "DailyStatsModel",
+    "TaskSearchDocumentModel",
+    # unit of work
+    "SQLUnitOfWork",
 ]
 
 
 class PomodorosInfrastructure(injector.Module):
+    def __init__(self, event_sourced_pomodoros: bool = False) -> None:
+        self.event_sourced_pomodoros = event_sourced_pomodoros
+
     @injector.provider
     def pauses_repository(self) -> PauseRepository:
         return SQLPauseRepository()
 
     @injector.provider
     def pomodoros_repository(self) -> PomodoroRepository:
+        if self.event_sourced_pomodoros:
+            return SQLEventSourcedPomodoroRepository()
         return SQLPomodoroRepository()
 
+    @injector.provider
+    def unit_of_work(self) -> UnitOfWork:
+        return SQLUnitOfWork(self.event_sourced_pomodoros)
+
     @injector.provider
     def projects_repository(self) -> ProjectRepository:
         return SQLProjectRepository()
@@ -44,14 +92,36 @@ class PomodorosInfrastructure(injector.Module):
     def tasks_repository(self) -> TaskRepository:
         return SQLTaskRepository()
 
+    @injector.provider
+    def stats_repository(self) -> StatsRepository:
+        return SQLStatsRepository()
+
     @injector.provider
     def recent_pomodoros_query(self) -> GetRecentPomodoros:
         return SQLGetRecentPomodoros()
 
+    @injector.provider
+    def active_pomodoro_query(self) -> GetActivePomodoro:
+        return SQLGetActivePomodoro()
+
+    @injector.provider
+    def overdue_pomodoros_query(self) -> GetOverduePomodoros:
+        if self.event_sourced_pomodoros:
+            return SQLGetEventSourcedOverduePomodoros()
+        return SQLGetOverduePomodoros()
+
     @injector.provider
     def get_tasks_by_project_id_query(self) -> GetTaskListByOwnerId:
         return SQLGetTaskListByOwnerId()
 
+    @injector.provider
+    def search_tasks_by_owner_id_query(self) -> SearchTasksByOwnerId:
+        return SQLSearchTasksByOwnerId()
+
+    @injector.provider
+    def claim_due_task_reminders_query(self) -> ClaimDueTaskReminders:
+        return SQLClaimDueTaskReminders()
+
     @injector.provider
     def get_recent_tasks_by_project_id_query(self) -> GetRecentTasksByProjectId:
         return SQLGetRecentTasksByProjectId()
@@ -59,3 +129,7 @@ class PomodorosInfrastructure(injector.Module):
     @injector.provider
     def get_projects_by_owner_id_query(self) -> GetProjectsByOwnerId:
         return SQLGetProjectsByOwnerId()
+
+    @injector.provider
+    def get_pomodoro_stats_query(self) -> GetPomodoroStats:
+        return SQLGetPomodoroStats()
@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime
+from typing import Any, Iterable, List, Type
+
+from foundation.models import db
+from foundation.utils import to_utc
+from pony.orm.core import Attribute
+
+MAX_STATEMENT_PARAMETERS = 999
+
+
+def _get_column_attrs(model: Type[db.Entity]) -> List[Attribute]:
+    return [attr for attr in model._attrs_ if attr.columns and not attr.is_collection]
+
+
+def _get_default_value(attr: Attribute) -> Any:
+    if attr.is_pk and attr.auto and attr.py_type is uuid.UUID:
+        return uuid.uuid4()
+    return attr.default() if callable(attr.default) else attr.default
+
+
+def _to_sql_value(attr: Attribute, row: dict) -> Any:
+    value = row[attr.name] if attr.name in row else _get_default_value(attr)
+
+    if isinstance(value, db.Entity):
+        value = value.get_pk()
+    elif isinstance(value, datetime):
+        value = to_utc(value).replace(tzinfo=None)
+
+    if value is None:
+        if attr.is_required and not attr.auto:
+            raise ValueError(f"Attribute {attr} is required")
+        return "" if attr.is_string and not attr.nullable else None
+
+    converter = attr.converters[0]
+    return converter.py2sql(converter.validate(value, None))
+
+
+def bulk_insert(model: Type[db.Entity], rows: Iterable[dict]) -> int:
+    # The rows are written with plain INSERT statements and do not enter the db_session cache.
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    attrs = _get_column_attrs(model)
+    quote_name = db.provider.quote_name
+    columns = ", ".join(quote_name(column) for attr in attrs for column in attr.columns)
+    rows_per_statement = max(1, MAX_STATEMENT_PARAMETERS // len(attrs))
+
+    for offset in range(0, len(rows), rows_per_statement):
+        arguments = {}
+        placeholders = []
+
+        for row_index, row in enumerate(rows[offset : offset + rows_per_statement]):
+            row_placeholders = []
+            for attr_index, attr in enumerate(attrs):
+                argument_name = f"value_{row_index}_{attr_index}"
+                arguments[argument_name] = _to_sql_value(attr, row)
+                row_placeholders.append(f"${argument_name}")
+            placeholders.append(f"({', '.join(row_placeholders)})")
+
+        db.execute(f"INSERT INTO {quote_name(model._table_)} ({columns}) VALUES {', '.join(placeholders)}", arguments)
+    return len(rows)
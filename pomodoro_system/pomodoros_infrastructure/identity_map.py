@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from foundation.models import db
+
+E = TypeVar("E")
+
+
+@dataclass
+class IdentityMapEntry:
+    entity: Any
+    orm_object: db.Entity
+    persisted_values: dict
+
+
+class IdentityMap:
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[type, Any], IdentityMapEntry] = {}
+
+    def _get_entry(self, entity: Any) -> Optional[IdentityMapEntry]:
+        entry = self._entries.get((type(entity), entity.id))
+        if entry is not None and entry.entity is entity:
+            return entry
+
+    def get(self, entity_type: Type[E], entity_id: Any) -> Optional[E]:
+        entry = self._entries.get((entity_type, entity_id))
+        if entry is not None:
+            return entry.entity
+
+    def add(self, entity: Any, orm_object: db.Entity, persisted_values: dict) -> None:
+        self._entries[(type(entity), entity.id)] = IdentityMapEntry(entity, orm_object, persisted_values)
+
+    def get_orm_object(self, entity: Any) -> Optional[db.Entity]:
+        entry = self._get_entry(entity)
+        if entry is not None:
+            return entry.orm_object
+
+    def get_changes(self, entity: Any, values: dict) -> dict:
+        persisted_values = self._get_entry(entity).persisted_values
+        return {
+            key: value for key, value in values.items() if key not in persisted_values or persisted_values[key] != value
+        }
+
+    def mark_clean(self, entity: Any, values: dict) -> None:
+        self._get_entry(entity).persisted_values.update(values)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,5 +1,16 @@
-__all__ = ["ProjectModel", "TaskModel", "SubTaskModel", "PauseModel", "PomodoroModel"]
+__all__ = [
+    "ProjectModel",
+    "TaskModel",
+    "SubTaskModel",
+    "PauseModel",
+    "PomodoroModel",
+    "PomodoroEventModel",
+    "DailyStatsModel",
+    "TaskSearchDocumentModel",
+]
 
-from pomodoros_infrastructure.models.date_frame import PauseModel, PomodoroModel
+from pomodoros_infrastructure.models.date_frame import PauseModel, PomodoroEventModel, PomodoroModel
 from pomodoros_infrastructure.models.project import ProjectModel
+from pomodoros_infrastructure.models.search import TaskSearchDocumentModel
+from pomodoros_infrastructure.models.stats import DailyStatsModel
 from pomodoros_infrastructure.models.task import SubTaskModel, TaskModel
@@ -1,8 +1,8 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from foundation.models import db
-from pomodoros.domain.value_objects import FrameType
+from foundation.models import db, index_registry
+from pomodoros.domain.value_objects import FrameType, PomodoroState
 from pony.orm import Optional, PrimaryKey, Required, Set
 
 
@@ -13,10 +13,20 @@ class PomodoroModel(db.Entity):
     frame_type = Required(int, default=FrameType.TYPE_POMODORO.value)
     start_date = Required(datetime)
     end_date = Optional(datetime)
+    state = Required(int, default=PomodoroState.RUNNING.value)
+    paused_duration = Required(timedelta, default=timedelta(0))
+    due_date = Optional(datetime, index=True)
     task = Required("TaskModel")
+    # Optional until 'flask tasks backfill_owner_id' has owned the rows created before the column, Required after.
+    owner_id = Optional(uuid.UUID, index=True)
     contained_pauses = Set(lambda: PauseModel)
 
 
+index_registry.register(PomodoroModel, "task", "start_date")
+index_registry.register(PomodoroModel, "owner_id", "end_date")
+index_registry.register(PomodoroModel, "owner_id", "state", where=f"state != {PomodoroState.FINISHED.value}")
+
+
 class PauseModel(db.Entity):
     _table_ = "pauses"
 
@@ -25,3 +35,18 @@ class PauseModel(db.Entity):
     start_date = Required(datetime)
     end_date = Optional(datetime)
     pomodoro = Required(PomodoroModel)
+
+
+class PomodoroEventModel(db.Entity):
+    _table_ = "pomodoro_events"
+
+    id = PrimaryKey(int, auto=True)
+    pomodoro_id = Required(uuid.UUID, index=True)
+    type = Required(int)
+    date = Required(datetime)
+    pause_id = Optional(uuid.UUID)
+    due_date = Optional(datetime)
+    folded = Required(bool, default=False)
+
+
+index_registry.register(PomodoroEventModel, "folded", "pomodoro_id")
@@ -0,0 +1,44 @@
+import uuid
+
+from foundation.models import db, index_registry
+from foundation.models.indexes import POSTGRES_DIALECT, SQLITE_DIALECT
+from pony.orm import LongStr, Optional, PrimaryKey, Required
+
+
+class TaskSearchDocumentModel(db.Entity):
+    _table_ = "task_search_documents"
+
+    task_id = PrimaryKey(uuid.UUID, auto=False)
+    owner_id = Required(uuid.UUID, index=True)
+    content = Optional(LongStr, lazy=False)
+
+
+index_registry.register_statements(
+    POSTGRES_DIALECT,
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_task_search_documents__content_tsvector "
+    "ON task_search_documents USING gin (to_tsvector('simple', content))",
+    "CREATE INDEX IF NOT EXISTS idx_task_search_documents__content_trigram "
+    "ON task_search_documents USING gin (content gin_trgm_ops)",
+)
+index_registry.register_statements(
+    SQLITE_DIALECT,
+    "CREATE VIRTUAL TABLE IF NOT EXISTS task_search_fts "
+    "USING fts5(owner_id, content, tokenize = 'unicode61 remove_diacritics 2')",
+    """
+    CREATE TRIGGER IF NOT EXISTS task_search_documents_after_insert AFTER INSERT ON task_search_documents BEGIN
+        INSERT INTO task_search_fts (rowid, owner_id, content) VALUES (new.rowid, hex(new.owner_id), new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_search_documents_after_update AFTER UPDATE ON task_search_documents BEGIN
+        DELETE FROM task_search_fts WHERE rowid = old.rowid;
+        INSERT INTO task_search_fts (rowid, owner_id, content) VALUES (new.rowid, hex(new.owner_id), new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_search_documents_after_delete AFTER DELETE ON task_search_documents BEGIN
+        DELETE FROM task_search_fts WHERE rowid = old.rowid;
+    END
+    """,
+)
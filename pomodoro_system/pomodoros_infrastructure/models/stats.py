@@ -0,0 +1,19 @@
+import uuid
+from datetime import date
+
+from foundation.models import db
+from pony.orm import PrimaryKey, Required, composite_key
+
+
+class DailyStatsModel(db.Entity):
+    _table_ = "daily_stats"
+
+    id = PrimaryKey(int, auto=True)
+    owner_id = Required(uuid.UUID)
+    day = Required(date)
+    project_id = Required(uuid.UUID)
+    task_id = Required(uuid.UUID)
+    completed_pomodoros = Required(int, default=0)
+    focus_seconds = Required(int, default=0)
+    pause_seconds = Required(int, default=0)
+    composite_key(owner_id, day, project_id, task_id)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timedelta
 
-from foundation.models import db
+from foundation.models import db, index_registry
 from pomodoros.domain.value_objects import TaskStatus
 from pony.orm import LongStr, Optional, PrimaryKey, Required, Set
 
@@ -11,6 +11,8 @@ class TaskModel(db.Entity):
 
     id = PrimaryKey(uuid.UUID, auto=False)
     project = Required("ProjectModel")
+    # Optional until 'flask tasks backfill_owner_id' has owned the rows created before the column, Required after.
+    owner_id = Optional(uuid.UUID, index=True)
     name = Required(str, max_len=128)
     status = Required(int)
     priority_color = Required(str, max_len=7)
@@ -24,7 +26,9 @@ class TaskModel(db.Entity):
     longer_break_length = Optional(timedelta)
     gap_between_long_breaks = Optional(int)
     reminder_date = Optional(datetime)
+    pending_reminder_date = Optional(datetime, index=True)
     renewal_interval = Optional(timedelta)
+    pending_renewal_date = Optional(datetime, index=True)
     note = Optional(LongStr, lazy=False)
     created_at = Required(datetime)
     sub_tasks = Set("SubTaskModel", cascade_delete=True)
@@ -35,6 +39,11 @@ class TaskModel(db.Entity):
         return self.status == TaskStatus.ACTIVE.value
 
 
+index_registry.register(TaskModel, "project", "status", "name")
+index_registry.register(TaskModel, "due_date")
+index_registry.register(TaskModel, "owner_id", "due_date")
+
+
 class SubTaskModel(db.Entity):
     _table_ = "sub_tasks"
 
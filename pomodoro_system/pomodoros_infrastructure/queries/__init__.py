@@ -1,4 +1,25 @@
-__all__ = ["SQLGetRecentPomodoros", "SQLGetTaskListByOwnerId", "SQLGetRecentTasksByProjectId"]
+__all__ = [
+    "SQLGetRecentPomodoros",
+    "SQLGetActivePomodoro",
+    "SQLGetOverduePomodoros",
+    "SQLGetEventSourcedOverduePomodoros",
+    "SQLGetTaskListByOwnerId",
+    "SQLClaimDueTaskReminders",
+    "SQLGetRecentTasksByProjectId",
+    "SQLGetPomodoroStats",
+    "SQLSearchTasksByOwnerId",
+]
 
-from .pomodoros import SQLGetRecentPomodoros
-from .tasks import SQLGetRecentTasksByProjectId, SQLGetTaskListByOwnerId
+from .pomodoros import (
+    SQLGetActivePomodoro,
+    SQLGetEventSourcedOverduePomodoros,
+    SQLGetOverduePomodoros,
+    SQLGetRecentPomodoros,
+)
+from .stats import SQLGetPomodoroStats
+from .tasks import (
+    SQLClaimDueTaskReminders,
+    SQLGetRecentTasksByProjectId,
+    SQLGetTaskListByOwnerId,
+    SQLSearchTasksByOwnerId,
+)
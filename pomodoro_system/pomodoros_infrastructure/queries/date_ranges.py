@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+import pytz
+from pony.orm.core import Attribute, Query  # noqa
+
+
+@dataclass(frozen=True)
+class DateRange:
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @staticmethod
+    def _get_day_start(day: date) -> datetime:
+        return datetime.combine(day, time.min, tzinfo=pytz.UTC)
+
+    @classmethod
+    def for_day(cls, day: date) -> "DateRange":
+        day_start = cls._get_day_start(day)
+        return cls(start=day_start, end=day_start + timedelta(days=1))
+
+    @classmethod
+    def after_day(cls, day: date) -> "DateRange":
+        return cls(start=cls._get_day_start(day + timedelta(days=1)))
+
+    @classmethod
+    def until_day_end(cls, day: date) -> "DateRange":
+        return cls(end=cls._get_day_start(day + timedelta(days=1)))
+
+    def filter_query(self, query: Query, attr: Attribute) -> Query:
+        start, end = self.start, self.end
+        attr_name = attr.name
+
+        if start is not None:
+            query = query.filter(f"lambda item: item.{attr_name} >= start", {"start": start})
+        if end is not None:
+            query = query.filter(f"lambda item: item.{attr_name} < end", {"end": end})
+        return query
@@ -1,32 +1,121 @@
 from datetime import datetime
-from typing import List, Type
+from itertools import chain
+from typing import List, Optional, Tuple
 
 import pytz
-from pomodoros import GetRecentPomodoros, TaskId
+from foundation.utils import with_tzinfo
+from foundation.value_objects import UserId
+from pomodoros import (
+    GetActivePomodoro,
+    GetOverduePomodoros,
+    GetRecentPomodoros,
+    PomodoroId,
+    PomodoroState,
+    QueryOverduePomodoroDto,
+    QueryPomodoroDto,
+)
+from pomodoros.domain.date_frame_index import DateFrameIndex
 from pomodoros.domain.entities.pomodoro import Pomodoro
-from pomodoros_infrastructure.models import PomodoroModel
+from pomodoros_infrastructure.models import PomodoroEventModel, PomodoroModel
+from pomodoros_infrastructure.queries.date_ranges import DateRange
 from pomodoros_infrastructure.repositories import SQLPomodoroRepository
+from pony.orm import min as minimum
+from pony.orm import select
+from pony.orm.core import Query  # noqa
 
 
 class SQLGetRecentPomodoros(GetRecentPomodoros):
     @staticmethod
-    def _to_entity(orm_pomodoro: Type[PomodoroModel]) -> Pomodoro:
-        return SQLPomodoroRepository.to_domain_entity(orm_pomodoro)
+    def _get_recent_pomodoros(owner_id: UserId) -> Query:
+        today = DateRange.for_day(datetime.now(tz=pytz.UTC).date())
+        today_start, today_end = today.start, today.end
+        return PomodoroModel.select(
+            lambda pomodoro: pomodoro.owner_id == owner_id
+            and pomodoro.end_date >= today_start
+            and pomodoro.start_date < today_end
+        ).sort_by(PomodoroModel.start_date)
 
-    @staticmethod
-    def _is_finished(pomodoro_model: Type[PomodoroModel]) -> bool:
-        return pomodoro_model.start_date and pomodoro_model.end_date
+    def query(self, owner_id: UserId) -> List[Pomodoro]:
+        return SQLPomodoroRepository.to_domain_entities(self._get_recent_pomodoros(owner_id))
 
     @staticmethod
-    def _is_from_today(pomodoro_model: Type[PomodoroModel], today_date: datetime.date) -> bool:
-        return pomodoro_model.start_date.date() == today_date or pomodoro_model.end_date.date() == today_date
-
-    def query(self, task_id: TaskId) -> List[Pomodoro]:
-        today_date = datetime.now(tz=pytz.UTC).date()
-        recent_orm_pomodoros = PomodoroModel.select(
-            lambda pomodoro: pomodoro.task.id == task_id
-            and self._is_finished(pomodoro)
-            and self._is_from_today(pomodoro, today_date)
+    def _get_recent_date_ranges(owner_id: UserId) -> Query:
+        today = DateRange.for_day(datetime.now(tz=pytz.UTC).date())
+        today_start, today_end = today.start, today.end
+        return select(
+            (pomodoro.start_date, pomodoro.end_date)
+            for pomodoro in PomodoroModel
+            if pomodoro.owner_id == owner_id and pomodoro.end_date >= today_start and pomodoro.start_date < today_end
+        ).order_by(1)
+
+    def query_index(self, owner_id: UserId) -> DateFrameIndex:
+        return DateFrameIndex.from_date_ranges(
+            (with_tzinfo(start_date), with_tzinfo(end_date))
+            for start_date, end_date in self._get_recent_date_ranges(owner_id)
+        )
+
+
+class SQLGetActivePomodoro(GetActivePomodoro):
+    active_states = (PomodoroState.RUNNING.value, PomodoroState.PAUSED.value)
+
+    @classmethod
+    def _get_active_pomodoros(cls, owner_id: UserId) -> Query:
+        active_states = cls.active_states
+        return select(
+            (pomodoro.id, pomodoro.task.id, pomodoro.start_date, pomodoro.state)
+            for pomodoro in PomodoroModel
+            if pomodoro.owner_id == owner_id and pomodoro.state in active_states
         )
 
-        return list(map(lambda orm_pomodoro: self._to_entity(orm_pomodoro), recent_orm_pomodoros))
+    def query(self, owner_id: UserId) -> Optional[QueryPomodoroDto]:
+        active_pomodoro = self._get_active_pomodoros(owner_id).first()
+
+        if active_pomodoro is not None:
+            pomodoro_id, task_id, start_date, state = active_pomodoro
+            return QueryPomodoroDto(
+                id=pomodoro_id, task_id=task_id, start_date=with_tzinfo(start_date), state=PomodoroState(state)
+            )
+
+
+class SQLGetOverduePomodoros(GetOverduePomodoros):
+    @staticmethod
+    def _get_overdue_pomodoros(now: datetime) -> Query:
+        return select(
+            (pomodoro.due_date, pomodoro.id, pomodoro.owner_id)
+            for pomodoro in PomodoroModel
+            if pomodoro.due_date is not None and pomodoro.due_date <= now
+        ).order_by(1)
+
+    def _get_overdue_rows(self, now: datetime, limit: int) -> List[Tuple[datetime, PomodoroId, UserId]]:
+        return self._get_overdue_pomodoros(now).limit(limit)
+
+    def query(self, now: datetime, limit: int) -> List[QueryOverduePomodoroDto]:
+        return [
+            QueryOverduePomodoroDto(id=pomodoro_id, owner_id=owner_id)
+            for _due_date, pomodoro_id, owner_id in self._get_overdue_rows(now, limit)
+        ]
+
+
+class SQLGetEventSourcedOverduePomodoros(SQLGetOverduePomodoros):
+    @staticmethod
+    def _get_overdue_pending_events(now: datetime) -> Query:
+        return select(
+            (minimum(event.due_date), pomodoro.id, pomodoro.owner_id)
+            for event in PomodoroEventModel
+            for pomodoro in PomodoroModel
+            if pomodoro.id == event.pomodoro_id
+            and not event.folded
+            and event.due_date is not None
+            and event.due_date <= now
+        ).order_by(1)
+
+    def _get_overdue_rows(self, now: datetime, limit: int) -> List[Tuple[datetime, PomodoroId, UserId]]:
+        # Due dates of not yet folded events are not in the snapshot, so both are scanned. A superseded due date
+        # only makes the sweep reschedule the pomodoro.
+        overdue_rows = {}
+        for due_date, pomodoro_id, owner_id in chain(
+            super()._get_overdue_rows(now, limit), self._get_overdue_pending_events(now).limit(limit)
+        ):
+            if pomodoro_id not in overdue_rows or due_date < overdue_rows[pomodoro_id][0]:
+                overdue_rows[pomodoro_id] = (due_date, pomodoro_id, owner_id)
+        return sorted(overdue_rows.values())[:limit]
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Callable, Generic, Iterable, List, Tuple, TypeVar, Union
+
+from pony.orm import select
+from pony.orm.core import Query  # noqa
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Projection(Generic[T]):
+    columns: Tuple[str, ...]
+    to_dto: Callable[..., T]
+
+    def _select_rows(self, query: Query) -> Iterable[tuple]:
+        selected_columns = ", ".join(f"item.{column}" for column in self.columns)
+        return select(f"({selected_columns},) for item in query", {"query": query})
+
+    def fetch(self, source: Union[Query, List]) -> List[T]:
+        if isinstance(source, Query):
+            rows = self._select_rows(source)
+        else:
+            get_row = attrgetter(*self.columns)
+            rows = (get_row(orm_object) for orm_object in source)
+            if len(self.columns) == 1:
+                rows = ((value,) for value in rows)
+
+        return [self.to_dto(*row) for row in rows]
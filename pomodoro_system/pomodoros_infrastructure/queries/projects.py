@@ -1,10 +1,11 @@
-from typing import List, Type
+from typing import Iterator, List, Type
 
 from foundation.value_objects import UserId
 from pomodoros.application.queries.projects import GetProjectsByOwnerId
 from pomodoros.domain.entities import Project
 from pomodoros_infrastructure.models.project import ProjectModel
 from pomodoros_infrastructure.repositories.projects import SQLProjectRepository
+from pony.orm.core import Query  # noqa
 from web_app.mixins import PaginatedQueryMixin, SortedQueryMixin
 
 
@@ -13,9 +14,16 @@ class SQLGetProjectsByOwnerId(SortedQueryMixin, PaginatedQueryMixin, GetProjects
     def _to_entity(orm_project: Type[ProjectModel]) -> Project:
         return SQLProjectRepository.to_domain_entity(orm_project)
 
-    def query(self, owner_id: UserId) -> List[Project]:
-        orm_projects = ProjectModel.select(lambda project: not project.is_removed and project.owner.id == owner_id)
+    def _get_project_query(self, owner_id: UserId) -> Query:
+        return self.get_sorted_query(
+            ProjectModel.select(lambda project: not project.is_removed and project.owner.id == owner_id)
+        )
 
-        orm_projects = self.get_paginated_query(self.get_sorted_query(orm_projects))
+    def query(self, owner_id: UserId) -> List[Project]:
+        orm_projects = self.get_paginated_query(self._get_project_query(owner_id), ProjectModel)
 
         return list(map(lambda project: self._to_entity(project), orm_projects))
+
+    def iterate(self, owner_id: UserId, chunk_size: int = 500) -> Iterator[Project]:
+        for orm_projects in self.iterate_in_chunks(self._get_project_query(owner_id), ProjectModel, chunk_size):
+            yield from map(lambda project: self._to_entity(project), orm_projects)
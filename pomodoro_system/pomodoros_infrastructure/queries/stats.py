@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Dict, List
+
+from foundation.value_objects import UserId
+from pomodoros import GetPomodoroStats, QueryStatsDto, StatsGranularity
+from pomodoros_infrastructure.models import DailyStatsModel
+from pony.orm import select
+from pony.orm import sum as total
+
+
+class SQLGetPomodoroStats(GetPomodoroStats):
+    @staticmethod
+    def _get_period_start(day: date, granularity: StatsGranularity) -> date:
+        if granularity == StatsGranularity.WEEK:
+            return date.fromordinal(day.toordinal() - day.weekday())
+        elif granularity == StatsGranularity.MONTH:
+            return day.replace(day=1)
+        return day
+
+    def query(
+        self, owner_id: UserId, date_from: date, date_to: date, granularity: StatsGranularity
+    ) -> List[QueryStatsDto]:
+        daily_totals = select(
+            (row.day, total(row.completed_pomodoros), total(row.focus_seconds), total(row.pause_seconds))
+            for row in DailyStatsModel
+            if row.owner_id == owner_id and row.day >= date_from and row.day <= date_to
+        ).order_by(1)
+
+        periods: Dict[date, QueryStatsDto] = {}
+        for day, completed_pomodoros, focus_seconds, pause_seconds in daily_totals:
+            period_start = self._get_period_start(day, granularity)
+            period = periods.setdefault(period_start, QueryStatsDto(period_start, 0, 0, 0))
+            period.completed_pomodoros += completed_pomodoros
+            period.focus_seconds += focus_seconds
+            period.pause_seconds += pause_seconds
+
+        return list(periods.values())
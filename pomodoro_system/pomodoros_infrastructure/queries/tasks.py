@@ -1,45 +1,54 @@
+import re
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Type
+from typing import Iterator, List, Tuple
 
+import pytz
+from foundation.interfaces import Paginator
+from foundation.models import db
+from foundation.models.indexes import POSTGRES_DIALECT
+from foundation.utils import with_tzinfo
 from foundation.value_objects import UserId
-from pomodoros import GetTaskListByOwnerId, ProjectId, QueryTaskDto
+from pomodoros import (
+    ClaimDueTaskReminders,
+    GetTaskListByOwnerId,
+    ProjectId,
+    QueryTaskDto,
+    QueryTaskReminderDto,
+    SearchTasksByOwnerId,
+    TaskId,
+)
 from pomodoros.application.queries.tasks import GetRecentTasksByProjectId
 from pomodoros.domain.entities import Task
 from pomodoros.domain.value_objects import TaskStatus
-from pomodoros_infrastructure.models import TaskModel
+from pomodoros_infrastructure.models import ProjectModel, TaskModel, TaskSearchDocumentModel
+from pomodoros_infrastructure.queries.date_ranges import DateRange
+from pomodoros_infrastructure.queries.projections import Projection
 from pomodoros_infrastructure.repositories.tasks import SQLTaskRepository
 from pony.orm import max as maximum
+from pony.orm import select
 from pony.orm.core import Query  # noqa
 from web_app.mixins import FilteredQueryMixin, PaginatedQueryMixin, SortedQueryMixin
 
 
-class SQLGetRecentTasksByProjectId(GetRecentTasksByProjectId):
-    @staticmethod
-    def _to_query_dto(task_model: Type[TaskModel]) -> QueryTaskDto:
-        return QueryTaskDto(
-            id=task_model.id,
-            name=task_model.name,
-            status=TaskStatus(task_model.status),
-            project_id=task_model.project.id,
-        )
+def _to_query_task_dto(task_id: TaskId, name: str, status: int, project_id: ProjectId) -> QueryTaskDto:
+    return QueryTaskDto(id=task_id, name=name, status=TaskStatus(status), project_id=project_id)
 
-    @staticmethod
-    def _is_from_most_recent_due_date(due_date: datetime, most_recent_due_date: datetime) -> bool:
-        return due_date.date() == most_recent_due_date.date()
 
+query_task_dto_projection = Projection(columns=("id", "name", "status", "project.id"), to_dto=_to_query_task_dto)
+
+
+class SQLGetRecentTasksByProjectId(GetRecentTasksByProjectId):
     def query(self, project_id: ProjectId, return_full_entity: bool = False) -> List[QueryTaskDto]:
         most_recent_due_date = maximum(task.due_date for task in TaskModel if task.project.id == project_id)
         if not most_recent_due_date:
             return []
 
-        recent_tasks = TaskModel.select(
-            lambda task: task.project.id == project_id
-            and task.is_active
-            and self._is_from_most_recent_due_date(task.due_date, most_recent_due_date)
+        recent_tasks = DateRange.for_day(most_recent_due_date.date()).filter_query(
+            TaskModel.select(lambda task: task.project.id == project_id and task.is_active), TaskModel.due_date
         )
 
-        return list(map(lambda task: self._to_query_dto(task), recent_tasks))
+        return query_task_dto_projection.fetch(recent_tasks)
 
 
 class DueDateFilter(Enum):
@@ -50,59 +59,38 @@ class DueDateFilter(Enum):
 
 
 class SQLGetTaskListByOwnerId(FilteredQueryMixin, PaginatedQueryMixin, SortedQueryMixin, GetTaskListByOwnerId):
-    @staticmethod
-    def _to_dto(orm_task: Type[TaskModel]) -> QueryTaskDto:
-        return QueryTaskDto(
-            id=orm_task.id,
-            name=orm_task.name,
-            status=TaskStatus(orm_task.status),
-            project_id=orm_task.project.id,
-        )
-
-    @staticmethod
-    def _to_full_entity(orm_task: Type[TaskModel]) -> Task:
-        return SQLTaskRepository.to_domain_entity(orm_task)
-
     @staticmethod
     def _is_owner(task_owner_id: UserId, current_user_id: UserId) -> bool:
         return task_owner_id == current_user_id
 
     def _get_basic_task_list(self, owner_id: UserId) -> Query:
-        return TaskModel.select(lambda task: self._is_owner(task.project.owner.id, owner_id))
+        return TaskModel.select(lambda task: self._is_owner(task.owner_id, owner_id))
+
+    def _get_task_list_in_date_range(self, owner_id: UserId, date_range: DateRange) -> Query:
+        return date_range.filter_query(self._get_basic_task_list(owner_id), TaskModel.due_date)
 
     def _get_recent_task_list(self, owner_id: UserId) -> Query:
-        today = datetime.utcnow()
+        today = datetime.now(tz=pytz.UTC).date()
         most_recent_due_date = maximum(
-            task.due_date
-            for task in TaskModel
-            if self._is_owner(task.project.owner.id, owner_id) and task.due_date.date() <= today.date()
+            task.due_date for task in self._get_task_list_in_date_range(owner_id, DateRange.until_day_end(today))
         )
 
         if not most_recent_due_date:
             return []
 
-        return TaskModel.select(
-            lambda task: self._is_owner(task.project.owner.id, owner_id)
-            and task.due_date.date() == most_recent_due_date.date()
-        )
+        return self._get_task_list_in_date_range(owner_id, DateRange.for_day(most_recent_due_date.date()))
 
     def _get_task_list_for_today(self, owner_id: UserId) -> Query:
-        today = datetime.utcnow()
-        return TaskModel.select(
-            lambda task: self._is_owner(task.project.owner.id, owner_id) and task.due_date.date() == today.date()
-        )
+        today = datetime.now(tz=pytz.UTC).date()
+        return self._get_task_list_in_date_range(owner_id, DateRange.for_day(today))
 
     def _get_task_list_for_tomorrow(self, owner_id: UserId) -> Query:
-        tomorrow = datetime.utcnow() + timedelta(days=1)
-        return TaskModel.select(
-            lambda task: self._is_owner(task.project.owner.id, owner_id) and task.due_date.date() == tomorrow.date()
-        )
+        tomorrow = datetime.now(tz=pytz.UTC).date() + timedelta(days=1)
+        return self._get_task_list_in_date_range(owner_id, DateRange.for_day(tomorrow))
 
     def _get_upcoming_task_list(self, owner_id: UserId) -> Query:
-        tomorrow = datetime.utcnow() + timedelta(days=1)
-        return TaskModel.select(
-            lambda task: self._is_owner(task.project.owner.id, owner_id) and task.due_date.date() > tomorrow.date()
-        )
+        tomorrow = datetime.now(tz=pytz.UTC).date() + timedelta(days=1)
+        return self._get_task_list_in_date_range(owner_id, DateRange.after_day(tomorrow))
 
     def _get_task_list_for_due_date(self, owner_id: UserId, rule: DueDateFilter) -> Query:
         task_query = None
@@ -118,8 +106,7 @@ class SQLGetTaskListByOwnerId(FilteredQueryMixin, PaginatedQueryMixin, SortedQue
 
         return task_query
 
-    def query(self, owner_id: UserId, return_full_entity: bool = False, **kwargs) -> List[QueryTaskDto]:
-        filter_fields: dict = kwargs.get("filter_fields", {}) or {}
+    def _get_task_query(self, owner_id: UserId, filter_fields: dict) -> Query:
         due_date_rule = filter_fields.pop("due_date_rule", None)
 
         if due_date_rule is None:
@@ -127,8 +114,122 @@ class SQLGetTaskListByOwnerId(FilteredQueryMixin, PaginatedQueryMixin, SortedQue
         else:
             task_query = self._get_task_list_for_due_date(owner_id=owner_id, rule=due_date_rule)
 
-        task_query = self.get_paginated_query(self.get_sorted_query(self.get_filtered_query(task_query, filter_fields)))
+        return self.get_sorted_query(self.get_filtered_query(task_query, filter_fields))
+
+    def query(self, owner_id: UserId, return_full_entity: bool = False, **kwargs) -> List[QueryTaskDto]:
+        filter_fields: dict = kwargs.get("filter_fields", {}) or {}
+        task_query = self.get_paginated_query(self._get_task_query(owner_id, filter_fields), TaskModel)
 
         if return_full_entity:
-            return list(map(lambda task: self._to_full_entity(task), task_query))
-        return list(map(lambda task: self._to_dto(task), task_query))
+            return SQLTaskRepository.to_domain_entities(task_query)
+        return query_task_dto_projection.fetch(task_query)
+
+    def iterate(self, owner_id: UserId, chunk_size: int = 500, **kwargs) -> Iterator[Task]:
+        filter_fields: dict = kwargs.get("filter_fields", {}) or {}
+
+        for orm_tasks in self.iterate_in_chunks(self._get_task_query(owner_id, filter_fields), TaskModel, chunk_size):
+            yield from SQLTaskRepository.to_domain_entities(orm_tasks)
+
+
+class SQLSearchTasksByOwnerId(PaginatedQueryMixin, SearchTasksByOwnerId):
+    postgres_search_sql = """
+        SELECT documents.task_id FROM task_search_documents documents
+        JOIN tasks ON tasks.id = documents.task_id
+        JOIN projects ON projects.id = tasks.project
+        WHERE documents.owner_id = $owner_id AND projects.deleted_at IS NULL AND (
+            to_tsvector('simple', documents.content) @@ plainto_tsquery('simple', $phrase)
+            OR documents.content ILIKE $pattern
+        )
+        ORDER BY
+            ts_rank(to_tsvector('simple', documents.content), plainto_tsquery('simple', $phrase)) DESC,
+            similarity(documents.content, $phrase) DESC,
+            tasks.created_at DESC
+        LIMIT $limit OFFSET $offset
+    """
+    sqlite_search_sql = """
+        SELECT documents.task_id FROM task_search_fts
+        JOIN task_search_documents documents ON documents.rowid = task_search_fts.rowid
+        JOIN tasks ON tasks.id = documents.task_id
+        JOIN projects ON projects.id = tasks.project
+        WHERE task_search_fts MATCH $match_expression AND projects.deleted_at IS NULL
+        ORDER BY bm25(task_search_fts, 0.0, 1.0), tasks.created_at DESC
+        LIMIT $limit OFFSET $offset
+    """
+
+    @staticmethod
+    def _get_search_terms(phrase: str) -> List[str]:
+        return re.findall(r"\w+", phrase)
+
+    @staticmethod
+    def _get_like_pattern(phrase: str) -> str:
+        escaped_phrase = re.sub(r"([\\%_])", r"\\\1", phrase.strip())
+        return f"%{escaped_phrase}%"
+
+    def _get_limit_and_offset(self) -> Tuple[int, int]:
+        paginator = self.get_paginator() or Paginator(page=1)
+        return paginator.page_size, (paginator.page - 1) * paginator.page_size
+
+    def _search_task_ids(self, owner_id: UserId, phrase: str, search_terms: List[str]) -> List[TaskId]:
+        limit, offset = self._get_limit_and_offset()
+
+        if db.provider.dialect == POSTGRES_DIALECT:
+            cursor = db.execute(
+                self.postgres_search_sql,
+                {
+                    "owner_id": TaskSearchDocumentModel.owner_id.converters[0].py2sql(owner_id),
+                    "phrase": phrase,
+                    "pattern": self._get_like_pattern(phrase),
+                    "limit": limit,
+                    "offset": offset,
+                },
+            )
+        else:
+            prefix_terms = " ".join(f'"{term}"*' for term in search_terms)
+            cursor = db.execute(
+                self.sqlite_search_sql,
+                {
+                    "match_expression": f'owner_id : "{owner_id.hex}" AND content : ({prefix_terms})',
+                    "limit": limit,
+                    "offset": offset,
+                },
+            )
+
+        converter = TaskSearchDocumentModel.task_id.converters[0]
+        return [converter.sql2py(task_id) for task_id, in cursor.fetchall()]
+
+    def query(self, owner_id: UserId, phrase: str) -> List[Task]:
+        search_terms = self._get_search_terms(phrase)
+        if not search_terms:
+            return []
+
+        task_ids = self._search_task_ids(owner_id, phrase, search_terms)
+        orm_tasks = TaskModel.select(lambda task: task.id in task_ids)
+        tasks_by_id = {task.id: task for task in SQLTaskRepository.to_domain_entities(orm_tasks)}
+        return [tasks_by_id[task_id] for task_id in task_ids if task_id in tasks_by_id]
+
+
+class SQLClaimDueTaskReminders(ClaimDueTaskReminders):
+    def query(self, now: datetime, limit: int) -> List[QueryTaskReminderDto]:
+        claimed_tasks = (
+            TaskModel.select(lambda task: task.pending_reminder_date is not None and task.pending_reminder_date <= now)
+            .order_by(TaskModel.pending_reminder_date)
+            .for_update(skip_locked=True)[:limit]
+        )
+        project_ids = list({orm_task.project.id for orm_task in claimed_tasks})
+        owner_emails = dict(
+            select((project.id, project.owner.email) for project in ProjectModel if project.id in project_ids)
+        )
+
+        reminders = []
+        for orm_task in claimed_tasks:
+            orm_task.pending_reminder_date = None
+            if orm_task.is_active:
+                reminders.append(
+                    QueryTaskReminderDto(
+                        task_id=orm_task.id,
+                        task_name=orm_task.name,
+                        reminder_date=with_tzinfo(orm_task.reminder_date),
+                        owner_email=owner_emails[orm_task.project.id],
+                    )
+                )
+        return reminders
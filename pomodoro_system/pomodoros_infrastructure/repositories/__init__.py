@@ -1,11 +1,15 @@
 __all__ = [
     "SQLPauseRepository",
     "SQLPomodoroRepository",
+    "SQLEventSourcedPomodoroRepository",
     "SQLProjectRepository",
+    "SQLStatsRepository",
     "SQLTaskRepository",
 ]
 
 from .pauses import SQLPauseRepository
+from .pomodoro_events import SQLEventSourcedPomodoroRepository
 from .pomodoros import SQLPomodoroRepository
 from .projects import SQLProjectRepository
+from .stats import SQLStatsRepository
 from .tasks import SQLTaskRepository
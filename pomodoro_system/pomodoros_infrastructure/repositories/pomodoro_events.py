@@ -0,0 +1,173 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from foundation.exceptions import NotFound
+from foundation.i18n import N_
+from foundation.utils import to_utc, with_tzinfo
+from foundation.value_objects import UserId
+from pomodoros import PomodoroEvent, PomodoroEventType, PomodoroId
+from pomodoros.domain.entities.pause import Pause
+from pomodoros.domain.entities.pomodoro import Pomodoro
+from pomodoros_infrastructure.models import PauseModel, PomodoroEventModel, PomodoroModel
+from pomodoros_infrastructure.repositories.pomodoros import SQLPomodoroRepository
+from pony.orm import ObjectNotFound, flush, select
+
+
+class SQLEventSourcedPomodoroRepository(SQLPomodoroRepository):
+    @staticmethod
+    def to_domain_event(orm_event: Type[PomodoroEventModel]) -> PomodoroEvent:
+        return PomodoroEvent(
+            type=PomodoroEventType(orm_event.type),
+            date=with_tzinfo(orm_event.date),
+            pause_id=orm_event.pause_id,
+        )
+
+    @staticmethod
+    def _append_events(pomodoro_entity: Pomodoro, folded: bool = False) -> List[Type[PomodoroEventModel]]:
+        return [
+            PomodoroEventModel(
+                pomodoro_id=pomodoro_entity.id,
+                type=event.type.value,
+                date=to_utc(event.date).replace(tzinfo=None),
+                pause_id=event.pause_id,
+                due_date=to_utc(pomodoro_entity.due_date),
+                folded=folded,
+            )
+            for event in pomodoro_entity.new_events
+        ]
+
+    @staticmethod
+    def _get_pending_events(
+        pomodoro_ids: List[PomodoroId], for_update: bool = False
+    ) -> Dict[PomodoroId, List[Type[PomodoroEventModel]]]:
+        pending_events = PomodoroEventModel.select(
+            lambda event: not event.folded and event.pomodoro_id in pomodoro_ids
+        ).order_by(PomodoroEventModel.id)
+        if for_update:
+            pending_events = pending_events.for_update()
+
+        events_by_pomodoro_id = defaultdict(list)
+        for orm_event in pending_events:
+            events_by_pomodoro_id[orm_event.pomodoro_id].append(orm_event)
+        return events_by_pomodoro_id
+
+    def _to_current_domain_entity(
+        self,
+        orm_pomodoro: Type[PomodoroModel],
+        pending_events: List[Type[PomodoroEventModel]],
+        contained_pauses: Optional[List[Pause]] = None,
+    ) -> Pomodoro:
+        pomodoro = self.to_domain_entity(orm_pomodoro, contained_pauses)
+        for orm_event in pending_events:
+            pomodoro.apply_event(self.to_domain_event(orm_event))
+        # Every appended event carries the due date the pomodoro had when it was saved, so the latest one wins.
+        pomodoro.due_date = with_tzinfo(pending_events[-1].due_date if pending_events else orm_pomodoro.due_date)
+        return pomodoro
+
+    @staticmethod
+    def _write_snapshot(orm_pomodoro: Type[PomodoroModel], pomodoro: Pomodoro) -> None:
+        orm_pomodoro.set(
+            start_date=to_utc(pomodoro.start_date),
+            end_date=to_utc(pomodoro.end_date),
+            state=pomodoro.state.value,
+            paused_duration=pomodoro.paused_duration,
+            due_date=to_utc(pomodoro.due_date),
+        )
+
+        snapshot_pause_ids = {orm_pause.id for orm_pause in orm_pomodoro.contained_pauses}
+        for pause in pomodoro.contained_pauses:
+            if pause.id in snapshot_pause_ids:
+                PauseModel.get_for_update(id=pause.id).end_date = to_utc(pause.end_date)
+            else:
+                PauseModel(
+                    id=pause.id,
+                    frame_type=pause.frame_type.value,
+                    start_date=to_utc(pause.start_date),
+                    end_date=to_utc(pause.end_date),
+                    pomodoro=orm_pomodoro,
+                )
+
+    def _fold_locked_pomodoros(self, orm_pomodoros: Iterable[Type[PomodoroModel]]) -> int:
+        orm_pomodoros = list(orm_pomodoros)
+        pending_events = self._get_pending_events([orm_pomodoro.id for orm_pomodoro in orm_pomodoros], for_update=True)
+
+        folded_pomodoros = 0
+        for orm_pomodoro in orm_pomodoros:
+            orm_events = pending_events[orm_pomodoro.id]
+            if orm_events:
+                self._write_snapshot(orm_pomodoro, self._to_current_domain_entity(orm_pomodoro, orm_events))
+                for orm_event in orm_events:
+                    orm_event.folded = True
+                folded_pomodoros += 1
+        return folded_pomodoros
+
+    def fold_events(self, pomodoro_ids: Iterable[PomodoroId] = None) -> int:
+        if pomodoro_ids is None:
+            pomodoro_ids = select(event.pomodoro_id for event in PomodoroEventModel if not event.folded)[:]
+        pomodoro_ids = list(pomodoro_ids)
+
+        # The rows are locked before the pending events are read, so no event appended meanwhile can be skipped.
+        orm_pomodoros = PomodoroModel.select(lambda pomodoro: pomodoro.id in pomodoro_ids).for_update()[:]
+        return self._fold_locked_pomodoros(orm_pomodoros)
+
+    def replay(self, pomodoro_id: PomodoroId) -> Pomodoro:
+        try:
+            orm_pomodoro = PomodoroModel[pomodoro_id]
+        except ObjectNotFound:
+            raise NotFound(N_("Pomodoro does not exist."))
+
+        pomodoro = Pomodoro(id=orm_pomodoro.id, task_id=orm_pomodoro.task.id)
+        orm_events = PomodoroEventModel.select(lambda event: event.pomodoro_id == pomodoro_id).order_by(
+            PomodoroEventModel.id
+        )
+        for orm_event in orm_events:
+            pomodoro.apply_event(self.to_domain_event(orm_event))
+        return pomodoro
+
+    def get(self, pomodoro_id: PomodoroId) -> Pomodoro:
+        try:
+            orm_pomodoro = PomodoroModel[pomodoro_id]
+        except ObjectNotFound:
+            raise NotFound(N_("Pomodoro does not exist."))
+        else:
+            pending_events = self._get_pending_events([pomodoro_id])
+            return self._to_current_domain_entity(orm_pomodoro, pending_events[pomodoro_id])
+
+    def get_with_owner_id(self, pomodoro_id: PomodoroId, for_update: bool = False) -> Tuple[Pomodoro, Optional[UserId]]:
+        # Pauses and resumes only append events, so the row is never locked up front.
+        orm_pomodoro = PomodoroModel.get(id=pomodoro_id)
+
+        if orm_pomodoro is None:
+            raise NotFound(N_("Pomodoro does not exist."))
+        pending_events = self._get_pending_events([pomodoro_id])
+        return self._to_current_domain_entity(orm_pomodoro, pending_events[pomodoro_id]), orm_pomodoro.owner_id
+
+    def get_many(self, pomodoro_ids: Iterable[PomodoroId]) -> List[Pomodoro]:
+        pomodoro_ids = list(pomodoro_ids)
+        orm_pomodoros = PomodoroModel.select(lambda pomodoro: pomodoro.id in pomodoro_ids)
+        pending_events = self._get_pending_events(pomodoro_ids)
+        pauses_by_pomodoro_id = self.load_pauses(pomodoro_ids)
+        return list(
+            map(
+                lambda orm_pomodoro: self._to_current_domain_entity(
+                    orm_pomodoro, pending_events[orm_pomodoro.id], pauses_by_pomodoro_id[orm_pomodoro.id]
+                ),
+                orm_pomodoros,
+            )
+        )
+
+    def save(self, pomodoro: Pomodoro, create: bool = False) -> None:
+        if create:
+            self._persist_new_orm_pomodoro(pomodoro)
+            self._append_events(pomodoro, folded=True)
+        else:
+            orm_events = self._append_events(pomodoro)
+            if orm_events and not pomodoro.is_finished:
+                return
+
+            flush()
+            orm_pomodoro = self._get_for_update(pomodoro.id)
+            self._fold_locked_pomodoros([orm_pomodoro])
+            if not orm_events:
+                # Only the overdue sweep reschedules a pomodoro without new events, straight into the snapshot.
+                orm_pomodoro.due_date = to_utc(pomodoro.due_date)
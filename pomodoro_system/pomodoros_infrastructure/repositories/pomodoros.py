@@ -1,38 +1,74 @@
-from typing import Optional, Type
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 from foundation.exceptions import AlreadyExists, NotFound
 from foundation.i18n import N_
+from foundation.models import db
 from foundation.utils import to_utc, with_tzinfo
-from pomodoros import PomodoroId, PomodoroRepository
+from foundation.value_objects import UserId
+from pomodoros import PomodoroId, PomodoroRepository, PomodoroState
 from pomodoros.domain.entities.pause import Pause
 from pomodoros.domain.entities.pomodoro import Pomodoro
 from pomodoros_infrastructure import PauseModel
-from pomodoros_infrastructure.models import PomodoroModel
+from pomodoros_infrastructure.identity_map import IdentityMap
+from pomodoros_infrastructure.models import PomodoroModel, TaskModel
 from pony.orm import ObjectNotFound
 
 
 class SQLPomodoroRepository(PomodoroRepository):
+    def __init__(self, identity_map: Optional[IdentityMap] = None) -> None:
+        self.identity_map = identity_map
+
+    @staticmethod
+    def _to_pause_entity(orm_pause: Type[PauseModel]) -> Pause:
+        return Pause(
+            id=orm_pause.id,
+            start_date=with_tzinfo(orm_pause.start_date),
+            end_date=with_tzinfo(orm_pause.end_date),
+        )
+
     @classmethod
-    def to_domain_entity(cls, orm_pomodoro: Type[PomodoroModel]) -> Pomodoro:
+    def to_domain_entity(
+        cls, orm_pomodoro: Type[PomodoroModel], contained_pauses: Optional[List[Pause]] = None
+    ) -> Pomodoro:
         return Pomodoro(
             id=orm_pomodoro.id,
             task_id=orm_pomodoro.task.id,
             start_date=with_tzinfo(orm_pomodoro.start_date),
             end_date=with_tzinfo(orm_pomodoro.end_date),
-            contained_pauses=list(
-                map(
-                    lambda pause_entity: Pause(
-                        id=pause_entity.id,
-                        start_date=with_tzinfo(pause_entity.start_date),
-                        end_date=with_tzinfo(pause_entity.end_date),
-                    ),
-                    orm_pomodoro.contained_pauses,
-                )
+            state=PomodoroState(orm_pomodoro.state),
+            paused_duration=orm_pomodoro.paused_duration,
+            due_date=with_tzinfo(orm_pomodoro.due_date),
+            contained_pauses=(
+                contained_pauses
+                if contained_pauses is not None
+                else list(map(lambda orm_pause: cls._to_pause_entity(orm_pause), orm_pomodoro.contained_pauses))
             ),
         )
 
+    @classmethod
+    def load_pauses(cls, pomodoro_ids: Iterable[PomodoroId]) -> Dict[PomodoroId, List[Pause]]:
+        pomodoro_ids = list(pomodoro_ids)
+        pauses_by_pomodoro_id = defaultdict(list)
+
+        if pomodoro_ids:
+            orm_pauses = PauseModel.select(lambda pause: pause.pomodoro.id in pomodoro_ids).order_by(
+                PauseModel.start_date
+            )
+            for orm_pause in orm_pauses:
+                pauses_by_pomodoro_id[orm_pause.pomodoro.id].append(cls._to_pause_entity(orm_pause))
+        return pauses_by_pomodoro_id
+
+    @classmethod
+    def to_domain_entities(cls, orm_pomodoros: Iterable[Type[PomodoroModel]]) -> List[Pomodoro]:
+        orm_pomodoros = list(orm_pomodoros)
+        pauses_by_pomodoro_id = cls.load_pauses(orm_pomodoro.id for orm_pomodoro in orm_pomodoros)
+        return [
+            cls.to_domain_entity(orm_pomodoro, pauses_by_pomodoro_id[orm_pomodoro.id]) for orm_pomodoro in orm_pomodoros
+        ]
+
     @staticmethod
-    def _persist_new_orm_pomodoro(pomodoro_entity: Pomodoro) -> None:
+    def _persist_new_orm_pomodoro(pomodoro_entity: Pomodoro) -> Type[PomodoroModel]:
         if PomodoroModel.exists(id=pomodoro_entity.id, start_date=pomodoro_entity.start_date):
             raise AlreadyExists(
                 {
@@ -47,8 +83,12 @@ class SQLPomodoroRepository(PomodoroRepository):
                 id=pomodoro_entity.id,
                 frame_type=pomodoro_entity.frame_type.value,
                 task=pomodoro_entity.task_id,
+                owner_id=TaskModel[pomodoro_entity.task_id].owner_id,
                 start_date=to_utc(pomodoro_entity.start_date),
                 end_date=to_utc(pomodoro_entity.end_date),
+                state=pomodoro_entity.state.value,
+                paused_duration=pomodoro_entity.paused_duration,
+                due_date=to_utc(pomodoro_entity.due_date),
             )
             [
                 PauseModel(
@@ -60,28 +100,63 @@ class SQLPomodoroRepository(PomodoroRepository):
                 )
                 for pause in pomodoro_entity.contained_pauses
             ]
+            return orm_pomodoro
 
     @staticmethod
     def _get_for_update(pomodoro_id: PomodoroId) -> Optional[Type[PomodoroModel]]:
         return PomodoroModel.get_for_update(id=pomodoro_id)
 
+    @staticmethod
+    def _get_persisted_values(orm_pomodoro: Type[PomodoroModel]) -> dict:
+        return {
+            "task": orm_pomodoro.task.id,
+            "start_date": with_tzinfo(orm_pomodoro.start_date),
+            "end_date": with_tzinfo(orm_pomodoro.end_date),
+            "state": orm_pomodoro.state,
+            "paused_duration": orm_pomodoro.paused_duration,
+            "due_date": with_tzinfo(orm_pomodoro.due_date),
+        }
+
+    def _get_tracked(self, pomodoro_id: PomodoroId) -> Pomodoro:
+        tracked_pomodoro = self.identity_map.get(Pomodoro, pomodoro_id)
+
+        if tracked_pomodoro is None:
+            orm_pomodoro = self._get_for_update(pomodoro_id)
+            if orm_pomodoro is None:
+                raise NotFound(N_("Pomodoro does not exist."))
+
+            tracked_pomodoro = self.to_domain_entity(orm_pomodoro)
+            self.identity_map.add(tracked_pomodoro, orm_pomodoro, self._get_persisted_values(orm_pomodoro))
+        return tracked_pomodoro
+
     def _update_existing_orm_pomodoro(self, pomodoro_entity: Pomodoro) -> None:
-        values_to_save = {
+        values = {
             "task": pomodoro_entity.task_id,
             "start_date": to_utc(pomodoro_entity.start_date),
             "end_date": to_utc(pomodoro_entity.end_date),
+            "state": pomodoro_entity.state.value,
+            "paused_duration": pomodoro_entity.paused_duration,
+            "due_date": to_utc(pomodoro_entity.due_date),
         }
-        orm_pomodoro = self._get_for_update(pomodoro_entity.id)
+        orm_pomodoro = self.identity_map.get_orm_object(pomodoro_entity) if self.identity_map is not None else None
+
+        if orm_pomodoro is not None:
+            values_to_save = self.identity_map.get_changes(pomodoro_entity, values)
+            self.identity_map.mark_clean(pomodoro_entity, values)
+        else:
+            values_to_save = values
+            orm_pomodoro = self._get_for_update(pomodoro_entity.id)
 
         if orm_pomodoro is not None:
-            orm_pomodoro.set(**values_to_save)
+            if values_to_save:
+                orm_pomodoro.set(**values_to_save)
 
-            if pomodoro_entity.new_pause:
+            for new_pause in pomodoro_entity.new_pauses:
                 orm_pause = PauseModel(
-                    id=pomodoro_entity.new_pause.id,
-                    frame_type=pomodoro_entity.new_pause.frame_type.value,
-                    start_date=to_utc(pomodoro_entity.new_pause.start_date),
-                    end_date=to_utc(pomodoro_entity.new_pause.end_date),
+                    id=new_pause.id,
+                    frame_type=new_pause.frame_type.value,
+                    start_date=to_utc(new_pause.start_date),
+                    end_date=to_utc(new_pause.end_date),
                     pomodoro=orm_pomodoro,
                 )
                 orm_pomodoro.contained_pauses.add(orm_pause)
@@ -91,6 +166,9 @@ class SQLPomodoroRepository(PomodoroRepository):
                     PauseModel[pause.id].set(**{"start_date": pause.start_date, "end_date": pause.end_date})
 
     def get(self, pomodoro_id: PomodoroId) -> Pomodoro:
+        if self.identity_map is not None:
+            return self._get_tracked(pomodoro_id)
+
         try:
             orm_pomodoro = PomodoroModel[pomodoro_id]
         except ObjectNotFound:
@@ -98,8 +176,38 @@ class SQLPomodoroRepository(PomodoroRepository):
         else:
             return self.to_domain_entity(orm_pomodoro)
 
+    def get_with_owner_id(self, pomodoro_id: PomodoroId, for_update: bool = False) -> Tuple[Pomodoro, Optional[UserId]]:
+        # A row locked here is reused by the later get_for_update, so saving the pomodoro does not load it again.
+        orm_pomodoro = self._get_for_update(pomodoro_id) if for_update else PomodoroModel.get(id=pomodoro_id)
+
+        if orm_pomodoro is None:
+            raise NotFound(N_("Pomodoro does not exist."))
+        return self.to_domain_entity(orm_pomodoro), orm_pomodoro.owner_id
+
+    def get_many(self, pomodoro_ids: Iterable[PomodoroId]) -> List[Pomodoro]:
+        pomodoro_ids = list(pomodoro_ids)
+        orm_pomodoros = PomodoroModel.select(lambda pomodoro: pomodoro.id in pomodoro_ids)
+        return self.to_domain_entities(orm_pomodoros)
+
     def save(self, pomodoro: Pomodoro, create: bool = False) -> None:
         if create:
             self._persist_new_orm_pomodoro(pomodoro)
         else:
             self._update_existing_orm_pomodoro(pomodoro)
+
+    @staticmethod
+    def backfill_states() -> int:
+        finished_cursor = db.execute(
+            "UPDATE pomodoros SET state = $finished_state WHERE end_date IS NOT NULL AND state != $finished_state",
+            {"finished_state": PomodoroState.FINISHED.value},
+        )
+        paused_cursor = db.execute(
+            """
+            UPDATE pomodoros SET state = $paused_state
+            WHERE end_date IS NULL AND state = $running_state AND EXISTS (
+                SELECT 1 FROM pauses WHERE pauses.pomodoro = pomodoros.id AND pauses.end_date IS NULL
+            )
+            """,
+            {"paused_state": PomodoroState.PAUSED.value, "running_state": PomodoroState.RUNNING.value},
+        )
+        return finished_cursor.rowcount + paused_cursor.rowcount
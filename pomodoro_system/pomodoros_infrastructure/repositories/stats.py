@@ -0,0 +1,32 @@
+from foundation.models import db
+from foundation.utils import to_utc
+from foundation.value_objects import UserId
+from pomodoros import ProjectId, StatsRepository
+from pomodoros.domain.entities.pomodoro import Pomodoro
+from pomodoros_infrastructure.models import DailyStatsModel
+
+
+class SQLStatsRepository(StatsRepository):
+    def record_finished_pomodoro(self, owner_id: UserId, project_id: ProjectId, pomodoro: Pomodoro) -> None:
+        focus_duration = pomodoro.end_date - pomodoro.start_date - pomodoro.paused_duration
+
+        db.execute(
+            """
+            INSERT INTO daily_stats (
+                owner_id, day, project_id, task_id, completed_pomodoros, focus_seconds, pause_seconds
+            )
+            VALUES ($owner_id, $day, $project_id, $task_id, 1, $focus_seconds, $pause_seconds)
+            ON CONFLICT (owner_id, day, project_id, task_id) DO UPDATE SET
+                completed_pomodoros = daily_stats.completed_pomodoros + 1,
+                focus_seconds = daily_stats.focus_seconds + excluded.focus_seconds,
+                pause_seconds = daily_stats.pause_seconds + excluded.pause_seconds
+            """,
+            {
+                "owner_id": DailyStatsModel.owner_id.converters[0].py2sql(owner_id),
+                "day": DailyStatsModel.day.converters[0].py2sql(to_utc(pomodoro.start_date).date()),
+                "project_id": DailyStatsModel.project_id.converters[0].py2sql(project_id),
+                "task_id": DailyStatsModel.task_id.converters[0].py2sql(pomodoro.task_id),
+                "focus_seconds": int(focus_duration.total_seconds()),
+                "pause_seconds": int(pomodoro.paused_duration.total_seconds()),
+            },
+        )
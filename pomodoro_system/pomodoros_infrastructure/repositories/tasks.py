@@ -1,20 +1,38 @@
-from typing import Optional, Type
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 from foundation.exceptions import AlreadyExists, NotFound
 from foundation.i18n import N_
+from foundation.models import db
 from foundation.utils import to_utc, with_tzinfo
-from foundation.value_objects import Color, DateFrameDefinition, Priority, PriorityLevel
+from foundation.value_objects import Color, DateFrameDefinition, Priority, PriorityLevel, UserId
 from pomodoros import TaskId, TaskRepository
 from pomodoros.domain.entities import SubTask, Task
 from pomodoros.domain.value_objects import TaskStatus
 from pomodoros_infrastructure import SubTaskModel
-from pomodoros_infrastructure.models import TaskModel
-from pony.orm import ObjectNotFound, delete
+from pomodoros_infrastructure.bulk_writer import bulk_insert
+from pomodoros_infrastructure.identity_map import IdentityMap
+from pomodoros_infrastructure.models import ProjectModel, TaskModel, TaskSearchDocumentModel
+from pony.orm import ObjectNotFound, commit, select
 
 
 class SQLTaskRepository(TaskRepository):
+    def __init__(self, identity_map: Optional[IdentityMap] = None) -> None:
+        self.identity_map = identity_map
+
+    @staticmethod
+    def _to_sub_task_entity(orm_sub_task: Type[SubTaskModel]) -> SubTask:
+        return SubTask(
+            id=orm_sub_task.id,
+            name=orm_sub_task.name,
+            ordering=orm_sub_task.ordering,
+            is_completed=orm_sub_task.is_completed,
+        )
+
     @classmethod
-    def to_domain_entity(cls, orm_task: Type[TaskModel]) -> Task:
+    def to_domain_entity(cls, orm_task: Type[TaskModel], sub_tasks: Optional[List[SubTask]] = None) -> Task:
         priority = Priority(
             color=Color(hex=orm_task.priority_color), priority_level=PriorityLevel(orm_task.priority_level)
         )
@@ -40,34 +58,53 @@ class SQLTaskRepository(TaskRepository):
             reminder_date=with_tzinfo(orm_task.reminder_date),
             renewal_interval=orm_task.renewal_interval,
             note=orm_task.note,
-            sub_tasks=list(
-                map(
-                    lambda sub_task: SubTask(
-                        id=sub_task.id,
-                        name=sub_task.name,
-                        ordering=sub_task.ordering,
-                        is_completed=with_tzinfo(sub_task.is_completed),
-                    ),
-                    orm_task.sub_tasks,
-                )
+            sub_tasks=(
+                sub_tasks
+                if sub_tasks is not None
+                else list(map(lambda orm_sub_task: cls._to_sub_task_entity(orm_sub_task), orm_task.sub_tasks))
             ),
         )
 
-    @staticmethod
-    def _persist_sub_tasks(orm_task: Task, replace: bool = False) -> None:
-        if replace:
-            delete(sub_task for sub_task in SubTaskModel if sub_task.task.id == orm_task.id)
-
-        [
-            SubTaskModel(
-                id=sub_task.id,
-                name=sub_task.name,
-                task=orm_task,
-                ordering=sub_task.ordering,
-                is_completed=sub_task.is_completed,
+    @classmethod
+    def load_sub_tasks(cls, task_ids: Iterable[TaskId]) -> Dict[TaskId, List[SubTask]]:
+        task_ids = list(task_ids)
+        sub_tasks_by_task_id = defaultdict(list)
+
+        if task_ids:
+            orm_sub_tasks = SubTaskModel.select(lambda sub_task: sub_task.task.id in task_ids).order_by(
+                SubTaskModel.ordering
             )
-            for sub_task in orm_task.sub_tasks
-        ]
+            for orm_sub_task in orm_sub_tasks:
+                sub_tasks_by_task_id[orm_sub_task.task.id].append(cls._to_sub_task_entity(orm_sub_task))
+        return sub_tasks_by_task_id
+
+    @classmethod
+    def to_domain_entities(cls, orm_tasks: Iterable[Type[TaskModel]]) -> List[Task]:
+        orm_tasks = list(orm_tasks)
+        sub_tasks_by_task_id = cls.load_sub_tasks(orm_task.id for orm_task in orm_tasks)
+        return [cls.to_domain_entity(orm_task, sub_tasks_by_task_id[orm_task.id]) for orm_task in orm_tasks]
+
+    @staticmethod
+    def _persist_sub_tasks(orm_task: Type[TaskModel], sub_tasks: List[SubTask]) -> None:
+        orm_sub_tasks = {orm_sub_task.id: orm_sub_task for orm_sub_task in orm_task.sub_tasks}
+        kept_sub_task_ids = {sub_task.id for sub_task in sub_tasks}
+
+        for sub_task_id, orm_sub_task in orm_sub_tasks.items():
+            if sub_task_id not in kept_sub_task_ids:
+                orm_sub_task.delete()
+
+        for sub_task in sub_tasks:
+            values = {"name": sub_task.name, "ordering": sub_task.ordering, "is_completed": sub_task.is_completed}
+            orm_sub_task = orm_sub_tasks.get(sub_task.id)
+
+            if orm_sub_task is None:
+                SubTaskModel(id=sub_task.id, task=orm_task, **values)
+            else:
+                changed_values = {
+                    field: value for field, value in values.items() if getattr(orm_sub_task, field) != value
+                }
+                if changed_values:
+                    orm_sub_task.set(**changed_values)
 
     def _persist_new_orm_task(self, task_entity: Task) -> None:
         if TaskModel.exists(project=task_entity.project_id, name=task_entity.name, status=TaskStatus.ACTIVE.value):
@@ -84,6 +121,7 @@ class SQLTaskRepository(TaskRepository):
             orm_task = TaskModel(
                 id=task_entity.id,
                 project=task_entity.project_id,
+                owner_id=ProjectModel[task_entity.project_id].owner.id,
                 name=task_entity.name,
                 status=task_entity.status.value,
                 priority_color=getattr(priority.color, "hex", None),
@@ -93,6 +131,7 @@ class SQLTaskRepository(TaskRepository):
                 pomodoros_to_do=task_entity.pomodoros_to_do,
                 pomodoros_burn_down=task_entity.pomodoros_burn_down,
                 reminder_date=to_utc(task_entity.reminder_date),
+                pending_reminder_date=to_utc(task_entity.reminder_date),
                 renewal_interval=task_entity.renewal_interval,
                 note=task_entity.note,
                 created_at=to_utc(task_entity.created_at),
@@ -108,14 +147,42 @@ class SQLTaskRepository(TaskRepository):
                 }
             )
 
-            self._persist_sub_tasks(orm_task)
+            self._persist_sub_tasks(orm_task, task_entity.sub_tasks or [])
+            TaskSearchDocumentModel(
+                task_id=task_entity.id, owner_id=orm_task.owner_id, content=self._get_entity_search_content(task_entity)
+            )
 
     @staticmethod
     def _get_for_update(task_id: TaskId) -> Optional[Type[TaskModel]]:
         return TaskModel.get_for_update(id=task_id)
 
-    def _update_existing_orm_task(self, task_entity: Task) -> None:
-        values_to_update = {
+    @staticmethod
+    def _get_persisted_values(orm_task: Type[TaskModel]) -> dict:
+        return {
+            "project": orm_task.project.id,
+            "name": orm_task.name,
+            "status": orm_task.status,
+            "priority_color": orm_task.priority_color,
+            "priority_level": orm_task.priority_level,
+            "ordering": orm_task.ordering,
+            "due_date": with_tzinfo(orm_task.due_date),
+            "pomodoros_to_do": orm_task.pomodoros_to_do,
+            "reminder_date": with_tzinfo(orm_task.reminder_date),
+            "renewal_interval": orm_task.renewal_interval,
+            "note": orm_task.note,
+            "pomodoro_length": orm_task.pomodoro_length,
+            "break_length": orm_task.break_length,
+            "longer_break_length": orm_task.longer_break_length,
+            "gap_between_long_breaks": orm_task.gap_between_long_breaks,
+            "sub_tasks": sorted(
+                (sub_task.id, sub_task.name, sub_task.ordering, sub_task.is_completed)
+                for sub_task in orm_task.sub_tasks
+            ),
+        }
+
+    @staticmethod
+    def _get_values(task_entity: Task) -> dict:
+        values = {
             "project": task_entity.project_id,
             "name": task_entity.name,
             "status": task_entity.status.value,
@@ -130,7 +197,7 @@ class SQLTaskRepository(TaskRepository):
         }
 
         if task_entity.date_frame_definition:
-            values_to_update.update(
+            values.update(
                 {
                     "pomodoro_length": task_entity.date_frame_definition.pomodoro_length,
                     "break_length": task_entity.date_frame_definition.break_length,
@@ -139,13 +206,79 @@ class SQLTaskRepository(TaskRepository):
                 }
             )
 
-        orm_task = self._get_for_update(task_entity.id)
+        values["sub_tasks"] = sorted(
+            (sub_task.id, sub_task.name, sub_task.ordering, sub_task.is_completed)
+            for sub_task in task_entity.sub_tasks or []
+        )
+        return values
+
+    def _get_tracked(self, task_id: TaskId) -> Task:
+        tracked_task = self.identity_map.get(Task, task_id)
+
+        if tracked_task is None:
+            orm_task = self._get_for_update(task_id)
+            if orm_task is None:
+                raise NotFound(N_("Task does not exist."))
+
+            tracked_task = self.to_domain_entity(orm_task)
+            self.identity_map.add(tracked_task, orm_task, self._get_persisted_values(orm_task))
+        return tracked_task
+
+    def _update_existing_orm_task(self, task_entity: Task) -> None:
+        values = self._get_values(task_entity)
+        orm_task = self.identity_map.get_orm_object(task_entity) if self.identity_map is not None else None
+
+        if orm_task is not None:
+            values_to_update = self.identity_map.get_changes(task_entity, values)
+            self.identity_map.mark_clean(task_entity, values)
+        else:
+            values_to_update = dict(values)
+            orm_task = self._get_for_update(task_entity.id)
 
         if orm_task is not None:
-            orm_task.set(**values_to_update)
-            self._persist_sub_tasks(orm_task, replace=True)
+            if with_tzinfo(orm_task.reminder_date) != to_utc(task_entity.reminder_date):
+                values_to_update["pending_reminder_date"] = to_utc(task_entity.reminder_date)
+            if orm_task.is_active and task_entity.is_completed and task_entity.is_repeatable:
+                values_to_update["pending_renewal_date"] = to_utc(task_entity.next_due_date or task_entity.created_at)
+            elif task_entity.is_active and orm_task.pending_renewal_date is not None:
+                values_to_update["pending_renewal_date"] = None
+
+            if orm_task.project.id != task_entity.project_id:
+                values_to_update["owner_id"] = ProjectModel[task_entity.project_id].owner.id
+
+            sub_tasks_changed = values_to_update.pop("sub_tasks", None) is not None
+            if values_to_update:
+                orm_task.set(**values_to_update)
+            if "owner_id" in values_to_update:
+                self._move_pomodoros_to_owner(orm_task.id, values_to_update["owner_id"])
+            if sub_tasks_changed:
+                self._persist_sub_tasks(orm_task, task_entity.sub_tasks or [])
+            if sub_tasks_changed or values_to_update.keys() & {"name", "note", "owner_id"}:
+                self._update_search_document(orm_task, task_entity)
+
+    @staticmethod
+    def _get_search_content(name: str, note: Optional[str], sub_task_names: Iterable[str]) -> str:
+        return "\n".join(filter(None, [name, note, *sub_task_names]))
+
+    @classmethod
+    def _get_entity_search_content(cls, task_entity: Task) -> str:
+        return cls._get_search_content(
+            task_entity.name, task_entity.note, (sub_task.name for sub_task in task_entity.sub_tasks or [])
+        )
+
+    def _update_search_document(self, orm_task: Type[TaskModel], task_entity: Task) -> None:
+        values = {"owner_id": orm_task.owner_id, "content": self._get_entity_search_content(task_entity)}
+        orm_document = TaskSearchDocumentModel.get(task_id=orm_task.id)
+
+        if orm_document is None:
+            TaskSearchDocumentModel(task_id=orm_task.id, **values)
+        else:
+            orm_document.set(**values)
 
     def get(self, task_id: TaskId) -> Task:
+        if self.identity_map is not None:
+            return self._get_tracked(task_id)
+
         try:
             orm_task = TaskModel[task_id]
         except ObjectNotFound:
@@ -153,6 +286,19 @@ class SQLTaskRepository(TaskRepository):
         else:
             return self.to_domain_entity(orm_task)
 
+    def get_with_owner_id(self, task_id: TaskId, for_update: bool = False) -> Tuple[Task, Optional[UserId]]:
+        # A row locked here is reused by the later get_for_update, so saving the task does not load it again.
+        orm_task = self._get_for_update(task_id) if for_update else TaskModel.get(id=task_id)
+
+        if orm_task is None:
+            raise NotFound(N_("Task does not exist."))
+        return self.to_domain_entity(orm_task), orm_task.owner_id
+
+    def get_many(self, task_ids: Iterable[TaskId]) -> List[Task]:
+        task_ids = list(task_ids)
+        orm_tasks = TaskModel.select(lambda task: task.id in task_ids)
+        return self.to_domain_entities(orm_tasks)
+
     def save(self, task: Task, create: bool = False) -> None:
         if create:
             self._persist_new_orm_task(task)
@@ -164,3 +310,193 @@ class SQLTaskRepository(TaskRepository):
 
         if orm_task is not None:
             orm_task.delete()
+            TaskSearchDocumentModel.select(lambda document: document.task_id == task_id).delete(bulk=True)
+
+    @staticmethod
+    def _set_cached_pomodoros_burn_down(task_id: TaskId, pomodoros_burn_down: int) -> None:
+        orm_task = db._get_cache().indexes[TaskModel._pk_attrs_].get(task_id)
+
+        if orm_task is not None and TaskModel.pomodoros_burn_down in orm_task._dbvals_:
+            orm_task._dbvals_[TaskModel.pomodoros_burn_down] = pomodoros_burn_down
+            orm_task._vals_[TaskModel.pomodoros_burn_down] = pomodoros_burn_down
+
+    def increment_pomodoros_burn_down(self, task_id: TaskId) -> None:
+        cursor = db.execute(
+            """
+            UPDATE tasks SET pomodoros_burn_down = pomodoros_burn_down + 1
+            WHERE id = $task_id
+            RETURNING pomodoros_burn_down
+            """,
+            {"task_id": TaskModel.id.converters[0].py2sql(task_id)},
+        )
+        row = cursor.fetchone()
+
+        if row is not None:
+            self._set_cached_pomodoros_burn_down(task_id, row[0])
+
+    @staticmethod
+    def _move_pomodoros_to_owner(task_id: TaskId, owner_id: UserId) -> None:
+        db.execute(
+            "UPDATE pomodoros SET owner_id = $owner_id WHERE task = $task_id",
+            {
+                "owner_id": TaskModel.owner_id.converters[0].py2sql(owner_id),
+                "task_id": TaskModel.id.converters[0].py2sql(task_id),
+            },
+        )
+
+    @staticmethod
+    def backfill_owner_ids() -> Tuple[int, int]:
+        tasks_cursor = db.execute(
+            """
+            UPDATE tasks SET owner_id = (SELECT projects.owner FROM projects WHERE projects.id = tasks.project)
+            WHERE owner_id IS NULL
+            """
+        )
+        pomodoros_cursor = db.execute(
+            """
+            UPDATE pomodoros SET owner_id = (SELECT tasks.owner_id FROM tasks WHERE tasks.id = pomodoros.task)
+            WHERE owner_id IS NULL
+            """
+        )
+        return tasks_cursor.rowcount, pomodoros_cursor.rowcount
+
+    @classmethod
+    def rebuild_search_documents(cls, batch_size: int = 500) -> int:
+        TaskSearchDocumentModel.select().delete(bulk=True)
+        indexed_tasks_count, page = 0, 1
+
+        while True:
+            orm_tasks = list(
+                TaskModel.select().order_by(TaskModel.id).prefetch(TaskModel.sub_tasks).page(page, batch_size)
+            )
+            indexed_tasks_count += bulk_insert(
+                TaskSearchDocumentModel,
+                [cls._to_search_document_row(orm_task.id, orm_task.owner_id, orm_task) for orm_task in orm_tasks],
+            )
+            if len(orm_tasks) < batch_size:
+                return indexed_tasks_count
+            page += 1
+
+    @staticmethod
+    def reconcile_pomodoros_burn_down() -> int:
+        cursor = db.execute(
+            """
+            UPDATE tasks SET pomodoros_burn_down = finished_pomodoros.finished_count
+            FROM (
+                SELECT tasks.id AS task_id, COUNT(pomodoros.id) AS finished_count
+                FROM tasks
+                LEFT JOIN pomodoros ON pomodoros.task = tasks.id AND pomodoros.end_date IS NOT NULL
+                GROUP BY tasks.id
+            ) AS finished_pomodoros
+            WHERE tasks.id = finished_pomodoros.task_id
+                AND tasks.pomodoros_burn_down != finished_pomodoros.finished_count
+            """
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def _to_sub_task_row(task_id: TaskId, sub_task: SubTask) -> dict:
+        return {
+            "id": sub_task.id,
+            "task": task_id,
+            "name": sub_task.name,
+            "ordering": sub_task.ordering,
+            "is_completed": sub_task.is_completed,
+        }
+
+    @classmethod
+    def _to_search_document_row(cls, task_id: TaskId, owner_id: UserId, orm_task: Type[TaskModel]) -> dict:
+        sub_task_names = (
+            orm_sub_task.name for orm_sub_task in sorted(orm_task.sub_tasks, key=lambda sub_task: sub_task.ordering)
+        )
+        return {
+            "task_id": task_id,
+            "owner_id": owner_id,
+            "content": cls._get_search_content(orm_task.name, orm_task.note, sub_task_names),
+        }
+
+    @classmethod
+    def _get_renewed_task_rows(cls, orm_task: Type[TaskModel], now: datetime) -> Tuple[dict, List[dict]]:
+        renewal_interval = orm_task.renewal_interval
+        due_date = with_tzinfo(orm_task.due_date)
+        reminder_date = with_tzinfo(orm_task.reminder_date)
+        renewed_reminder_date = reminder_date + renewal_interval if reminder_date is not None else None
+
+        renewed_task_row = {
+            "id": uuid.uuid4(),
+            "project": orm_task.project.id,
+            "owner_id": orm_task.owner_id,
+            "name": orm_task.name,
+            "status": TaskStatus.ACTIVE.value,
+            "priority_color": orm_task.priority_color,
+            "priority_level": orm_task.priority_level,
+            "ordering": orm_task.ordering,
+            "due_date": due_date + renewal_interval if due_date is not None else None,
+            "pomodoros_to_do": orm_task.pomodoros_to_do,
+            "pomodoros_burn_down": 0,
+            "pomodoro_length": orm_task.pomodoro_length,
+            "break_length": orm_task.break_length,
+            "longer_break_length": orm_task.longer_break_length,
+            "gap_between_long_breaks": orm_task.gap_between_long_breaks,
+            "reminder_date": renewed_reminder_date,
+            "pending_reminder_date": renewed_reminder_date,
+            "renewal_interval": renewal_interval,
+            "note": orm_task.note,
+            "created_at": now,
+        }
+        renewed_sub_task_rows = [
+            cls._to_sub_task_row(
+                renewed_task_row["id"],
+                SubTask(id=uuid.uuid4(), name=orm_sub_task.name, ordering=orm_sub_task.ordering, is_completed=False),
+            )
+            for orm_sub_task in orm_task.sub_tasks
+        ]
+        return renewed_task_row, renewed_sub_task_rows
+
+    def renew_repeatable_tasks(self, now: datetime, horizon: timedelta, batch_size: int = 500) -> int:
+        renewal_date_limit = to_utc(now + horizon)
+        retry_renewal_date = renewal_date_limit + timedelta(seconds=1)
+        renewed_tasks_count = 0
+
+        while True:
+            completed_tasks = (
+                TaskModel.select(
+                    lambda task: task.pending_renewal_date is not None
+                    and task.pending_renewal_date <= renewal_date_limit
+                )
+                .order_by(TaskModel.pending_renewal_date)
+                .for_update(skip_locked=True)
+                .prefetch(TaskModel.sub_tasks)[:batch_size]
+            )
+            project_ids = list({orm_task.project.id for orm_task in completed_tasks})
+            taken_names = set(
+                select(
+                    (task.project.id, task.name)
+                    for task in TaskModel
+                    if task.project.id in project_ids and task.status == TaskStatus.ACTIVE.value
+                )
+            )
+
+            renewed_task_rows, renewed_sub_task_rows, search_document_rows = [], [], []
+            for orm_task in completed_tasks:
+                if (orm_task.project.id, orm_task.name) in taken_names:
+                    # Retried by a later run, once the active task holding the name is completed or renamed.
+                    orm_task.pending_renewal_date = retry_renewal_date
+                else:
+                    orm_task.pending_renewal_date = None
+                    taken_names.add((orm_task.project.id, orm_task.name))
+                    renewed_task_row, sub_task_rows = self._get_renewed_task_rows(orm_task, now)
+                    renewed_task_rows.append(renewed_task_row)
+                    renewed_sub_task_rows.extend(sub_task_rows)
+                    if orm_task.owner_id is not None:
+                        search_document_rows.append(
+                            self._to_search_document_row(renewed_task_row["id"], orm_task.owner_id, orm_task)
+                        )
+
+            renewed_tasks_count += bulk_insert(TaskModel, renewed_task_rows)
+            bulk_insert(SubTaskModel, renewed_sub_task_rows)
+            bulk_insert(TaskSearchDocumentModel, search_document_rows)
+            commit()
+
+            if len(completed_tasks) < batch_size:
+                return renewed_tasks_count
@@ -1,10 +1,13 @@
-from datetime import datetime, timedelta
-from typing import Tuple
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
 
 import pytest
 import pytz
-from pomodoros_infrastructure import PauseModel, PomodoroModel, TaskModel
-from pomodoros_infrastructure.tests.factories import ORMPauseFactory, ORMPomodoroFactory
+from foundation.models import User
+from pomodoros.domain.value_objects import TaskStatus
+from pomodoros_infrastructure import DailyStatsModel, PauseModel, PomodoroModel, ProjectModel, SubTaskModel, TaskModel
+from pomodoros_infrastructure.tests.factories import ORMPauseFactory, ORMPomodoroFactory, ORMTaskFactory
 from pony.orm import db_session
 
 
@@ -40,6 +43,38 @@ def orm_pomodoro_for_today(orm_task: TaskModel, today_date_range: Tuple[datetime
         return ORMPomodoroFactory(task=orm_task.id, start_date=start_date, end_date=end_date)
 
 
+@pytest.fixture()
+def orm_earlier_pomodoro_for_today_on_second_task(
+    orm_second_task: TaskModel, today_date_range: Tuple[datetime, datetime]
+) -> PomodoroModel:
+    with db_session:
+        start_date, end_date = today_date_range
+        return ORMPomodoroFactory(
+            task=orm_second_task.id, start_date=start_date - timedelta(hours=1), end_date=end_date - timedelta(hours=1)
+        )
+
+
+@pytest.fixture()
+def orm_running_pomodoro(orm_task: TaskModel) -> PomodoroModel:
+    with db_session:
+        return ORMPomodoroFactory(task=orm_task.id, start_date=datetime.now(tz=pytz.UTC), end_date=None)
+
+
+@pytest.fixture()
+def orm_overdue_pomodoro(orm_task: TaskModel) -> PomodoroModel:
+    with db_session:
+        start_date = datetime.now(tz=pytz.UTC) - timedelta(hours=2)
+        return ORMPomodoroFactory(
+            task=orm_task.id, start_date=start_date, end_date=None, due_date=start_date + timedelta(minutes=25)
+        )
+
+
+@pytest.fixture()
+def orm_random_running_pomodoro() -> PomodoroModel:
+    with db_session:
+        return ORMPomodoroFactory(start_date=datetime.now(tz=pytz.UTC), end_date=None)
+
+
 @pytest.fixture()
 def orm_random_pomodoro_for_yesterday(yesterday_date_range: Tuple[datetime, datetime]) -> PomodoroModel:
     with db_session:
@@ -58,3 +93,80 @@ def orm_pomodoro_for_yesterday(orm_task: TaskModel, yesterday_date_range: Tuple[
 def orm_pause() -> PauseModel:
     with db_session:
         return ORMPauseFactory()
+
+
+@pytest.fixture()
+def orm_daily_stats(
+    project_owner: User, orm_project: ProjectModel, orm_task: TaskModel, orm_second_task: TaskModel
+) -> List[DailyStatsModel]:
+    with db_session:
+        return [
+            DailyStatsModel(
+                owner_id=project_owner.id,
+                day=day,
+                project_id=orm_project.id,
+                task_id=task_id,
+                completed_pomodoros=completed_pomodoros,
+                focus_seconds=completed_pomodoros * 1500,
+            )
+            for day, task_id, completed_pomodoros in [
+                (date(2021, 3, 1), orm_task.id, 2),
+                (date(2021, 3, 1), orm_second_task.id, 1),
+                (date(2021, 3, 2), orm_task.id, 1),
+                (date(2021, 4, 5), orm_task.id, 1),
+            ]
+        ]
+
+
+@pytest.fixture()
+def orm_task_with_due_reminder(orm_project: ProjectModel) -> TaskModel:
+    with db_session:
+        reminder_date = datetime.now(tz=pytz.UTC) - timedelta(minutes=5)
+        return ORMTaskFactory(project=orm_project.id, reminder_date=reminder_date, pending_reminder_date=reminder_date)
+
+
+@pytest.fixture()
+def completed_orm_task_with_due_reminder(orm_project: ProjectModel) -> TaskModel:
+    with db_session:
+        reminder_date = datetime.now(tz=pytz.UTC) - timedelta(minutes=5)
+        return ORMTaskFactory(
+            project=orm_project.id,
+            status=TaskStatus.COMPLETED.value,
+            reminder_date=reminder_date,
+            pending_reminder_date=reminder_date,
+        )
+
+
+@pytest.fixture()
+def orm_task_with_upcoming_reminder(orm_project: ProjectModel) -> TaskModel:
+    with db_session:
+        reminder_date = datetime.now(tz=pytz.UTC) + timedelta(days=1)
+        return ORMTaskFactory(project=orm_project.id, reminder_date=reminder_date, pending_reminder_date=reminder_date)
+
+
+@pytest.fixture()
+def completed_orm_task_pending_renewal(orm_project: ProjectModel) -> TaskModel:
+    with db_session:
+        due_date = datetime.now(tz=pytz.UTC) - timedelta(days=1)
+        orm_task = ORMTaskFactory(
+            project=orm_project.id,
+            status=TaskStatus.COMPLETED.value,
+            due_date=due_date,
+            renewal_interval=timedelta(days=1),
+            pending_renewal_date=due_date + timedelta(days=1),
+        )
+        SubTaskModel(id=uuid.uuid4(), name="sub task", task=orm_task, ordering=0, is_completed=True)
+        return orm_task
+
+
+@pytest.fixture()
+def completed_orm_task_pending_distant_renewal(orm_project: ProjectModel) -> TaskModel:
+    with db_session:
+        due_date = datetime.now(tz=pytz.UTC) + timedelta(days=7)
+        return ORMTaskFactory(
+            project=orm_project.id,
+            status=TaskStatus.COMPLETED.value,
+            due_date=due_date,
+            renewal_interval=timedelta(days=7),
+            pending_renewal_date=due_date + timedelta(days=7),
+        )
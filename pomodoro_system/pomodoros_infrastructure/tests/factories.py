@@ -7,7 +7,7 @@ import pytz
 from factory.fuzzy import FuzzyAttribute
 from foundation.models import db
 from foundation.tests.factories import ORMUserFactory, PonyFactory
-from pomodoros.domain.value_objects import FrameType, TaskStatus
+from pomodoros.domain.value_objects import FrameType, PomodoroState, TaskStatus
 from pomodoros_infrastructure import PauseModel, PomodoroModel, ProjectModel, SubTaskModel, TaskModel
 
 
@@ -46,6 +46,7 @@ class ORMTaskFactory(PonyFactory):
 
     id = factory.LazyFunction(uuid.uuid4)
     project = FuzzyAttribute(lambda: ORMProjectFactory())
+    owner_id = factory.LazyAttribute(lambda task: ProjectModel[getattr(task.project, "id", task.project)].owner.id)
     name = factory.Faker("name")
     status = TaskStatus.ACTIVE.value
     priority_color = factory.Faker("color")
@@ -73,8 +74,12 @@ class ORMPomodoroFactory(PonyFactory):
     id = factory.LazyFunction(uuid.uuid4)
     frame_type = FrameType.TYPE_POMODORO.value
     task = FuzzyAttribute(lambda: ORMTaskFactory())
+    owner_id = factory.LazyAttribute(lambda pomodoro: TaskModel[getattr(pomodoro.task, "id", pomodoro.task)].owner_id)
     start_date = FuzzyAttribute(lambda: datetime.now(tz=pytz.UTC).replace(hour=12, minute=0))
     end_date = FuzzyAttribute(lambda: datetime.now(tz=pytz.UTC).replace(hour=12, minute=30))
+    state = factory.LazyAttribute(
+        lambda pomodoro: (PomodoroState.FINISHED if pomodoro.end_date else PomodoroState.RUNNING).value
+    )
     contained_pauses = factory.List([])
 
 
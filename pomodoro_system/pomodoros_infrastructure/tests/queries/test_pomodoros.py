@@ -1,32 +1,98 @@
 import uuid
+from datetime import datetime
 
 import pytest
-from pomodoros_infrastructure.queries.pomodoros import SQLGetRecentPomodoros
+import pytz
+from foundation.models import db
+from foundation.tests.query_plans import assert_uses_index
+from foundation.utils import with_tzinfo
+from pomodoros.domain.value_objects import PomodoroState
+from pomodoros_infrastructure.queries.pomodoros import (
+    SQLGetActivePomodoro,
+    SQLGetOverduePomodoros,
+    SQLGetRecentPomodoros,
+)
+from pomodoros_infrastructure.tests.factories import ORMPauseFactory, ORMPomodoroFactory
 from pony.orm import db_session
 
 
 @pytest.mark.usefixtures("setup_teardown_tables")
 class TestGetRecentPomodorosQuery:
     @db_session
-    def test_query_returns_pomodoro_from_today(self, orm_task, orm_pomodoro_for_today, orm_pomodoro_for_yesterday):
+    def test_query_returns_pomodoro_from_today(self, project_owner, orm_pomodoro_for_today, orm_pomodoro_for_yesterday):
         query_object = SQLGetRecentPomodoros()
-        result = query_object.query(orm_task.id)
+        result = query_object.query(project_owner.id)
 
         assert len(result) == 1
         assert orm_pomodoro_for_yesterday.id != result[0].id
         assert orm_pomodoro_for_today.id == result[0].id
 
     @db_session
-    def test_query_returns_task_related_pomodoros_only(
+    def test_query_index_tracks_today_pomodoros(
+        self, project_owner, orm_pomodoro_for_today, orm_pomodoro_for_yesterday
+    ):
+        recent_pomodoros = SQLGetRecentPomodoros().query_index(project_owner.id)
+
+        assert len(recent_pomodoros) == 1
+        assert recent_pomodoros.overlaps(
+            with_tzinfo(orm_pomodoro_for_today.start_date), with_tzinfo(orm_pomodoro_for_today.end_date)
+        )
+
+    def test_query_index_reads_only_date_ranges(self, project_owner, orm_pomodoro_for_today):
+        with db_session:
+            db.merge_local_stats()
+            SQLGetRecentPomodoros().query_index(project_owner.id)
+            executed_sql = [sql for sql, _query_stat in db.local_stats.items() if sql]
+
+            assert len(executed_sql) == 1
+            assert 'FROM "pauses"' not in executed_sql[0]
+
+    @db_session
+    def test_query_index_scans_owner_pomodoros_by_end_date_range(self, project_owner):
+        assert_uses_index(
+            SQLGetRecentPomodoros._get_recent_date_ranges(project_owner.id), "idx_pomodoros__owner_id_end_date"
+        )
+
+    @db_session
+    def test_query_scans_owner_pomodoros_by_end_date_range(self, project_owner):
+        assert_uses_index(
+            SQLGetRecentPomodoros._get_recent_pomodoros(project_owner.id), "idx_pomodoros__owner_id_end_date"
+        )
+
+    def test_query_loads_pauses_of_all_pomodoros_at_once(self, project_owner, orm_task):
+        today = datetime.now(tz=pytz.UTC)
+
+        with db_session:
+            for hour in range(1, 4):
+                orm_pomodoro = ORMPomodoroFactory(
+                    task=orm_task.id,
+                    start_date=today.replace(hour=hour),
+                    end_date=today.replace(hour=hour, minute=30),
+                )
+                ORMPauseFactory(pomodoro=orm_pomodoro, start_date=today.replace(hour=hour, minute=10))
+
+        with db_session:
+            db.merge_local_stats()
+            result = SQLGetRecentPomodoros().query(project_owner.id)
+            pauses_queries_count = sum(
+                query_stat.db_count for sql, query_stat in db.local_stats.items() if sql and 'FROM "pauses"' in sql
+            )
+
+            assert len(result) == 3
+            assert all(len(pomodoro.contained_pauses) == 1 for pomodoro in result)
+            assert pauses_queries_count == 1
+
+    @db_session
+    def test_query_returns_owner_related_pomodoros_only(
         self,
-        orm_task,
+        project_owner,
         orm_pomodoro_for_today,
         orm_random_pomodoro_for_today,
         orm_pomodoro_for_yesterday,
         orm_random_pomodoro_for_yesterday,
     ):
         query_object = SQLGetRecentPomodoros()
-        result = query_object.query(orm_task.id)
+        result = query_object.query(project_owner.id)
 
         assert len(result) == 1
         assert orm_pomodoro_for_yesterday.id != result[0].id
@@ -35,16 +101,74 @@ class TestGetRecentPomodorosQuery:
         assert orm_pomodoro_for_today.id == result[0].id
 
     @db_session
-    def test_query_returns_empty_collection_if_task_has_no_recent_pomodoros(self, orm_task):
+    def test_query_returns_pomodoros_of_every_owner_task_sorted_by_start_date(
+        self, project_owner, orm_pomodoro_for_today, orm_earlier_pomodoro_for_today_on_second_task
+    ):
+        query_object = SQLGetRecentPomodoros()
+        result = query_object.query(project_owner.id)
+
+        assert [pomodoro.id for pomodoro in result] == [
+            orm_earlier_pomodoro_for_today_on_second_task.id,
+            orm_pomodoro_for_today.id,
+        ]
+
+    @db_session
+    def test_query_returns_empty_collection_if_owner_has_no_recent_pomodoros(self, project_owner, orm_task):
         query_object = SQLGetRecentPomodoros()
-        result = query_object.query(orm_task.id)
+        result = query_object.query(project_owner.id)
 
         assert result == []
 
     @db_session
-    def test_query_returns_empty_collection_if_non_existing_task_id_was_passed(self):
+    def test_query_returns_empty_collection_if_non_existing_owner_id_was_passed(self):
         query_object = SQLGetRecentPomodoros()
         random_uuid = uuid.uuid4()
         result = query_object.query(random_uuid)
 
         assert result == []
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestGetActivePomodoroQuery:
+    @db_session
+    def test_query_returns_running_pomodoro_of_owner(
+        self, project_owner, orm_pomodoro_for_today, orm_running_pomodoro, orm_random_running_pomodoro
+    ):
+        query_object = SQLGetActivePomodoro()
+        result = query_object.query(project_owner.id)
+
+        assert result is not None
+        assert result.id == orm_running_pomodoro.id
+        assert result.task_id == orm_running_pomodoro.task.id
+        assert result.state == PomodoroState.RUNNING
+
+    @db_session
+    def test_query_looks_up_active_pomodoro_by_owner_and_state(self, project_owner):
+        assert_uses_index(SQLGetActivePomodoro._get_active_pomodoros(project_owner.id), "idx_pomodoros__owner_id_state")
+
+    @db_session
+    def test_query_returns_none_if_owner_has_only_finished_pomodoros(self, project_owner, orm_pomodoro_for_today):
+        query_object = SQLGetActivePomodoro()
+        result = query_object.query(project_owner.id)
+
+        assert result is None
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestGetOverduePomodorosQuery:
+    @db_session
+    def test_query_returns_pomodoros_past_their_due_date(
+        self, project_owner, orm_overdue_pomodoro, orm_running_pomodoro, orm_pomodoro_for_today
+    ):
+        query_object = SQLGetOverduePomodoros()
+        result = query_object.query(datetime.now(tz=pytz.UTC), limit=10)
+
+        assert [(pomodoro.id, pomodoro.owner_id) for pomodoro in result] == [
+            (orm_overdue_pomodoro.id, project_owner.id)
+        ]
+
+    @db_session
+    def test_query_respects_limit(self, orm_overdue_pomodoro):
+        query_object = SQLGetOverduePomodoros()
+
+        assert query_object.query(datetime.now(tz=pytz.UTC), limit=0) == []
@@ -0,0 +1,46 @@
+from datetime import date
+
+import pytest
+from pomodoros import StatsGranularity
+from pomodoros_infrastructure.queries.stats import SQLGetPomodoroStats
+from pony.orm import db_session
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestGetPomodoroStatsQuery:
+    @db_session
+    def test_query_returns_daily_totals_within_date_range(self, project_owner, orm_daily_stats):
+        query_object = SQLGetPomodoroStats()
+        result = query_object.query(project_owner.id, date(2021, 3, 1), date(2021, 3, 2), StatsGranularity.DAY)
+
+        assert [(stats.period_start, stats.completed_pomodoros) for stats in result] == [
+            (date(2021, 3, 1), 3),
+            (date(2021, 3, 2), 1),
+        ]
+
+    @db_session
+    def test_query_groups_totals_by_week(self, project_owner, orm_daily_stats):
+        query_object = SQLGetPomodoroStats()
+        result = query_object.query(project_owner.id, date(2021, 1, 1), date(2021, 12, 31), StatsGranularity.WEEK)
+
+        assert [(stats.period_start, stats.completed_pomodoros) for stats in result] == [
+            (date(2021, 3, 1), 4),
+            (date(2021, 4, 5), 1),
+        ]
+
+    @db_session
+    def test_query_groups_totals_by_month(self, project_owner, orm_daily_stats):
+        query_object = SQLGetPomodoroStats()
+        result = query_object.query(project_owner.id, date(2021, 1, 1), date(2021, 12, 31), StatsGranularity.MONTH)
+
+        assert [(stats.period_start, stats.focus_seconds) for stats in result] == [
+            (date(2021, 3, 1), 4 * 1500),
+            (date(2021, 4, 1), 1500),
+        ]
+
+    @db_session
+    def test_query_returns_owner_related_stats_only(self, random_project_owner, orm_daily_stats):
+        query_object = SQLGetPomodoroStats()
+        result = query_object.query(random_project_owner.id, date(2021, 1, 1), date(2021, 12, 31), StatsGranularity.DAY)
+
+        assert result == []
@@ -1,7 +1,25 @@
 import uuid
+from datetime import datetime
 
 import pytest
-from pomodoros_infrastructure.queries.tasks import SQLGetRecentTasksByProjectId, SQLGetTaskListByOwnerId
+import pytz
+from foundation.models import db
+from foundation.tests.query_plans import assert_uses_index
+from foundation.value_objects import Color, Priority, PriorityLevel
+from pomodoros import QueryTaskDto
+from pomodoros.domain.entities import SubTask
+from pomodoros.domain.value_objects import TaskStatus
+from pomodoros.tests.factories import TaskFactory
+from pomodoros_infrastructure import ProjectModel, SubTaskModel, TaskModel
+from pomodoros_infrastructure.queries.tasks import (
+    DueDateFilter,
+    SQLClaimDueTaskReminders,
+    SQLGetRecentTasksByProjectId,
+    SQLGetTaskListByOwnerId,
+    SQLSearchTasksByOwnerId,
+)
+from pomodoros_infrastructure.repositories import SQLTaskRepository
+from pomodoros_infrastructure.tests.factories import ORMTaskFactory
 from pony.orm import db_session
 
 
@@ -15,6 +33,48 @@ class TestGetTaskByOwnerIdQuery:
         assert len(result_ids) == 1
         assert orm_task.id in result_ids
 
+    def test_query_loads_sub_tasks_of_all_tasks_at_once(self, project_owner, orm_project):
+        with db_session:
+            for _ in range(5):
+                orm_task = ORMTaskFactory(project=orm_project.id)
+                SubTaskModel(id=uuid.uuid4(), name="sub task", task=orm_task, ordering=0, is_completed=False)
+
+        with db_session:
+            db.merge_local_stats()
+            result = SQLGetTaskListByOwnerId().query(project_owner.id, return_full_entity=True)
+            sub_tasks_queries_count = sum(
+                query_stat.db_count for sql, query_stat in db.local_stats.items() if sql and 'FROM "sub_tasks"' in sql
+            )
+
+            assert len(result) == 5
+            assert all(len(task.sub_tasks) == 1 for task in result)
+            assert sub_tasks_queries_count == 1
+
+    def test_iterate_loads_tasks_in_chunks(self, project_owner, orm_project):
+        with db_session:
+            task_ids = {ORMTaskFactory(project=orm_project.id).id for _ in range(5)}
+
+        with db_session:
+            db.merge_local_stats()
+            iterated_task_ids = {task.id for task in SQLGetTaskListByOwnerId().iterate(project_owner.id, chunk_size=2)}
+            tasks_queries_count = sum(
+                query_stat.db_count for sql, query_stat in db.local_stats.items() if sql and 'FROM "tasks"' in sql
+            )
+
+            assert iterated_task_ids == task_ids
+            assert tasks_queries_count == 3
+
+    def test_iterate_keeps_pending_changes_of_the_session(self, project_owner, orm_project):
+        with db_session:
+            task_ids = [ORMTaskFactory(project=orm_project.id).id for _ in range(3)]
+
+        with db_session:
+            TaskModel[task_ids[0]].note = "changed"
+            list(SQLGetTaskListByOwnerId().iterate(project_owner.id, chunk_size=1))
+
+        with db_session:
+            assert TaskModel[task_ids[0]].note == "changed"
+
     @db_session
     def test_query_returns_empty_collection_if_project_has_no_tasks(self, project_owner, orm_project):
         query_object = SQLGetTaskListByOwnerId()
@@ -30,6 +90,13 @@ class TestGetTaskByOwnerIdQuery:
 
         assert result == []
 
+    @pytest.mark.parametrize("due_date_rule", list(DueDateFilter))
+    @db_session
+    def test_due_date_rules_scan_owner_tasks_by_due_date_range(self, due_date_rule, project_owner, orm_task):
+        task_query = SQLGetTaskListByOwnerId()._get_task_list_for_due_date(project_owner.id, due_date_rule)
+
+        assert_uses_index(task_query, "idx_tasks__owner_id_due_date")
+
 
 @pytest.mark.usefixtures("setup_teardown_tables")
 class TestSQLGetRecentTasksByProjectIdQuery:
@@ -43,6 +110,18 @@ class TestSQLGetRecentTasksByProjectIdQuery:
         assert len(result_ids) == 1
         assert orm_task.id in result_ids
 
+    def test_query_selects_only_dto_columns(self, orm_project, orm_task):
+        with db_session:
+            db.merge_local_stats()
+            result = SQLGetRecentTasksByProjectId().query(orm_project.id)
+            tasks_queries = [sql for sql in db.local_stats if sql and 'FROM "tasks"' in sql and "MAX" not in sql]
+
+            assert result == [
+                QueryTaskDto(id=orm_task.id, name=orm_task.name, status=TaskStatus.ACTIVE, project_id=orm_project.id)
+            ]
+            assert len(tasks_queries) == 1
+            assert '"note"' not in tasks_queries[0]
+
     @db_session
     def test_query_returns_empty_collection_if_project_does_not_contain_tasks(self, orm_project):
         query_object = SQLGetRecentTasksByProjectId()
@@ -57,3 +136,119 @@ class TestSQLGetRecentTasksByProjectIdQuery:
         result = query_object.query(random_uuid)
 
         assert result == []
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestClaimDueTaskRemindersQuery:
+    def test_query_claims_due_reminders_of_active_tasks_once(
+        self,
+        project_owner,
+        orm_task_with_due_reminder,
+        completed_orm_task_with_due_reminder,
+        orm_task_with_upcoming_reminder,
+    ):
+        query_object = SQLClaimDueTaskReminders()
+        now = datetime.now(tz=pytz.UTC)
+
+        with db_session:
+            result = query_object.query(now, limit=10)
+
+        assert [(reminder.task_id, reminder.owner_email) for reminder in result] == [
+            (orm_task_with_due_reminder.id, project_owner.email)
+        ]
+
+        with db_session:
+            assert TaskModel[orm_task_with_due_reminder.id].pending_reminder_date is None
+            assert TaskModel[completed_orm_task_with_due_reminder.id].pending_reminder_date is None
+            assert TaskModel[orm_task_with_upcoming_reminder.id].pending_reminder_date is not None
+            assert query_object.query(now, limit=10) == []
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestSearchTasksByOwnerIdQuery:
+    @staticmethod
+    def _create_task(project_id, **kwargs):
+        priority = Priority(color=Color(hex="#ffffff"), priority_level=PriorityLevel.NO_PRIORITY)
+        task = TaskFactory(project_id=project_id, priority=priority, **kwargs)
+        with db_session:
+            SQLTaskRepository().save(task, create=True)
+        return task
+
+    @pytest.mark.parametrize("phrase", ["quarterly", "Quart", "budget review", "invoices"])
+    def test_query_finds_tasks_by_name_note_and_sub_task_names(self, phrase, project_owner, orm_project):
+        task = self._create_task(
+            orm_project.id,
+            name="Quarterly report",
+            note="Review the budget before sending it.",
+            sub_tasks=[SubTask(id=uuid.uuid4(), name="Collect invoices", ordering=0, is_completed=False)],
+        )
+        self._create_task(orm_project.id, name="Groceries", note="Milk")
+
+        with db_session:
+            result = SQLSearchTasksByOwnerId().query(project_owner.id, phrase)
+
+        assert [found_task.id for found_task in result] == [task.id]
+        assert result[0].sub_tasks[0].name == "Collect invoices"
+
+    def test_query_is_scoped_to_owner(self, project_owner, orm_project, orm_random_project):
+        task = self._create_task(orm_project.id, name="Weekly planning", note="")
+        self._create_task(orm_random_project.id, name="Weekly planning", note="")
+
+        with db_session:
+            result = SQLSearchTasksByOwnerId().query(project_owner.id, "weekly")
+
+        assert [found_task.id for found_task in result] == [task.id]
+
+    def test_query_orders_tasks_by_relevance(self, project_owner, orm_project):
+        weaker_match = self._create_task(orm_project.id, name="Garden", note="Water the plants and then relax a bit.")
+        stronger_match = self._create_task(orm_project.id, name="Water plants", note="Water")
+
+        with db_session:
+            result = SQLSearchTasksByOwnerId().query(project_owner.id, "water")
+
+        assert [found_task.id for found_task in result] == [stronger_match.id, weaker_match.id]
+
+    def test_query_follows_updated_and_deleted_tasks(self, project_owner, orm_project):
+        task = self._create_task(orm_project.id, name="Draft", note="")
+        task.name = "Final version"
+
+        with db_session:
+            SQLTaskRepository().save(task)
+        with db_session:
+            assert SQLSearchTasksByOwnerId().query(project_owner.id, "draft") == []
+            assert [found_task.id for found_task in SQLSearchTasksByOwnerId().query(project_owner.id, "final")] == [
+                task.id
+            ]
+
+        with db_session:
+            SQLTaskRepository().delete(task.id)
+        with db_session:
+            assert SQLSearchTasksByOwnerId().query(project_owner.id, "final") == []
+
+    def test_query_ignores_tasks_of_removed_projects(self, project_owner, orm_project):
+        self._create_task(orm_project.id, name="Archived idea", note="")
+
+        with db_session:
+            ProjectModel[orm_project.id].deleted_at = datetime.now(tz=pytz.UTC)
+        with db_session:
+            assert SQLSearchTasksByOwnerId().query(project_owner.id, "archived") == []
+
+    @pytest.mark.parametrize("phrase", ["", "   ", '*-"()'])
+    def test_query_returns_empty_collection_for_phrase_without_terms(self, phrase, project_owner, orm_project):
+        self._create_task(orm_project.id)
+
+        with db_session:
+            assert SQLSearchTasksByOwnerId().query(project_owner.id, phrase) == []
+
+    def test_rebuilt_search_documents_cover_existing_tasks(self, project_owner, orm_project):
+        with db_session:
+            orm_task = ORMTaskFactory(project=orm_project.id, name="Imported task")
+
+        with db_session:
+            indexed_tasks_count = SQLTaskRepository.rebuild_search_documents(batch_size=2)
+            owned_tasks_count = TaskModel.select(lambda task: task.owner_id is not None).count()
+        with db_session:
+            result = SQLSearchTasksByOwnerId().query(project_owner.id, "imported")
+
+        assert indexed_tasks_count == owned_tasks_count
+        assert [found_task.id for found_task in result] == [orm_task.id]
@@ -0,0 +1,235 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from foundation.models import db
+from foundation.utils import with_tzinfo
+from foundation.value_objects import DateFrameDefinition
+from pomodoros import PomodoroEventType, PomodoroState
+from pomodoros.domain.date_frame_index import DateFrameIndex
+from pomodoros.domain.entities.pomodoro import Pomodoro
+from pomodoros_infrastructure import PomodoroEventModel, PomodoroModel
+from pomodoros_infrastructure.queries import SQLGetEventSourcedOverduePomodoros
+from pomodoros_infrastructure.repositories import SQLEventSourcedPomodoroRepository, SQLTaskRepository
+from pony.orm import db_session, flush, select
+
+
+@pytest.fixture()
+def start_date() -> datetime:
+    return datetime.now(tz=pytz.UTC) - timedelta(minutes=30)
+
+
+@pytest.fixture()
+def date_frame_definition() -> DateFrameDefinition:
+    return DateFrameDefinition(
+        pomodoro_length=timedelta(minutes=25),
+        break_length=timedelta(minutes=5),
+        longer_break_length=timedelta(minutes=15),
+        gap_between_long_breaks=3,
+    )
+
+
+@pytest.fixture()
+def paused_pomodoro_id(orm_task, start_date) -> uuid.UUID:
+    repo = SQLEventSourcedPomodoroRepository()
+
+    with db_session:
+        task = SQLTaskRepository().get(orm_task.id)
+        pomodoro = Pomodoro(id=uuid.uuid4(), task_id=task.id)
+        pomodoro.begin(task, DateFrameIndex(), start_date)
+        pomodoro.pause(task, start_date + timedelta(minutes=5))
+        repo.save(pomodoro, create=True)
+
+    return pomodoro.id
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestEventSourcedPomodoroRepository:
+    def test_repository_appends_events_and_snapshots_created_pomodoro(self, paused_pomodoro_id):
+        with db_session:
+            orm_pomodoro = PomodoroModel[paused_pomodoro_id]
+            orm_events = PomodoroEventModel.select(lambda event: event.pomodoro_id == paused_pomodoro_id)[:]
+
+            assert [PomodoroEventType(orm_event.type) for orm_event in orm_events] == [
+                PomodoroEventType.BEGIN,
+                PomodoroEventType.PAUSE,
+            ]
+            assert orm_pomodoro.state == PomodoroState.PAUSED.value
+            assert all(orm_event.folded for orm_event in orm_events)
+            assert len(orm_pomodoro.contained_pauses) == 1
+
+    def test_repository_applies_pending_events_without_touching_snapshot(
+        self, orm_task, paused_pomodoro_id, start_date
+    ):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            repo.save(pomodoro)
+
+        with db_session:
+            orm_pomodoro = PomodoroModel[paused_pomodoro_id]
+            fetched_pomodoro = repo.get(paused_pomodoro_id)
+
+            assert orm_pomodoro.state == PomodoroState.PAUSED.value
+            assert orm_pomodoro.paused_duration == timedelta(0)
+            assert fetched_pomodoro.state == PomodoroState.RUNNING
+            assert fetched_pomodoro.paused_duration == timedelta(minutes=3)
+            assert repo.get_many([paused_pomodoro_id])[0].paused_duration == timedelta(minutes=3)
+
+    def test_repository_appends_resume_without_touching_snapshot_row(
+        self, orm_task, paused_pomodoro_id, start_date, date_frame_definition
+    ):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            pomodoro.schedule_due_date(date_frame_definition)
+
+            db.merge_local_stats()
+            repo.save(pomodoro)
+            flush()
+            statements = [
+                sql
+                for sql, query_stat in db.local_stats.items()
+                for _ in range(query_stat.db_count)
+                if sql and not sql.startswith('SELECT "event"')
+            ]
+
+        assert len(statements) == 1
+        assert statements[0].startswith('INSERT INTO "pomodoro_events"')
+
+    def test_repository_derives_due_date_from_pending_events(
+        self, orm_task, paused_pomodoro_id, start_date, date_frame_definition
+    ):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            pomodoro.schedule_due_date(date_frame_definition)
+            repo.save(pomodoro)
+
+        expected_due_date = start_date + timedelta(minutes=28)
+        with db_session:
+            assert PomodoroModel[paused_pomodoro_id].due_date is None
+            assert repo.get(paused_pomodoro_id).due_date == expected_due_date
+            assert paused_pomodoro_id in [
+                overdue_pomodoro.id
+                for overdue_pomodoro in SQLGetEventSourcedOverduePomodoros().query(datetime.now(tz=pytz.UTC), 10)
+            ]
+
+        with db_session:
+            repo.fold_events([paused_pomodoro_id])
+
+        with db_session:
+            assert with_tzinfo(PomodoroModel[paused_pomodoro_id].due_date) == expected_due_date
+            assert repo.get(paused_pomodoro_id).due_date == expected_due_date
+
+    def test_repository_folds_pomodoro_rescheduled_without_new_events(
+        self, orm_task, paused_pomodoro_id, start_date, date_frame_definition
+    ):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            pomodoro.schedule_due_date(date_frame_definition)
+            repo.save(pomodoro)
+
+        with db_session:
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.due_date = None
+            repo.save(pomodoro)
+
+        with db_session:
+            assert not PomodoroEventModel.exists(pomodoro_id=paused_pomodoro_id, folded=False)
+            assert PomodoroModel[paused_pomodoro_id].state == PomodoroState.RUNNING.value
+            assert repo.get(paused_pomodoro_id).due_date is None
+
+    def test_fold_events_writes_pending_events_into_snapshot(self, orm_task, paused_pomodoro_id, start_date):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            repo.save(pomodoro)
+
+        with db_session:
+            folded_pomodoros_count = repo.fold_events([paused_pomodoro_id])
+
+        with db_session:
+            orm_pomodoro = PomodoroModel[paused_pomodoro_id]
+            orm_pause = orm_pomodoro.contained_pauses.select().first()
+
+            assert folded_pomodoros_count == 1
+            assert orm_pomodoro.state == PomodoroState.RUNNING.value
+            assert orm_pomodoro.paused_duration == timedelta(minutes=3)
+            assert orm_pause.end_date is not None
+            assert repo.fold_events([paused_pomodoro_id]) == 0
+
+    def test_fold_events_applies_late_committed_events_with_lower_ids(self, paused_pomodoro_id, start_date):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            lowest_event_id = min(select(event.id for event in PomodoroEventModel))
+            pause_id = PomodoroModel[paused_pomodoro_id].contained_pauses.select().first().id
+            PomodoroEventModel(
+                id=lowest_event_id - 1,
+                pomodoro_id=paused_pomodoro_id,
+                type=PomodoroEventType.RESUME.value,
+                date=start_date + timedelta(minutes=8),
+                pause_id=pause_id,
+            )
+
+        with db_session:
+            repo.fold_events()
+
+        with db_session:
+            assert PomodoroModel[paused_pomodoro_id].state == PomodoroState.RUNNING.value
+            assert not PomodoroEventModel.exists(pomodoro_id=paused_pomodoro_id, folded=False)
+
+    def test_repository_folds_events_of_finished_pomodoro_immediately(
+        self, orm_task, paused_pomodoro_id, start_date, date_frame_definition
+    ):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            pomodoro.finish(date_frame_definition, task, DateFrameIndex(), start_date + timedelta(minutes=25))
+            repo.save(pomodoro)
+
+        with db_session:
+            orm_pomodoro = PomodoroModel[paused_pomodoro_id]
+
+            assert orm_pomodoro.state == PomodoroState.FINISHED.value
+            assert orm_pomodoro.end_date is not None
+
+    def test_replay_rebuilds_pomodoro_from_event_log(self, orm_task, paused_pomodoro_id, start_date):
+        repo = SQLEventSourcedPomodoroRepository()
+
+        with db_session:
+            task = SQLTaskRepository().get(orm_task.id)
+            pomodoro = repo.get(paused_pomodoro_id)
+            pomodoro.resume(task, start_date + timedelta(minutes=8))
+            repo.save(pomodoro)
+
+        with db_session:
+            replayed_pomodoro = repo.replay(paused_pomodoro_id)
+            fetched_pomodoro = repo.get(paused_pomodoro_id)
+
+            assert replayed_pomodoro.task_id == fetched_pomodoro.task_id
+            assert replayed_pomodoro.start_date == fetched_pomodoro.start_date
+            assert replayed_pomodoro.contained_pauses == fetched_pomodoro.contained_pauses
+            assert replayed_pomodoro.state == fetched_pomodoro.state
+            assert replayed_pomodoro.paused_duration == fetched_pomodoro.paused_duration
@@ -4,8 +4,10 @@ from datetime import datetime, timedelta
 import pytest
 import pytz
 from foundation.exceptions import NotFound
+from foundation.utils import with_tzinfo
 from pomodoros.domain.entities.pause import Pause
 from pomodoros.domain.entities.pomodoro import Pomodoro
+from pomodoros_infrastructure import PomodoroModel
 from pomodoros_infrastructure.repositories import SQLPomodoroRepository
 from pony.orm import db_session, flush
 
@@ -55,6 +57,7 @@ class TestPomodoroRepository:
             domain_pomodoro.start_date = new_start_date
             new_end_date = domain_pomodoro.start_date + timedelta(minutes=5)
             domain_pomodoro.end_date = new_end_date
+            domain_pomodoro.paused_duration = timedelta(minutes=3)
 
             repo.save(domain_pomodoro)
             flush()
@@ -64,3 +67,34 @@ class TestPomodoroRepository:
 
             assert fetched_pomodoro.start_date == new_start_date
             assert fetched_pomodoro.end_date == new_end_date
+            assert fetched_pomodoro.paused_duration == timedelta(minutes=3)
+
+    def test_repository_exposes_pauses_of_created_pomodoro_in_the_same_session(self, orm_task):
+        repo = SQLPomodoroRepository()
+        start_date = datetime.now(tz=pytz.UTC)
+        pause = Pause(id=uuid.uuid4(), start_date=start_date + timedelta(minutes=1))
+        domain_pomodoro = Pomodoro(
+            id=uuid.uuid4(), task_id=orm_task.id, start_date=start_date, contained_pauses=[pause]
+        )
+
+        with db_session:
+            repo.save(domain_pomodoro, create=True)
+
+            assert [orm_pause.id for orm_pause in PomodoroModel[domain_pomodoro.id].contained_pauses] == [pause.id]
+
+    def test_repository_stores_due_date_of_pomodoro(self, orm_task):
+        repo = SQLPomodoroRepository()
+        start_date = datetime.now(tz=pytz.UTC)
+        due_date = start_date + timedelta(minutes=25)
+
+        with db_session:
+            domain_pomodoro = Pomodoro(id=uuid.uuid4(), task_id=orm_task.id, start_date=start_date, due_date=due_date)
+            repo.save(domain_pomodoro, create=True)
+
+        with db_session:
+            orm_pomodoro = PomodoroModel[domain_pomodoro.id]
+
+            assert with_tzinfo(orm_pomodoro.due_date) == due_date
+
+        with db_session:
+            assert repo.get(domain_pomodoro.id).due_date == due_date
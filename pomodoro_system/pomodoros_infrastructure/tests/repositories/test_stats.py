@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from foundation.models import db
+from pomodoros.tests.factories import PomodoroFactory
+from pomodoros_infrastructure.models import DailyStatsModel
+from pomodoros_infrastructure.repositories import SQLStatsRepository
+from pony.orm import db_session
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestSQLStatsRepository:
+    def test_repository_accumulates_finished_pomodoros_of_the_same_day(self, project_owner, orm_project, orm_task):
+        repo = SQLStatsRepository()
+        start_date = datetime.now(tz=pytz.UTC).replace(hour=10, minute=0)
+        pomodoros = [
+            PomodoroFactory(
+                task_id=orm_task.id,
+                start_date=start_date + timedelta(hours=hour),
+                end_date=start_date + timedelta(hours=hour, minutes=30),
+                paused_duration=timedelta(minutes=5),
+            )
+            for hour in range(2)
+        ]
+
+        with db_session:
+            for pomodoro in pomodoros:
+                repo.record_finished_pomodoro(project_owner.id, orm_project.id, pomodoro)
+
+        with db_session:
+            orm_daily_stats = DailyStatsModel.get(owner_id=project_owner.id, day=start_date.date())
+
+            assert orm_daily_stats.task_id == orm_task.id
+            assert orm_daily_stats.completed_pomodoros == 2
+            assert orm_daily_stats.focus_seconds == 2 * 25 * 60
+            assert orm_daily_stats.pause_seconds == 2 * 5 * 60
+
+    def test_repository_upserts_daily_stats_without_reading_them_first(self, project_owner, orm_project, orm_task):
+        pomodoro = PomodoroFactory(
+            task_id=orm_task.id,
+            start_date=datetime.now(tz=pytz.UTC).replace(hour=8, minute=0),
+            end_date=datetime.now(tz=pytz.UTC).replace(hour=8, minute=25),
+            paused_duration=timedelta(0),
+        )
+
+        with db_session:
+            db.merge_local_stats()
+            SQLStatsRepository().record_finished_pomodoro(project_owner.id, orm_project.id, pomodoro)
+            daily_stats_selects_count = sum(
+                query_stat.db_count
+                for sql, query_stat in db.local_stats.items()
+                if sql and sql.lstrip().startswith("SELECT") and "daily_stats" in sql
+            )
+
+        assert daily_stats_selects_count == 0
@@ -5,12 +5,15 @@ from random import randint
 import pytest
 import pytz
 from foundation.exceptions import NotFound
+from foundation.models import db
 from foundation.utils import with_tzinfo
 from foundation.value_objects import Color, DateFrameDefinition, Priority, PriorityLevel
-from pomodoros.domain.entities import Task
+from pomodoros.domain.entities import SubTask, Task
 from pomodoros.domain.value_objects import TaskStatus
-from pomodoros_infrastructure import SubTaskModel
+from pomodoros.tests.factories import TaskFactory
+from pomodoros_infrastructure import PomodoroModel, SubTaskModel, TaskModel
 from pomodoros_infrastructure.repositories import SQLTaskRepository
+from pomodoros_infrastructure.tests.factories import ORMTaskFactory
 from pony.orm import db_session, flush
 
 
@@ -106,3 +109,215 @@ class TestSQLTaskRepository:
             assert [getattr(fetched_task, field) for field in values_to_update.keys()] == [
                 values_to_update[field] for field in values_to_update.keys()
             ]
+
+    def test_repository_exposes_sub_tasks_of_created_task_in_the_same_session(self, orm_project):
+        repo = SQLTaskRepository()
+        sub_task = SubTask(id=uuid.uuid4(), name="sub task", ordering=1, is_completed=False)
+        domain_task = TaskFactory(
+            project_id=orm_project.id,
+            priority=Priority(Color("#952424"), PriorityLevel(randint(0, 3))),
+            sub_tasks=[sub_task],
+        )
+
+        with db_session:
+            repo.save(domain_task, create=True)
+
+            assert [orm_sub_task.id for orm_sub_task in TaskModel[domain_task.id].sub_tasks] == [sub_task.id]
+
+    def test_repository_increments_pomodoros_burn_down(self, orm_task):
+        repo = SQLTaskRepository()
+
+        with db_session:
+            repo.increment_pomodoros_burn_down(orm_task.id)
+            repo.increment_pomodoros_burn_down(orm_task.id)
+
+        with db_session:
+            fetched_task = repo.get(orm_task.id)
+
+            assert fetched_task.pomodoros_burn_down == orm_task.pomodoros_burn_down + 2
+
+    def test_repository_increments_pomodoros_burn_down_of_loaded_task(self, orm_task):
+        repo = SQLTaskRepository()
+
+        with db_session:
+            domain_task = repo.get(orm_task.id)
+            loaded_orm_task = TaskModel[orm_task.id]
+            repo.increment_pomodoros_burn_down(orm_task.id)
+
+            assert loaded_orm_task.pomodoros_burn_down == orm_task.pomodoros_burn_down + 1
+
+            domain_task.name = "renamed task"
+            repo.save(domain_task)
+
+        with db_session:
+            assert TaskModel[orm_task.id].pomodoros_burn_down == orm_task.pomodoros_burn_down + 1
+
+    def test_repository_increments_pomodoros_burn_down_with_a_single_relative_update(self, orm_task):
+        repo = SQLTaskRepository()
+
+        with db_session:
+            db.merge_local_stats()
+            repo.increment_pomodoros_burn_down(orm_task.id)
+            tasks_statements = [
+                sql
+                for sql, query_stat in db.local_stats.items()
+                for _ in range(query_stat.db_count)
+                if sql and "tasks" in sql
+            ]
+
+        assert len(tasks_statements) == 1
+        assert "pomodoros_burn_down = pomodoros_burn_down + 1" in tasks_statements[0]
+
+    def test_repository_schedules_reminder_again_when_reminder_date_changes(self, orm_task_with_due_reminder):
+        repo = SQLTaskRepository()
+        new_reminder_date = datetime.now(tz=pytz.UTC) + timedelta(hours=5)
+
+        with db_session:
+            TaskModel[orm_task_with_due_reminder.id].pending_reminder_date = None
+
+        with db_session:
+            domain_task = repo.get(orm_task_with_due_reminder.id)
+            repo.save(domain_task)
+
+        with db_session:
+            assert TaskModel[orm_task_with_due_reminder.id].pending_reminder_date is None
+
+        with db_session:
+            domain_task = repo.get(orm_task_with_due_reminder.id)
+            domain_task.reminder_date = new_reminder_date
+            repo.save(domain_task)
+
+        with db_session:
+            assert with_tzinfo(TaskModel[orm_task_with_due_reminder.id].pending_reminder_date) == new_reminder_date
+
+    def test_repository_schedules_renewal_when_repeatable_task_gets_completed(self, orm_task):
+        repo = SQLTaskRepository()
+
+        with db_session:
+            domain_task = repo.get(orm_task.id)
+            domain_task.complete()
+            repo.save(domain_task)
+
+        with db_session:
+            assert with_tzinfo(TaskModel[orm_task.id].pending_renewal_date) == domain_task.next_due_date
+
+        with db_session:
+            domain_task = repo.get(orm_task.id)
+            domain_task.reactivate([])
+            repo.save(domain_task)
+
+        with db_session:
+            assert TaskModel[orm_task.id].pending_renewal_date is None
+
+    def test_repository_renews_completed_tasks_within_horizon(
+        self, completed_orm_task_pending_renewal, completed_orm_task_pending_distant_renewal
+    ):
+        repo = SQLTaskRepository()
+        now = datetime.now(tz=pytz.UTC)
+
+        with db_session:
+            renewed_tasks_count = repo.renew_repeatable_tasks(now, timedelta(days=1), batch_size=1)
+
+        with db_session:
+            orm_task = TaskModel[completed_orm_task_pending_renewal.id]
+            renewed_orm_task = TaskModel.get(
+                lambda task: task.name == orm_task.name and task.status == TaskStatus.ACTIVE.value
+            )
+
+            assert renewed_tasks_count == 1
+            assert orm_task.pending_renewal_date is None
+            assert renewed_orm_task.due_date == orm_task.due_date + orm_task.renewal_interval
+            assert renewed_orm_task.pomodoros_burn_down == 0
+            assert [(sub_task.name, sub_task.is_completed) for sub_task in renewed_orm_task.sub_tasks] == [
+                ("sub task", False)
+            ]
+            assert TaskModel[completed_orm_task_pending_distant_renewal.id].pending_renewal_date is not None
+            assert repo.renew_repeatable_tasks(now, timedelta(days=1)) == 0
+
+    def test_repository_postpones_renewal_when_task_name_is_taken(
+        self, orm_project, completed_orm_task_pending_renewal
+    ):
+        repo = SQLTaskRepository()
+        now = datetime.now(tz=pytz.UTC)
+
+        with db_session:
+            TaskModel[completed_orm_task_pending_renewal.id].name = "taken name"
+            colliding_orm_task = ORMTaskFactory(project=orm_project.id, name="taken name")
+
+        with db_session:
+            renewed_tasks_count = repo.renew_repeatable_tasks(now, timedelta(0))
+
+        with db_session:
+            assert renewed_tasks_count == 0
+            assert with_tzinfo(TaskModel[completed_orm_task_pending_renewal.id].pending_renewal_date) > now
+
+        with db_session:
+            TaskModel[colliding_orm_task.id].status = TaskStatus.COMPLETED.value
+
+        with db_session:
+            renewed_tasks_count = repo.renew_repeatable_tasks(now + timedelta(days=1), timedelta(0))
+
+        with db_session:
+            assert renewed_tasks_count == 1
+            assert TaskModel[completed_orm_task_pending_renewal.id].pending_renewal_date is None
+
+    def test_repository_moves_owner_along_with_pinned_task(self, orm_running_pomodoro, orm_random_project):
+        repo = SQLTaskRepository()
+        task_id = orm_running_pomodoro.task.id
+
+        with db_session:
+            domain_task = repo.get(task_id)
+            domain_task.project_id = orm_random_project.id
+            repo.save(domain_task)
+
+        with db_session:
+            new_owner_id = orm_random_project.owner.id
+            assert TaskModel[task_id].owner_id == new_owner_id
+            assert PomodoroModel[orm_running_pomodoro.id].owner_id == new_owner_id
+
+    def test_repository_backfills_missing_owner_ids(self, orm_running_pomodoro, project_owner):
+        with db_session:
+            PomodoroModel[orm_running_pomodoro.id].owner_id = None
+            TaskModel[orm_running_pomodoro.task.id].owner_id = None
+
+        with db_session:
+            assert SQLTaskRepository.backfill_owner_ids() == (1, 1)
+
+        with db_session:
+            assert TaskModel[orm_running_pomodoro.task.id].owner_id == project_owner.id
+            assert PomodoroModel[orm_running_pomodoro.id].owner_id == project_owner.id
+            assert SQLTaskRepository.backfill_owner_ids() == (0, 0)
+
+    def test_repository_writes_only_changed_sub_tasks(self, orm_task_with_sub_tasks):
+        repo = SQLTaskRepository()
+
+        with db_session:
+            domain_task = repo.get(orm_task_with_sub_tasks.id)
+            kept_sub_task, renamed_sub_task, removed_sub_task = sorted(
+                domain_task.sub_tasks, key=lambda sub_task: sub_task.ordering
+            )
+            renamed_sub_task.name = "renamed sub task"
+            new_sub_task = SubTask(id=uuid.uuid4(), name="new sub task", ordering=4, is_completed=False)
+            domain_task.sub_tasks = [kept_sub_task, renamed_sub_task, new_sub_task]
+
+            db.merge_local_stats()
+            repo.save(domain_task)
+            flush()
+            sub_tasks_writes = [
+                sql.split()[0]
+                for sql, query_stat in db.local_stats.items()
+                for _ in range(query_stat.db_count)
+                if sql and "sub_tasks" in sql and not sql.startswith("SELECT")
+            ]
+
+        with db_session:
+            persisted_sub_tasks = {
+                orm_sub_task.id: orm_sub_task.name for orm_sub_task in TaskModel[orm_task_with_sub_tasks.id].sub_tasks
+            }
+
+            assert sorted(sub_tasks_writes) == ["DELETE", "INSERT", "UPDATE"]
+            assert persisted_sub_tasks == {
+                kept_sub_task.id: kept_sub_task.name,
+                renamed_sub_task.id: "renamed sub task",
+                new_sub_task.id: "new sub task",
+            }
@@ -0,0 +1,57 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from foundation.models import db
+from foundation.utils import with_tzinfo
+from pomodoros.domain.value_objects import FrameType
+from pomodoros_infrastructure import PauseModel, SubTaskModel
+from pomodoros_infrastructure.bulk_writer import bulk_insert
+from pony.orm import db_session
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestBulkInsert:
+    def test_bulk_insert_writes_rows_with_one_statement(self, orm_running_pomodoro):
+        start_date = datetime.now(tz=pytz.UTC).replace(microsecond=0)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "frame_type": FrameType.TYPE_PAUSE.value,
+                "start_date": start_date + timedelta(minutes=index),
+                "end_date": start_date + timedelta(minutes=index + 1),
+                "pomodoro": orm_running_pomodoro.id,
+            }
+            for index in range(3)
+        ]
+
+        with db_session:
+            db.merge_local_stats()
+            inserted_rows = bulk_insert(PauseModel, rows)
+            insert_statements = sum(
+                query_stat.db_count for sql, query_stat in db.local_stats.items() if sql and sql.startswith("INSERT")
+            )
+
+        with db_session:
+            persisted_dates = {
+                orm_pause.id: (with_tzinfo(orm_pause.start_date), with_tzinfo(orm_pause.end_date))
+                for orm_pause in PauseModel.select(lambda pause: pause.pomodoro.id == orm_running_pomodoro.id)
+            }
+
+            assert inserted_rows == 3
+            assert insert_statements == 1
+            assert persisted_dates == {row["id"]: (row["start_date"], row["end_date"]) for row in rows}
+
+    def test_bulk_insert_rejects_rows_without_required_strings(self, orm_task):
+        row = {"id": uuid.uuid4(), "task": orm_task.id, "ordering": 1, "is_completed": False}
+
+        with db_session:
+            with pytest.raises(ValueError):
+                bulk_insert(SubTaskModel, [row])
+
+            assert not SubTaskModel.exists(id=row["id"])
+
+    def test_bulk_insert_without_rows_does_nothing(self):
+        with db_session:
+            assert bulk_insert(PauseModel, []) == 0
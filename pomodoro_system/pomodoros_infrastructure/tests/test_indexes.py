@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from foundation.tests.query_plans import assert_uses_index
+from pomodoros.domain.value_objects import TaskStatus
+from pomodoros_infrastructure import PomodoroModel, TaskModel
+from pony.orm import db_session
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestIndexes:
+    @db_session
+    def test_task_name_lookup_uses_index(self, orm_project):
+        query = TaskModel.select(
+            lambda task: task.project.id == orm_project.id
+            and task.status == TaskStatus.ACTIVE.value
+            and task.name == "task name"
+        )
+
+        assert_uses_index(query, "idx_tasks__project_status_name")
+
+    @db_session
+    def test_tasks_due_date_range_uses_index(self):
+        now = datetime.now(tz=pytz.UTC)
+        query = TaskModel.select(lambda task: task.due_date >= now and task.due_date < now + timedelta(days=1))
+
+        assert_uses_index(query, "idx_tasks__due_date")
+
+    @db_session
+    def test_task_pomodoros_by_start_date_use_index(self, orm_task):
+        now = datetime.now(tz=pytz.UTC)
+        query = PomodoroModel.select(lambda pomodoro: pomodoro.task.id == orm_task.id and pomodoro.start_date >= now)
+
+        assert_uses_index(query, "idx_pomodoros__task_start_date")
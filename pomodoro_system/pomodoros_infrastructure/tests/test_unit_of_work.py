@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+from foundation.models import db
+from pomodoros_infrastructure import PomodoroModel, SQLUnitOfWork, TaskModel
+from pony.orm import db_session, rollback
+
+
+@pytest.mark.usefixtures("setup_teardown_tables")
+class TestSQLUnitOfWork:
+    def test_unit_of_work_loads_each_aggregate_once(self, orm_running_pomodoro):
+        with db_session, SQLUnitOfWork() as unit_of_work:
+            pomodoro = unit_of_work.pomodoros.get(orm_running_pomodoro.id)
+            task = unit_of_work.tasks.get(pomodoro.task_id)
+
+            assert unit_of_work.pomodoros.get(orm_running_pomodoro.id) is pomodoro
+            assert unit_of_work.tasks.get(pomodoro.task_id) is task
+
+    def test_unit_of_work_writes_only_changed_values(self, orm_task):
+        with db_session:
+            with SQLUnitOfWork() as unit_of_work:
+                task = unit_of_work.tasks.get(orm_task.id)
+                task.pomodoros_to_do += 1
+                values = unit_of_work.tasks._get_values(task)
+
+                assert unit_of_work.identity_map.get_changes(task, values) == {
+                    "pomodoros_to_do": orm_task.pomodoros_to_do + 1
+                }
+
+                unit_of_work.tasks.save(task)
+
+                assert unit_of_work.identity_map.get_changes(task, values) == {}
+
+        with db_session:
+            assert TaskModel[orm_task.id].pomodoros_to_do == orm_task.pomodoros_to_do + 1
+
+    def test_unit_of_work_flushes_dirty_fields_and_commits_once(self, orm_task):
+        with db_session:
+            with SQLUnitOfWork() as unit_of_work:
+                task = unit_of_work.tasks.get(orm_task.id)
+                unit_of_work.tasks.increment_pomodoros_burn_down(task.id)
+                task.pomodoros_to_do += 1
+                unit_of_work.tasks.save(task)
+                db.merge_local_stats()
+
+            tasks_writes = [
+                sql
+                for sql, query_stat in db.local_stats.items()
+                for _ in range(query_stat.db_count)
+                if sql and sql.startswith('UPDATE "tasks"')
+            ]
+
+            assert len(tasks_writes) == 1
+            assert tasks_writes[0].startswith('UPDATE "tasks"\nSET "pomodoros_to_do" = ?\n')
+
+            rollback()
+
+        with db_session:
+            assert TaskModel[orm_task.id].pomodoros_to_do == orm_task.pomodoros_to_do + 1
+            assert TaskModel[orm_task.id].pomodoros_burn_down == orm_task.pomodoros_burn_down + 1
+
+    def test_unit_of_work_discards_changes_on_error(self, orm_running_pomodoro):
+        with db_session:
+            with pytest.raises(ValueError):
+                with SQLUnitOfWork() as unit_of_work:
+                    pomodoro = unit_of_work.pomodoros.get(orm_running_pomodoro.id)
+                    pomodoro.paused_duration += timedelta(minutes=1)
+                    unit_of_work.pomodoros.save(pomodoro)
+                    raise ValueError
+
+            assert unit_of_work.identity_map.get(type(pomodoro), orm_running_pomodoro.id) is None
+
+        with db_session:
+            assert PomodoroModel[orm_running_pomodoro.id].paused_duration == orm_running_pomodoro.paused_duration
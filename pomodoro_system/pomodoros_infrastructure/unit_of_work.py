@@ -0,0 +1,28 @@
+from pomodoros import UnitOfWork
+from pomodoros_infrastructure.identity_map import IdentityMap
+from pomodoros_infrastructure.repositories import (
+    SQLEventSourcedPomodoroRepository,
+    SQLPomodoroRepository,
+    SQLTaskRepository,
+)
+from pony.orm import commit, rollback
+
+
+class SQLUnitOfWork(UnitOfWork):
+    def __init__(self, event_sourced_pomodoros: bool = False) -> None:
+        self.identity_map = IdentityMap()
+        if event_sourced_pomodoros:
+            self.pomodoros = SQLEventSourcedPomodoroRepository(self.identity_map)
+        else:
+            self.pomodoros = SQLPomodoroRepository(self.identity_map)
+        self.tasks = SQLTaskRepository(self.identity_map)
+
+    def commit(self) -> None:
+        commit()
+        # Committed objects keep the values they were written with, which a later read could not match.
+        rollback()
+        self.identity_map.clear()
+
+    def rollback(self) -> None:
+        rollback()
+        self.identity_map.clear()
@@ -9,7 +9,7 @@ from flask_security.confirmable import generate_confirmation_token
 from flask_security.utils import get_token_status, verify_hash
 from foundation.exceptions import DomainValidationError, NotFound
 from foundation.i18n import N_
-from foundation.models import User
+from foundation.models import User, db
 from foundation.value_objects import UserId
 from pony.orm import ObjectNotFound, desc, select
 from web_app.authentication.models.token import Token
@@ -35,19 +35,20 @@ def _get_user_agent_data() -> dict:
     }
 
 
-def add_token_to_database(encoded_token, identity_claim: str = None):
+def add_token_to_database(*encoded_tokens, identity_claim: str = None):
     identity_claim = current_app.config["JWT_IDENTITY_CLAIM"] if identity_claim is None else identity_claim
-    decoded_token = decode_token(encoded_token)
-    jti = decoded_token["jti"]
-    token_type = decoded_token["type"]
-    user_identity = decoded_token[identity_claim]
-    expires = _epoch_utc_to_datetime(decoded_token["exp"])
-    revoked = False
     user_agent_data = _get_user_agent_data()
 
-    Token(
-        jti=jti, token_type=token_type, user_identity=user_identity, expires=expires, revoked=revoked, **user_agent_data
-    )
+    for encoded_token in encoded_tokens:
+        decoded_token = decode_token(encoded_token)
+        Token(
+            jti=decoded_token["jti"],
+            token_type=decoded_token["type"],
+            user_identity=decoded_token[identity_claim],
+            expires=_epoch_utc_to_datetime(decoded_token["exp"]),
+            revoked=False,
+            **user_agent_data,
+        )
 
 
 def is_token_revoked(decoded_token):
@@ -66,12 +67,21 @@ def get_user_tokens(user_identity, **additional_filters) -> List[Token]:
     return Token.select().filter(user_identity=user_identity, **additional_filters).sort_by(desc(Token.expires))
 
 
-def revoke_all_tokens(user_identity):
-    user_active_tokens = get_user_tokens(user_identity, revoked=False)
+def revoke_all_tokens(*user_identities: UserId) -> int:
+    if not user_identities:
+        return 0
 
-    # PonyORM does not support bulk update
-    for token in user_active_tokens:
-        token.revoked = True
+    user_identity_converter = Token.user_identity.converters[0]
+    arguments = {
+        f"user_identity_{index}": user_identity_converter.py2sql(user_identity)
+        for index, user_identity in enumerate(user_identities)
+    }
+    placeholders = ", ".join(f"${argument_name}" for argument_name in arguments)
+    cursor = db.execute(
+        f"UPDATE tokens SET revoked = $revoked WHERE revoked = $not_revoked AND user_identity IN ({placeholders})",
+        {"revoked": True, "not_revoked": False, **arguments},
+    )
+    return cursor.rowcount
 
 
 def update_token(token: Type[Token], token_data: dict) -> Optional[Type[Token]]:
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from foundation.models import db
+from foundation.models import db, index_registry
 from pony.orm import Optional, PrimaryKey, Required
 
 
@@ -17,3 +17,8 @@ class Token(db.Entity):
     browser = Optional(str)
     platform = Optional(str)
     ip_address = Required(str)
+
+
+index_registry.register(Token, "jti", "revoked")
+index_registry.register(Token, "expires")
+index_registry.register(Token, "user_identity", name="idx_tokens__user_identity_active", where="revoked = false")
@@ -1,26 +1,82 @@
 import http
 import uuid
+from typing import Iterable, NoReturn, Optional
 
 from flask import abort
-from foundation.exceptions import DomainValidationError
+from foundation.exceptions import DomainValidationError, NotFound
 from foundation.i18n import N_
-from foundation.interfaces import ResourceProtector
+from foundation.interfaces import OwnershipCache, ResourceProtector
 from foundation.value_objects import UserId
+from pomodoros import PomodoroRepository
+from pomodoros.domain.entities.pomodoro import Pomodoro
 from pomodoros_infrastructure import PomodoroModel
 from pony.orm import select
 
 
 class PomodoroProtector(ResourceProtector):
+    resource_name = "pomodoro"
+
+    def __init__(
+        self, pomodoro_repository: PomodoroRepository, ownership_cache: Optional[OwnershipCache] = None
+    ) -> None:
+        super().__init__(ownership_cache)
+        self.pomodoro_repository = pomodoro_repository
+
+    @staticmethod
+    def _abort_not_found(abort_if_none: bool) -> NoReturn:
+        if abort_if_none:
+            abort(http.HTTPStatus.NOT_FOUND)
+        raise DomainValidationError({"pomodoro_id": N_("Selected pomodoro does not exist.")})
+
     def authorize(self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True) -> None:
-        pomodoro_id, owner_id = select(
-            (pomodoro.id, pomodoro.task.project.owner.id) for pomodoro in PomodoroModel if pomodoro.id == resource_id
-        ).get() or (None, None)
+        owner_id = self.get_cached_owner_id(resource_id)
 
-        if pomodoro_id is None:
-            if abort_if_none:
-                abort(http.HTTPStatus.NOT_FOUND)
-            else:
-                raise DomainValidationError({"pomodoro_id": N_("Selected pomodoro does not exist.")})
+        if owner_id is None:
+            pomodoro_id, owner_id = select(
+                (pomodoro.id, pomodoro.owner_id) for pomodoro in PomodoroModel if pomodoro.id == resource_id
+            ).get() or (None, None)
+
+            if pomodoro_id is None:
+                self._abort_not_found(abort_if_none)
+            self.cache_owner_id(resource_id, owner_id)
+
+        if requester_id != owner_id:
+            abort(http.HTTPStatus.FORBIDDEN)
+
+    def authorize_and_get(
+        self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True, for_update: bool = False
+    ) -> Pomodoro:
+        cached_owner_id = self.get_cached_owner_id(resource_id)
+        if cached_owner_id is not None and requester_id != cached_owner_id:
+            abort(http.HTTPStatus.FORBIDDEN)
+
+        try:
+            pomodoro, owner_id = self.pomodoro_repository.get_with_owner_id(resource_id, for_update=for_update)
+        except NotFound:
+            self._abort_not_found(abort_if_none)
+        self.cache_owner_id(resource_id, owner_id)
 
         if requester_id != owner_id:
             abort(http.HTTPStatus.FORBIDDEN)
+        return pomodoro
+
+    def authorize_many(self, requester_id: UserId, resource_ids: Iterable[uuid.UUID]) -> None:
+        owner_ids = {}
+        uncached_ids = []
+        for resource_id in set(resource_ids):
+            cached_owner_id = self.get_cached_owner_id(resource_id)
+            if cached_owner_id is not None:
+                owner_ids[resource_id] = cached_owner_id
+            else:
+                uncached_ids.append(resource_id)
+
+        if uncached_ids:
+            for pomodoro_id, owner_id in select(
+                (pomodoro.id, pomodoro.owner_id) for pomodoro in PomodoroModel if pomodoro.id in uncached_ids
+            ):
+                self.cache_owner_id(pomodoro_id, owner_id)
+                owner_ids[pomodoro_id] = owner_id
+
+        # Ids missing from owner_ids do not exist and are reported by the use case, a row without an owner is denied.
+        if any(owner_id is None or owner_id != requester_id for owner_id in owner_ids.values()):
+            abort(http.HTTPStatus.FORBIDDEN)
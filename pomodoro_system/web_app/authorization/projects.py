@@ -11,18 +11,24 @@ from pony.orm import select
 
 
 class ProjectProtector(ResourceProtector):
+    resource_name = "project"
+
     def authorize(self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True) -> None:
-        project_id, owner_id = select(
-            (project.id, project.owner.id)
-            for project in ProjectModel
-            if project.id == resource_id and project.deleted_at is None
-        ).get() or (None, None)
+        owner_id = self.get_cached_owner_id(resource_id)
+
+        if owner_id is None:
+            project_id, owner_id = select(
+                (project.id, project.owner.id)
+                for project in ProjectModel
+                if project.id == resource_id and project.deleted_at is None
+            ).get() or (None, None)
 
-        if project_id is None:
-            if abort_if_none:
-                abort(http.HTTPStatus.NOT_FOUND)
-            else:
-                raise DomainValidationError({"project_id": N_("Selected project does not exist.")})
+            if project_id is None:
+                if abort_if_none:
+                    abort(http.HTTPStatus.NOT_FOUND)
+                else:
+                    raise DomainValidationError({"project_id": N_("Selected project does not exist.")})
+            self.cache_owner_id(resource_id, owner_id)
 
         if requester_id != owner_id:
             abort(http.HTTPStatus.FORBIDDEN)
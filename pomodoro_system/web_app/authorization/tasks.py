@@ -1,26 +1,78 @@
 import http
 import uuid
+from typing import Iterable, NoReturn, Optional
 
 from flask import abort
-from foundation.exceptions import DomainValidationError
+from foundation.exceptions import DomainValidationError, NotFound
 from foundation.i18n import N_
-from foundation.interfaces import ResourceProtector
+from foundation.interfaces import OwnershipCache, ResourceProtector
 from foundation.value_objects import UserId
+from pomodoros import TaskRepository
+from pomodoros.domain.entities import Task
 from pomodoros_infrastructure import TaskModel
 from pony.orm import select
 
 
 class TaskProtector(ResourceProtector):
+    resource_name = "task"
+
+    def __init__(self, task_repository: TaskRepository, ownership_cache: Optional[OwnershipCache] = None) -> None:
+        super().__init__(ownership_cache)
+        self.task_repository = task_repository
+
+    @staticmethod
+    def _abort_not_found(abort_if_none: bool) -> NoReturn:
+        if abort_if_none:
+            abort(http.HTTPStatus.NOT_FOUND)
+        raise DomainValidationError({"task_id": N_("Selected task does not exist.")})
+
     def authorize(self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True) -> None:
-        task_id, owner_id = select(
-            (task.id, task.project.owner.id) for task in TaskModel if task.id == resource_id
-        ).get() or (None, None)
+        owner_id = self.get_cached_owner_id(resource_id)
 
-        if task_id is None:
-            if abort_if_none:
-                abort(http.HTTPStatus.NOT_FOUND)
-            else:
-                raise DomainValidationError({"task_id": N_("Selected task does not exist.")})
+        if owner_id is None:
+            task_id, owner_id = select(
+                (task.id, task.owner_id) for task in TaskModel if task.id == resource_id
+            ).get() or (None, None)
+
+            if task_id is None:
+                self._abort_not_found(abort_if_none)
+            self.cache_owner_id(resource_id, owner_id)
+
+        if requester_id != owner_id:
+            abort(http.HTTPStatus.FORBIDDEN)
+
+    def authorize_and_get(
+        self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True, for_update: bool = False
+    ) -> Task:
+        cached_owner_id = self.get_cached_owner_id(resource_id)
+        if cached_owner_id is not None and requester_id != cached_owner_id:
+            abort(http.HTTPStatus.FORBIDDEN)
+
+        try:
+            task, owner_id = self.task_repository.get_with_owner_id(resource_id, for_update=for_update)
+        except NotFound:
+            self._abort_not_found(abort_if_none)
+        self.cache_owner_id(resource_id, owner_id)
 
         if requester_id != owner_id:
             abort(http.HTTPStatus.FORBIDDEN)
+        return task
+
+    def authorize_many(self, requester_id: UserId, resource_ids: Iterable[uuid.UUID]) -> None:
+        owner_ids = {}
+        uncached_ids = []
+        for resource_id in set(resource_ids):
+            cached_owner_id = self.get_cached_owner_id(resource_id)
+            if cached_owner_id is not None:
+                owner_ids[resource_id] = cached_owner_id
+            else:
+                uncached_ids.append(resource_id)
+
+        if uncached_ids:
+            for task_id, owner_id in select((task.id, task.owner_id) for task in TaskModel if task.id in uncached_ids):
+                self.cache_owner_id(task_id, owner_id)
+                owner_ids[task_id] = owner_id
+
+        # Ids missing from owner_ids do not exist and are reported by the use case, a row without an owner is denied.
+        if any(owner_id is None or owner_id != requester_id for owner_id in owner_ids.values()):
+            abort(http.HTTPStatus.FORBIDDEN)
@@ -11,16 +11,22 @@ from web_app.authentication.models.token import Token
 
 
 class TokenProtector(ResourceProtector):
+    resource_name = "token"
+
     def authorize(self, requester_id: UserId, resource_id: uuid.UUID, abort_if_none: bool = True) -> None:
-        token_id, token_owner_id = select(
-            (token.id, token.user_identity) for token in Token if token.id == resource_id
-        ).get() or (None, None)
+        token_owner_id = self.get_cached_owner_id(resource_id)
+
+        if token_owner_id is None:
+            token_id, token_owner_id = select(
+                (token.id, token.user_identity) for token in Token if token.id == resource_id
+            ).get() or (None, None)
 
-        if token_id is None:
-            if abort_if_none:
-                abort(http.HTTPStatus.NOT_FOUND)
-            else:
-                raise DomainValidationError({"token_id": N_("Selected token does not exist.")})
+            if token_id is None:
+                if abort_if_none:
+                    abort(http.HTTPStatus.NOT_FOUND)
+                else:
+                    raise DomainValidationError({"token_id": N_("Selected token does not exist.")})
+            self.cache_owner_id(resource_id, token_owner_id)
 
         if requester_id != token_owner_id:
             abort(http.HTTPStatus.FORBIDDEN)
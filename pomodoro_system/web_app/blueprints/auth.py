@@ -104,8 +104,7 @@ def login() -> Response:
         access_token = create_access_token(user, fresh=True)
         refresh_token = create_refresh_token(user)
 
-        add_token_to_database(access_token)
-        add_token_to_database(refresh_token)
+        add_token_to_database(access_token, refresh_token)
 
         if user:
             payload.update(
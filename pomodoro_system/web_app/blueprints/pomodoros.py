@@ -2,8 +2,8 @@ import http
 from datetime import datetime
 from uuid import UUID
 
-from flask import Response
-from flask_apispec import doc, marshal_with
+from flask import Response, jsonify, make_response
+from flask_apispec import doc, marshal_with, use_kwargs
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from foundation.utils import to_utc
 from pomodoros import (
@@ -13,6 +13,7 @@ from pomodoros import (
     FinishPomodoro,
     FinishPomodoroInputDto,
     FinishPomodoroOutputBoundary,
+    GetActivePomodoro,
     PausePomodoro,
     PausePomodoroInputDto,
     PausePomodoroOutputBoundary,
@@ -20,28 +21,50 @@ from pomodoros import (
     ResumePomodoro,
     ResumePomodoroInputDto,
     ResumePomodoroOutputBoundary,
+    SyncPomodoros,
+    SyncPomodorosInputDto,
+    SyncPomodorosOutputBoundary,
     TaskId,
 )
 from web_app.authorization.pomodoros import PomodoroProtector
 from web_app.authorization.tasks import TaskProtector
 from web_app.docs_definitions.language import language_header_definition
 from web_app.marshallers.pomodoros import (
+    ActivePomodoroSchema,
     BeginPomodoroSchema,
     FinishPomodoroSchema,
     PausePomodoroSchema,
     ResumePomodoroSchema,
+    SyncPomodorosResultSchema,
+    SyncPomodorosSchema,
 )
 from web_app.utils import RegistrableBlueprint, get_dto_or_abort
 
 pomodoros_blueprint = RegistrableBlueprint("pomodoros", __name__, url_prefix="/pomodoros")
 
 
+@doc(
+    description="Get the currently running or paused pomodoro of the authenticated user.",
+    tags=(pomodoros_blueprint.name,),
+)
+@marshal_with(ActivePomodoroSchema, http.HTTPStatus.OK)
+@marshal_with(None, code=http.HTTPStatus.NO_CONTENT, description="The user has no running or paused pomodoro.")
+@pomodoros_blueprint.route("/active", methods=["GET"])
+@jwt_required
+def get_active_pomodoro(active_pomodoro_query: GetActivePomodoro) -> Response:
+    active_pomodoro = active_pomodoro_query.query(UUID(get_jwt_identity()))
+
+    if active_pomodoro is None:
+        return make_response("", http.HTTPStatus.NO_CONTENT)
+    return jsonify(ActivePomodoroSchema().dump(active_pomodoro)), http.HTTPStatus.OK
+
+
 @doc(
     description="Takes the task id (UUID string) and starts a pomodoro upon the task.",
     params={**language_header_definition},
     tags=(pomodoros_blueprint.name,),
 )
-@marshal_with(BeginPomodoroSchema, http.HTTPStatus.CREATED)
+@marshal_with(BeginPomodoroSchema(exclude=("owner_id",)), http.HTTPStatus.CREATED)
 @pomodoros_blueprint.route("/<uuid:task_id>/begin", methods=["POST"])
 @jwt_required
 def begin_pomodoro(
@@ -52,7 +75,11 @@ def begin_pomodoro(
 ) -> Response:
     input_dto: BeginPomodoroInputDto = get_dto_or_abort(
         BeginPomodoroSchema,
-        {"task_id": task_id, "start_date": str(to_utc(datetime.now()))},
+        {
+            "task_id": task_id,
+            "start_date": str(to_utc(datetime.now())),
+            "owner_id": UUID(get_jwt_identity()),
+        },
     )
     protector.authorize(UUID(get_jwt_identity()), task_id)
 
@@ -78,7 +105,7 @@ def pause_pomodoro(
         PausePomodoroSchema,
         {"pomodoro_id": pomodoro_id, "pause_date": str(to_utc(datetime.now()))},
     )
-    protector.authorize(UUID(get_jwt_identity()), pomodoro_id)
+    protector.authorize_and_get(UUID(get_jwt_identity()), pomodoro_id, for_update=True)
 
     pause_pomodoro_uc.execute(input_dto)
     return presenter.response
@@ -89,7 +116,7 @@ def pause_pomodoro(
     params={**language_header_definition},
     tags=(pomodoros_blueprint.name,),
 )
-@marshal_with(ResumePomodoroSchema, http.HTTPStatus.OK)
+@marshal_with(ResumePomodoroSchema(exclude=("owner_id",)), http.HTTPStatus.OK)
 @pomodoros_blueprint.route("/<uuid:pomodoro_id>/resume", methods=["POST"])
 @jwt_required
 def resume_pomodoro(
@@ -100,9 +127,13 @@ def resume_pomodoro(
 ) -> Response:
     input_dto: ResumePomodoroInputDto = get_dto_or_abort(
         ResumePomodoroSchema,
-        {"pomodoro_id": pomodoro_id, "resume_date": str(to_utc(datetime.now()))},
+        {
+            "pomodoro_id": pomodoro_id,
+            "resume_date": str(to_utc(datetime.now())),
+            "owner_id": UUID(get_jwt_identity()),
+        },
     )
-    protector.authorize(UUID(get_jwt_identity()), pomodoro_id)
+    protector.authorize_and_get(UUID(get_jwt_identity()), pomodoro_id, for_update=True)
 
     resume_pomodoro_uc.execute(input_dto)
     return presenter.response
@@ -130,7 +161,32 @@ def finish_pomodoro(
             "owner_id": UUID(get_jwt_identity()),
         },
     )
-    protector.authorize(UUID(get_jwt_identity()), pomodoro_id)
+    protector.authorize_and_get(UUID(get_jwt_identity()), pomodoro_id, for_update=True)
 
     finish_pomodoro_uc.execute(input_dto)
     return presenter.response
+
+
+@doc(
+    description="Takes an ordered batch of pomodoro events queued by an offline client and applies them at once. "
+    "Every event gets its own result, the events that failed do not prevent the others from being saved.",
+    params={**language_header_definition},
+    tags=(pomodoros_blueprint.name,),
+)
+@use_kwargs(SyncPomodorosSchema(exclude=("owner_id",)))
+@marshal_with(SyncPomodorosResultSchema, http.HTTPStatus.OK)
+@pomodoros_blueprint.route("/sync", methods=["POST"])
+@jwt_required
+def sync_pomodoros(
+    sync_pomodoros_uc: SyncPomodoros,
+    presenter: SyncPomodorosOutputBoundary,
+    task_protector: TaskProtector,
+    pomodoro_protector: PomodoroProtector,
+) -> Response:
+    owner_id = UUID(get_jwt_identity())
+    input_dto: SyncPomodorosInputDto = get_dto_or_abort(SyncPomodorosSchema, {"owner_id": owner_id})
+    task_protector.authorize_many(owner_id, {event.task_id for event in input_dto.events if event.task_id})
+    pomodoro_protector.authorize_many(owner_id, {event.pomodoro_id for event in input_dto.events})
+
+    sync_pomodoros_uc.execute(input_dto)
+    return presenter.response
@@ -1,7 +1,7 @@
 import http
 from uuid import UUID
 
-from flask import Response, g, jsonify, make_response, request
+from flask import Response, current_app, g, jsonify, make_response, request
 from flask_apispec import doc, marshal_with, use_kwargs
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from foundation.exceptions import DomainValidationError
@@ -12,7 +12,13 @@ from pomodoros_infrastructure import ProjectModel
 from web_app.authorization.projects import ProjectProtector
 from web_app.docs_definitions.language import language_header_definition
 from web_app.marshallers.projects import ProjectRestSchema
-from web_app.utils import RegistrableBlueprint, load_int_query_parameter
+from web_app.utils import (
+    RegistrableBlueprint,
+    accepts_ndjson,
+    add_next_cursor_header,
+    load_int_query_parameter,
+    stream_ndjson,
+)
 
 projects_blueprint = RegistrableBlueprint("projects", __name__, url_prefix="/projects")
 
@@ -45,10 +51,11 @@ def get_project(
 
 
 @doc(
-    description="Get project list.",
+    description="Get project list. Send Accept: application/x-ndjson to stream it as newline-delimited JSON.",
     params={
         "page_size": {"in": "query", "required": False},
         "page": {"in": "query", "required": False},
+        "cursor": {"in": "query", "required": False},
         "sort": {
             "in": "query",
             "required": False,
@@ -79,10 +86,19 @@ def get_project_list(
     }
     g.default_sort_fields = ["created_at"]
     request_user_id = UUID(get_jwt_identity())
-    return jsonify(
-        ProjectRestSchema(
-            many=True,
-        ).dump(projects_by_owner_id_query.query(request_user_id))
+
+    if accepts_ndjson():
+        return stream_ndjson(
+            projects_by_owner_id_query.iterate(request_user_id, chunk_size=current_app.config["STREAM_CHUNK_SIZE"]),
+            ProjectRestSchema(many=False),
+        )
+
+    return add_next_cursor_header(
+        jsonify(
+            ProjectRestSchema(
+                many=True,
+            ).dump(projects_by_owner_id_query.query(request_user_id))
+        )
     )
 
 
@@ -162,5 +178,6 @@ def delete_project(project_id: ProjectId, project_repository: ProjectRepository,
     project_protector.authorize(UUID(get_jwt_identity()), project_id)
     permanently = bool(load_int_query_parameter(request.args.get("permanently")))
     project_repository.delete(project_id, permanently)
+    project_protector.forget(project_id)
 
     return make_response("", http.HTTPStatus.NO_CONTENT)
@@ -0,0 +1,32 @@
+import http
+from uuid import UUID
+
+from flask import Response, jsonify, request
+from flask_apispec import doc, marshal_with, use_kwargs
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from marshmallow import ValidationError
+from pomodoros import GetPomodoroStats
+from web_app.docs_definitions.language import language_header_definition
+from web_app.marshallers.stats import StatsFilterSchema, StatsSchema
+from web_app.utils import RegistrableBlueprint
+
+stats_blueprint = RegistrableBlueprint("stats", __name__, url_prefix="/stats")
+
+
+@doc(
+    description="Get the completed pomodoros, focus and pause time of the user aggregated per day, week or month.",
+    params={**language_header_definition},
+    tags=(stats_blueprint.name,),
+)
+@use_kwargs(StatsFilterSchema, location="query")
+@marshal_with(StatsSchema(many=True), http.HTTPStatus.OK)
+@stats_blueprint.route("/", methods=["GET"])
+@jwt_required
+def get_stats(get_pomodoro_stats_query: GetPomodoroStats) -> Response:
+    try:
+        filter_fields = StatsFilterSchema().load(request.args)
+    except ValidationError as error:
+        return jsonify(error.messages), http.HTTPStatus.BAD_REQUEST
+
+    result = get_pomodoro_stats_query.query(owner_id=UUID(get_jwt_identity()), **filter_fields)
+    return jsonify(StatsSchema(many=True).dump(result)), http.HTTPStatus.OK
@@ -2,7 +2,7 @@ import http
 from datetime import datetime
 from uuid import UUID
 
-from flask import Response, g, jsonify, make_response, request
+from flask import Response, current_app, g, jsonify, make_response, request
 from flask_apispec import doc, marshal_with, use_kwargs
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from foundation.exceptions import DomainValidationError
@@ -19,6 +19,7 @@ from pomodoros import (
     ReactivateTask,
     ReactivateTaskInputDto,
     ReactivateTaskOutputBoundary,
+    SearchTasksByOwnerId,
     TaskId,
     TaskRepository,
 )
@@ -32,8 +33,9 @@ from web_app.marshallers.tasks import (
     ReactivateTaskSchema,
     TaskFilterSchema,
     TaskRestSchema,
+    TaskSearchSchema,
 )
-from web_app.utils import RegistrableBlueprint, get_dto_or_abort
+from web_app.utils import RegistrableBlueprint, accepts_ndjson, add_next_cursor_header, get_dto_or_abort, stream_ndjson
 
 tasks_blueprint = RegistrableBlueprint("tasks", __name__, url_prefix="/tasks")
 
@@ -46,16 +48,18 @@ tasks_blueprint = RegistrableBlueprint("tasks", __name__, url_prefix="/tasks")
 @marshal_with(TaskRestSchema(many=False), http.HTTPStatus.OK)
 @tasks_blueprint.route("/<uuid:task_id>", methods=["GET"])
 @jwt_required
-def get_task(task_id: TaskId, task_repository: TaskRepository, task_protector: TaskProtector) -> Response:
-    task_protector.authorize(UUID(get_jwt_identity()), task_id)
-    return jsonify(TaskRestSchema(many=False).dump(task_repository.get(task_id))), http.HTTPStatus.OK
+def get_task(task_id: TaskId, task_protector: TaskProtector) -> Response:
+    task = task_protector.authorize_and_get(UUID(get_jwt_identity()), task_id)
+    return jsonify(TaskRestSchema(many=False).dump(task)), http.HTTPStatus.OK
 
 
 @doc(
-    description="Get task list for a project_id specified in url.",
+    description="Get task list for a project_id specified in url. "
+    "Send Accept: application/x-ndjson to stream it as newline-delimited JSON.",
     params={
         "page_size": {"in": "query", "required": False},
         "page": {"in": "query", "required": False},
+        "cursor": {"in": "query", "required": False},
         "sort": {
             "in": "query",
             "required": False,
@@ -90,10 +94,40 @@ def get_task_list(
     except ValidationError as error:
         filter_fields = error.valid_data
 
+    if accepts_ndjson():
+        return stream_ndjson(
+            get_task_list_by_owner_id_query.iterate(
+                owner_id=current_user, chunk_size=current_app.config["STREAM_CHUNK_SIZE"], filter_fields=filter_fields
+            ),
+            TaskRestSchema(many=False),
+        )
+
     result = get_task_list_by_owner_id_query.query(
         owner_id=current_user, return_full_entity=True, filter_fields=filter_fields
     )
 
+    return add_next_cursor_header(jsonify(TaskRestSchema(many=True).dump(result))), http.HTTPStatus.OK
+
+
+@doc(
+    description="Search tasks of the current user by name, note and sub task names, ordered by relevance.",
+    params={
+        "page_size": {"in": "query", "required": False},
+        "page": {"in": "query", "required": False},
+    },
+    tags=(tasks_blueprint.name,),
+)
+@use_kwargs(TaskSearchSchema, location="query")
+@marshal_with(TaskRestSchema(many=True), http.HTTPStatus.OK)
+@tasks_blueprint.route("/search", methods=["GET"])
+@jwt_required
+def search_tasks(search_tasks_by_owner_id_query: SearchTasksByOwnerId) -> Response:
+    try:
+        search_fields = TaskSearchSchema().load(request.args)
+    except ValidationError as error:
+        return jsonify(error.messages), http.HTTPStatus.BAD_REQUEST
+
+    result = search_tasks_by_owner_id_query.query(owner_id=UUID(get_jwt_identity()), phrase=search_fields["q"])
     return jsonify(TaskRestSchema(many=True).dump(result)), http.HTTPStatus.OK
 
 
@@ -125,8 +159,7 @@ def create_task(project_protector: ProjectProtector, task_repository: TaskReposi
 @tasks_blueprint.route("/<uuid:task_id>", methods=["PATCH"])
 @jwt_required
 def update_task(task_id: TaskId, task_protector: TaskProtector, task_repository: TaskRepository) -> Response:
-    task_protector.authorize(UUID(get_jwt_identity()), task_id)
-    task = task_repository.get(task_id)
+    task = task_protector.authorize_and_get(UUID(get_jwt_identity()), task_id, for_update=True)
 
     try:
         updated_task = TaskRestSchema(
@@ -151,6 +184,7 @@ def update_task(task_id: TaskId, task_protector: TaskProtector, task_repository:
 def delete_task(task_id: TaskId, task_protector: TaskProtector, task_repository: TaskRepository) -> Response:
     task_protector.authorize(UUID(get_jwt_identity()), task_id)
     task_repository.delete(task_id)
+    task_protector.forget(task_id)
 
     return make_response("", http.HTTPStatus.NO_CONTENT)
 
@@ -160,11 +194,7 @@ def delete_task(task_id: TaskId, task_protector: TaskProtector, task_repository:
     params={**language_header_definition},
     tags=(tasks_blueprint.name,),
 )
-@marshal_with(
-    CompleteTaskSchema,
-    http.HTTPStatus.OK,
-    description="{new_task_id} is returned only if a repeatable task was completed.",
-)
+@marshal_with(CompleteTaskSchema, http.HTTPStatus.OK)
 @tasks_blueprint.route("/<uuid:task_id>/complete", methods=["PATCH"])
 @jwt_required
 def complete_task(
@@ -228,4 +258,5 @@ def pin_task_to_project(
     project_protector.authorize(UUID(get_jwt_identity()), input_dto.new_project_id, abort_if_none=False)
 
     pin_task_to_project_uc.execute(input_dto)
+    task_protector.forget(task_id)
     return presenter.response
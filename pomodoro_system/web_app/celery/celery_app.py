@@ -14,6 +14,11 @@ def create_celery(app: Flask) -> Celery:
                 return self.run(*args, **kwargs)
 
     celery_instance.Task = ContextTask  # noqa
+
+    if app.config["POMODORO_EVENT_LOG"]:
+        celery_instance.conf.beat_schedule["fold-pomodoro-events-every-minute"] = fold_pomodoro_events_schedule
+    else:
+        celery_instance.conf.beat_schedule.pop("fold-pomodoro-events-every-minute", None)
     return celery_instance
 
 
@@ -25,12 +30,38 @@ celery_instance.conf.task_queues = (
         routing_key="pomororo_system.web_app.celery_tasks.auth.#",
         queue_arguments={"x-max-priority": 1},
     ),
+    Queue(
+        name="pomodoro_tasks",
+        routing_key="pomororo_system.web_app.celery_tasks.pomodoros.#",
+        queue_arguments={"x-max-priority": 1},
+    ),
 )
 
+fold_pomodoro_events_schedule = {
+    "task": "pomororo_system.web_app.celery_tasks.pomodoros.fold_pomodoro_events",
+    "schedule": crontab(),
+    "options": {"queue": "pomodoro_tasks"},
+}
+
 celery_instance.conf.beat_schedule = {
     "remove-expired-tokens-every-midnight": {
         "task": "pomororo_system.web_app.celery_tasks.auth.remove_expired_tokens",
         "schedule": crontab(hour=0, minute=0),
         "options": {"queue": "auth_tasks"},
-    }
+    },
+    "finish-overdue-pomodoros-every-minute": {
+        "task": "pomororo_system.web_app.celery_tasks.pomodoros.finish_overdue_pomodoros",
+        "schedule": crontab(),
+        "options": {"queue": "pomodoro_tasks"},
+    },
+    "dispatch-task-reminders-every-minute": {
+        "task": "pomororo_system.web_app.celery_tasks.pomodoros.dispatch_task_reminders",
+        "schedule": crontab(),
+        "options": {"queue": "pomodoro_tasks"},
+    },
+    "renew-repeatable-tasks-every-midnight": {
+        "task": "pomororo_system.web_app.celery_tasks.pomodoros.renew_repeatable_tasks",
+        "schedule": crontab(hour=0, minute=0),
+        "options": {"queue": "pomodoro_tasks"},
+    },
 }
@@ -1,9 +1,70 @@
+from datetime import datetime
+from functools import lru_cache
+
+import injector
+import pytz
+from flask import Flask
+from main import initialize_application
+from pomodoros import ClaimDueTaskReminders, FinishOverduePomodoros, FinishOverduePomodorosInputDto
+from pomodoros_infrastructure.repositories import SQLEventSourcedPomodoroRepository, SQLTaskRepository
 from pony.orm import db_session
 from web_app.authentication.helpers import prune_expired_tokens
 from web_app.celery import celery_app
+from web_app.configuration import PomodorosWeb
+from web_app.flask_app import create_app
+from web_app.ownership_caches import create_ownership_cache
+from web_app.reminders import send_task_reminders
+
+TASK_REMINDERS_BATCH_SIZE = 500
+
+
+@lru_cache()
+def get_flask_app() -> Flask:
+    return create_app()
+
+
+@lru_cache()
+def get_dependency_injector() -> injector.Injector:
+    ownership_cache = create_ownership_cache(get_flask_app().config)
+    return injector.Injector([PomodorosWeb(ownership_cache)], parent=initialize_application().injector)
 
 
 @celery_app.task(name="pomororo_system.web_app.celery_tasks.auth.remove_expired_tokens")
 def remove_expired_tokens() -> None:
     with db_session:
         prune_expired_tokens()
+
+
+@celery_app.task(name="pomororo_system.web_app.celery_tasks.pomodoros.fold_pomodoro_events")
+def fold_pomodoro_events() -> None:
+    with db_session:
+        SQLEventSourcedPomodoroRepository().fold_events()
+
+
+@celery_app.task(name="pomororo_system.web_app.celery_tasks.pomodoros.finish_overdue_pomodoros")
+def finish_overdue_pomodoros() -> None:
+    finish_overdue_pomodoros_uc = get_dependency_injector().get(FinishOverduePomodoros)
+    with db_session:
+        finish_overdue_pomodoros_uc.execute(FinishOverduePomodorosInputDto(now=datetime.now(tz=pytz.UTC)))
+
+
+@celery_app.task(name="pomororo_system.web_app.celery_tasks.pomodoros.dispatch_task_reminders")
+def dispatch_task_reminders() -> None:
+    now = datetime.now(tz=pytz.UTC)
+    claim_due_task_reminders = get_dependency_injector().get(ClaimDueTaskReminders)
+
+    with get_flask_app().app_context():
+        while True:
+            with db_session:
+                reminders = claim_due_task_reminders.query(now, TASK_REMINDERS_BATCH_SIZE)
+            send_task_reminders(reminders)
+
+            if len(reminders) < TASK_REMINDERS_BATCH_SIZE:
+                break
+
+
+@celery_app.task(name="pomororo_system.web_app.celery_tasks.pomodoros.renew_repeatable_tasks")
+def renew_repeatable_tasks() -> None:
+    renewal_horizon = get_flask_app().config["TASK_RENEWAL_HORIZON"]
+    with db_session:
+        SQLTaskRepository().renew_repeatable_tasks(datetime.now(tz=pytz.UTC), renewal_horizon)
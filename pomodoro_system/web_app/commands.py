@@ -1,14 +1,22 @@
 from datetime import datetime
 
 import click
+import pytz
 from flask import current_app
 from flask.cli import AppGroup
 from flask_security import UserDatastore, hash_password
 from foundation.utils import to_utc
 from marshmallow import Schema, ValidationError, fields, validates_schema
+from pomodoros_infrastructure.repositories import (
+    SQLEventSourcedPomodoroRepository,
+    SQLPomodoroRepository,
+    SQLTaskRepository,
+)
 from pony.orm import db_session
 
 user_cli = AppGroup("users")
+task_cli = AppGroup("tasks")
+pomodoro_cli = AppGroup("pomodoros")
 
 
 class CreateAdminSchema(Schema):
@@ -52,3 +60,51 @@ def create_admin(email: str, password: str) -> None:
         return None
     else:
         click.echo(f"Admin {email} has been created successfully.")
+
+
+@task_cli.command("reconcile_burn_down")
+@db_session
+def reconcile_burn_down() -> None:
+    updated_tasks_count = SQLTaskRepository.reconcile_pomodoros_burn_down()
+    click.echo(f"Pomodoros burn down has been reconciled for {updated_tasks_count} task(s).")
+
+
+@task_cli.command("backfill_owner_id")
+@db_session
+def backfill_owner_id() -> None:
+    updated_tasks_count, updated_pomodoros_count = SQLTaskRepository.backfill_owner_ids()
+    click.echo(
+        f"Owner has been backfilled for {updated_tasks_count} task(s) and {updated_pomodoros_count} pomodoro(s)."
+    )
+
+
+@task_cli.command("reindex_search")
+@db_session
+def reindex_search() -> None:
+    # Search documents are owned, so the tasks created before owner_id existed get their owner first.
+    SQLTaskRepository.backfill_owner_ids()
+    indexed_tasks_count = SQLTaskRepository.rebuild_search_documents()
+    click.echo(f"Search documents have been rebuilt for {indexed_tasks_count} task(s).")
+
+
+@pomodoro_cli.command("backfill_state")
+@db_session
+def backfill_state() -> None:
+    updated_pomodoros_count = SQLPomodoroRepository.backfill_states()
+    click.echo(f"State has been backfilled for {updated_pomodoros_count} pomodoro(s).")
+
+
+@pomodoro_cli.command("fold_events")
+@db_session
+def fold_events() -> None:
+    folded_pomodoros_count = SQLEventSourcedPomodoroRepository().fold_events()
+    click.echo(f"Pending events have been folded into {folded_pomodoros_count} pomodoro(s).")
+
+
+@task_cli.command("renew_repeatable")
+@db_session
+def renew_repeatable() -> None:
+    renewed_tasks_count = SQLTaskRepository().renew_repeatable_tasks(
+        datetime.now(tz=pytz.UTC), current_app.config["TASK_RENEWAL_HORIZON"]
+    )
+    click.echo(f"{renewed_tasks_count} repeatable task(s) have been renewed.")
@@ -1,15 +1,19 @@
 import flask_injector
 import injector
 from foundation.application.repositories.user import UserRepository
-from foundation.interfaces import MediaStorage
+from foundation.interfaces import MediaStorage, OwnershipCache
 from pomodoros import (
     BeginPomodoroOutputBoundary,
     CompleteTaskOutputBoundary,
+    FinishOverduePomodorosOutputBoundary,
     FinishPomodoroOutputBoundary,
     PausePomodoroOutputBoundary,
     PinTaskToProjectOutputBoundary,
+    PomodoroRepository,
     ReactivateTaskOutputBoundary,
     ResumePomodoroOutputBoundary,
+    SyncPomodorosOutputBoundary,
+    TaskRepository,
 )
 from web_app.authorization.pomodoros import PomodoroProtector
 from web_app.users.repository import SQLUserRepository
@@ -20,10 +24,12 @@ from .authorization.tokens import TokenProtector
 from .authorization.users import UserProtector
 from .media_storages import LocalMediaStorage
 from .output_boundaries.pomodoros import (
+    FinishOverduePomodorosPresenter,
     JSONBeginPomodoroPresenter,
     JSONFinishPomodoroPresenter,
     JSONPausePomodoroPresenter,
     JSONResumePomodoroPresenter,
+    JSONSyncPomodorosPresenter,
 )
 from .output_boundaries.tasks import (
     JSONCompleteTaskOutputBoundary,
@@ -34,6 +40,9 @@ from .users.facade import UserFacade
 
 
 class PomodorosWeb(injector.Module):
+    def __init__(self, ownership_cache: OwnershipCache) -> None:
+        self.ownership_cache = ownership_cache
+
     @injector.provider
     @flask_injector.request
     def begin_pomodoro_output_boundary(self) -> BeginPomodoroOutputBoundary:
@@ -54,6 +63,15 @@ class PomodorosWeb(injector.Module):
     def finish_pomodoro_output_boundary(self) -> FinishPomodoroOutputBoundary:
         return JSONFinishPomodoroPresenter()
 
+    @injector.provider
+    @flask_injector.request
+    def sync_pomodoros_output_boundary(self) -> SyncPomodorosOutputBoundary:
+        return JSONSyncPomodorosPresenter()
+
+    @injector.provider
+    def finish_overdue_pomodoros_output_boundary(self) -> FinishOverduePomodorosOutputBoundary:
+        return FinishOverduePomodorosPresenter()
+
     @injector.provider
     @flask_injector.request
     def complete_task_output_boundary(self) -> CompleteTaskOutputBoundary:
@@ -74,20 +92,20 @@ class PomodorosWeb(injector.Module):
         return SQLUserRepository()
 
     @injector.provider
-    def task_protector(self) -> TaskProtector:
-        return TaskProtector()
+    def task_protector(self, task_repository: TaskRepository) -> TaskProtector:
+        return TaskProtector(task_repository, self.ownership_cache)
 
     @injector.provider
-    def pomodoro_protector(self) -> PomodoroProtector:
-        return PomodoroProtector()
+    def pomodoro_protector(self, pomodoro_repository: PomodoroRepository) -> PomodoroProtector:
+        return PomodoroProtector(pomodoro_repository, self.ownership_cache)
 
     @injector.provider
     def project_protector(self) -> ProjectProtector:
-        return ProjectProtector()
+        return ProjectProtector(self.ownership_cache)
 
     @injector.provider
     def token_protector(self) -> TokenProtector:
-        return TokenProtector()
+        return TokenProtector(self.ownership_cache)
 
     @injector.provider
     def user_protector(self) -> UserProtector:
@@ -1,5 +1,6 @@
 import http
 import os
+from datetime import timedelta
 
 from flask import Flask, jsonify, request
 from flask_apispec import FlaskApiSpec
@@ -22,13 +23,15 @@ from .authentication.helpers import is_token_revoked
 from .blueprints.auth import auth_blueprint
 from .blueprints.pomodoros import pomodoros_blueprint
 from .blueprints.projects import projects_blueprint
+from .blueprints.stats import stats_blueprint
 from .blueprints.tasks import tasks_blueprint
 from .blueprints.users import users_blueprint
 from .celery.celery_app import create_celery
-from .commands import user_cli
+from .commands import pomodoro_cli, task_cli, user_cli
 from .configuration import PomodorosWeb
 from .docs_definitions.apispec import api_spec
 from .docs_definitions.auth import auth_api_definitions
+from .ownership_caches import create_ownership_cache
 from .security import PonyORMUserDatastore
 from .settings_loader import (
     FlaskBaseSettingsLoader,
@@ -64,6 +67,7 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(tasks_blueprint)
     app.register_blueprint(pomodoros_blueprint)
     app.register_blueprint(users_blueprint)
+    app.register_blueprint(stats_blueprint)
 
 
 def register_doc(app: Flask) -> None:
@@ -97,11 +101,13 @@ def add_default_roles(app: Flask) -> None:
 
 
 def inject_dependencies(app: Flask, injector: Injector) -> None:
-    FlaskInjector(app, modules=[PomodorosWeb()], injector=injector)
+    FlaskInjector(app, modules=[PomodorosWeb(ownership_cache=create_ownership_cache(app.config))], injector=injector)
 
 
 def add_flask_commands(flask_app: Flask) -> None:
     flask_app.cli.add_command(user_cli)
+    flask_app.cli.add_command(task_cli)
+    flask_app.cli.add_command(pomodoro_cli)
 
 
 def create_app() -> Flask:
@@ -112,6 +118,12 @@ def create_app() -> Flask:
         DEBUG=pomodoro_app_context.settings["debug"],
         TESTING=pomodoro_app_context.settings["testing"],
         STAGING=pomodoro_app_context.settings["staging"],
+        TASK_RENEWAL_HORIZON=pomodoro_app_context.settings["task_renewal_horizon"],
+        POMODORO_EVENT_LOG=pomodoro_app_context.settings["pomodoro_event_log"],
+        OWNERSHIP_CACHE_URL=os.getenv("OWNERSHIP_CACHE_URL"),
+        OWNERSHIP_CACHE_SIZE=int(os.getenv("OWNERSHIP_CACHE_SIZE", 10000)),
+        OWNERSHIP_CACHE_TTL=timedelta(seconds=int(os.getenv("OWNERSHIP_CACHE_TTL_SECONDS", 300))),
+        STREAM_CHUNK_SIZE=int(os.getenv("STREAM_CHUNK_SIZE", 500)),
         SECRET_KEY=os.getenv("SECRET_KEY"),
         DEFAULT_LANGUAGE="en",
         ALLOWED_LANGUAGES={"en", "pl"},
@@ -1,11 +1,21 @@
 import pytz
-from marshmallow import EXCLUDE, Schema, fields, post_load, pre_dump
-from pomodoros import BeginPomodoroInputDto, FinishPomodoroInputDto, PausePomodoroInputDto, ResumePomodoroInputDto
+from foundation.i18n import N_
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, post_load, pre_dump, validate, validates_schema
+from pomodoros import (
+    BeginPomodoroInputDto,
+    FinishPomodoroInputDto,
+    PausePomodoroInputDto,
+    PomodoroEventDto,
+    PomodoroEventType,
+    ResumePomodoroInputDto,
+    SyncPomodorosInputDto,
+)
 
 
 class BeginPomodoroSchema(Schema):
     task_id = fields.UUID(required=True)
     start_date = fields.AwareDateTime(required=True, allow_none=False, default_timezone=pytz.UTC)
+    owner_id = fields.UUID(required=True, load_only=True)
     id = fields.UUID(required=True, dump_only=True)
     frame_type = fields.Integer(dump_only=True)
 
@@ -37,6 +47,7 @@ class PausePomodoroSchema(Schema):
 class ResumePomodoroSchema(Schema):
     pomodoro_id = fields.UUID(required=True)
     resume_date = fields.AwareDateTime(required=True, allow_none=False, default_timezone=pytz.UTC)
+    owner_id = fields.UUID(required=True, load_only=True)
 
     class Meta:
         unknown = EXCLUDE
@@ -64,3 +75,68 @@ class FinishPomodoroSchema(Schema):
     @post_load()
     def make_dto(self, data: dict, **_kwargs) -> FinishPomodoroInputDto:
         return FinishPomodoroInputDto(**data)
+
+
+class ActivePomodoroSchema(Schema):
+    id = fields.UUID(dump_only=True)
+    task_id = fields.UUID(dump_only=True)
+    start_date = fields.AwareDateTime(dump_only=True, default_timezone=pytz.UTC)
+    state = fields.Integer(dump_only=True)
+
+    @pre_dump
+    def serialize_fields(self, pre_serialized_object: dict, many=False):
+        pre_serialized_object.state = pre_serialized_object.state.value
+        return pre_serialized_object
+
+
+class PomodoroEventSchema(Schema):
+    type = fields.Integer(
+        required=True,
+        validate=validate.OneOf([event_type.value for event_type in PomodoroEventType]),
+        enum=[event_type.value for event_type in PomodoroEventType],
+        description="0 = Begin,\n 1 = Pause,\n 2 = Resume,\n 3 = Finish",
+    )
+    pomodoro_id = fields.UUID(required=True, description="Generated by the client for the begin events.")
+    task_id = fields.UUID(required=False, allow_none=True, description="Required for the begin events only.")
+    date = fields.AwareDateTime(required=True, allow_none=False, default_timezone=pytz.UTC)
+
+    class Meta:
+        unknown = EXCLUDE
+
+    @validates_schema
+    def validate_task_id(self, data: dict, **_kwargs) -> None:
+        if data.get("type") == PomodoroEventType.BEGIN.value and data.get("task_id") is None:
+            raise ValidationError(N_("Task id is required to begin a pomodoro."), "task_id")
+
+    @post_load
+    def make_dto(self, data: dict, **_kwargs) -> PomodoroEventDto:
+        data["type"] = PomodoroEventType(data["type"])
+        return PomodoroEventDto(**data)
+
+
+class SyncPomodorosSchema(Schema):
+    owner_id = fields.UUID(required=True, load_only=True)
+    events = fields.Nested(PomodoroEventSchema, many=True, required=True, validate=validate.Length(min=1, max=500))
+
+    class Meta:
+        unknown = EXCLUDE
+
+    @post_load
+    def make_dto(self, data: dict, **_kwargs) -> SyncPomodorosInputDto:
+        return SyncPomodorosInputDto(**data)
+
+
+class PomodoroEventResultSchema(Schema):
+    pomodoro_id = fields.UUID(dump_only=True)
+    type = fields.Integer(dump_only=True)
+    is_applied = fields.Boolean(dump_only=True)
+    errors = fields.List(fields.String(), dump_only=True)
+
+    @pre_dump
+    def serialize_fields(self, pre_serialized_object: dict, many=False):
+        pre_serialized_object.type = pre_serialized_object.type.value
+        return pre_serialized_object
+
+
+class SyncPomodorosResultSchema(Schema):
+    results = fields.Nested(PomodoroEventResultSchema, many=True, dump_only=True)
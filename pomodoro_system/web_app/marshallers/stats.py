@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytz
+from foundation.i18n import N_
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, post_load, validate, validates_schema
+from pomodoros import StatsGranularity
+
+
+class StatsFilterSchema(Schema):
+    granularity = fields.Integer(
+        required=False,
+        missing=StatsGranularity.DAY.value,
+        validate=validate.OneOf([granularity.value for granularity in StatsGranularity]),
+        enum=[granularity.value for granularity in StatsGranularity],
+        description="0 = Daily stats,\n 1 = Weekly stats,\n 2 = Monthly stats",
+    )
+    date_from = fields.Date(required=False, allow_none=True, description="Defaults to 364 days before date_to.")
+    date_to = fields.Date(required=False, allow_none=True, description="Defaults to today.")
+
+    class Meta:
+        unknown = EXCLUDE
+
+    @validates_schema
+    def validate_date_range(self, data: dict, **_kwargs) -> None:
+        date_from, date_to = data.get("date_from"), data.get("date_to")
+        if date_from is not None and date_to is not None and date_from > date_to:
+            raise ValidationError(N_("Start date cannot be greater than end date."), "date_from")
+
+    @post_load
+    def fill_default_date_range(self, data: dict, **_kwargs) -> dict:
+        data["granularity"] = StatsGranularity(data["granularity"])
+        data["date_to"] = data.get("date_to") or datetime.now(tz=pytz.UTC).date()
+        data["date_from"] = data.get("date_from") or data["date_to"] - timedelta(days=364)
+        return data
+
+
+class StatsSchema(Schema):
+    period_start = fields.Date(dump_only=True)
+    completed_pomodoros = fields.Integer(dump_only=True)
+    focus_seconds = fields.Integer(dump_only=True)
+    pause_seconds = fields.Integer(dump_only=True)
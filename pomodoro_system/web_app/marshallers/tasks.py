@@ -6,7 +6,7 @@ import pytz
 from foundation.utils import to_utc
 from foundation.value_objects import Priority, PriorityLevel
 from marshmallow import EXCLUDE, Schema, fields, post_load, pre_dump, validate
-from pomodoros import CompleteTaskInputDto, PinTaskToProjectInputDto, ReactivateTaskInputDto
+from pomodoros import CompleteTaskInputDto, PinTaskToProjectInputDto, ReactivateTaskInputDto, SubTaskId
 from pomodoros.domain.entities import SubTask, Task
 from pomodoros.domain.value_objects import TaskStatus
 from pomodoros_infrastructure.queries.tasks import DueDateFilter
@@ -15,14 +15,23 @@ from web_app.marshallers.priority import PrioritySchema
 
 
 class SubTaskRestSchema(Schema):
+    id = fields.UUID(required=False, allow_none=True)
     name = fields.String(required=True, allow_none=False)
     is_completed = fields.Boolean(required=True, allow_none=False, default=False)
     ordering = fields.Integer(required=True, allow_none=False, validate=validate.Range(min=1), minimum=1)
 
+    def _get_sub_task_id(self, data: dict) -> SubTaskId:
+        task_instance = self.context.get("task_instance")
+        existing_sub_task_ids = {sub_task.id for sub_task in getattr(task_instance, "sub_tasks", None) or []}
+
+        if data.get("id") in existing_sub_task_ids:
+            return data["id"]
+        return uuid.uuid4()
+
     @post_load
     def to_dto(self, data: dict, **_kwargs) -> SubTask:
         return SubTask(
-            id=uuid.uuid4(),
+            id=self._get_sub_task_id(data),
             name=data.get("name"),
             ordering=data.get("ordering"),
             is_completed=data.get("is_completed", False),
@@ -63,7 +72,7 @@ class TaskRestSchema(BaseTaskRestSchema):
             "project_id": task_instance.project_id,
             "priority": request_data.get("priority") or Priority(),
             "date_frame_definition": request_data.get("date_frame_definition") or None,
-            "sub_tasks": request_data.get("sub_tasks") or [],
+            "sub_tasks": request_data.get("sub_tasks", task_instance.sub_tasks) or [],
         }
         request_data.update(pre_populated_data)
 
@@ -155,10 +164,16 @@ class TaskFilterSchema(Schema):
         unknown = EXCLUDE
 
 
+class TaskSearchSchema(Schema):
+    q = fields.String(required=True, allow_none=False, validate=validate.Length(min=1, max=128))
+
+    class Meta:
+        unknown = EXCLUDE
+
+
 class CompleteTaskSchema(Schema):
     id = fields.UUID(required=True)
     completed_at = fields.AwareDateTime(required=True, allow_none=False, default_timezone=pytz.UTC)
-    new_task_id = fields.UUID(dump_only=True, required=False, allow_none=True)
 
     class Meta:
         unknown = EXCLUDE
@@ -1,17 +1,25 @@
-from typing import List, Mapping, Optional, Union
-
-from flask import g, request
+import base64
+import http
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Iterator, List, Mapping, NoReturn, Optional, Tuple, Type, Union
+
+from flask import abort, g, make_response, request
+from foundation.i18n import N_
 from foundation.interfaces import Paginator
+from foundation.models import db
+from foundation.utils import with_tzinfo
 from pony.orm import Optional as ORMOptional
-from pony.orm import Required, desc
-from pony.orm.core import Query  # noqa
+from pony.orm import Required, desc, rollback
+from pony.orm.core import Attribute, DescWrapper, Query
 from web_app.utils import load_int_query_parameter
 
 
 class FilteredQueryMixin:
     @staticmethod
     def get_filtered_query(query: Query, filter_fields: Mapping[str, str]) -> Query:
-        if not query:
+        if not isinstance(query, Query):
             return query
 
         if filter_fields:
@@ -19,30 +27,6 @@ class FilteredQueryMixin:
         return query
 
 
-class PaginatedQueryMixin:
-    @staticmethod
-    def get_paginator() -> Optional[Paginator]:
-        if not request:
-            return
-
-        page = load_int_query_parameter(request.args.get("page"))
-        page_size = load_int_query_parameter(request.args.get("page_size"))
-        prepared_paginator = Paginator(page=page, page_size=page_size or Paginator.page_size)
-
-        if prepared_paginator.is_usable():
-            return prepared_paginator
-        return None
-
-    def get_paginated_query(self, query: Query) -> Query:
-        if not query:
-            return query
-
-        paginator = self.get_paginator()
-        if paginator:
-            return query.page(paginator.page, paginator.page_size)
-        return query
-
-
 class SortedQueryMixin:
     @staticmethod
     def get_sort_params() -> List[Union[ORMOptional, Required]]:
@@ -76,7 +60,7 @@ class SortedQueryMixin:
         return mapped_sort_fields
 
     def get_sorted_query(self, query: Query) -> Query:
-        if not query:
+        if not isinstance(query, Query):
             return query
 
         sort_params = self.get_sort_params()
@@ -84,3 +68,148 @@ class SortedQueryMixin:
         if sort_params:
             return query.sort_by(*sort_params)
         return query
+
+
+class PaginatedQueryMixin:
+    @staticmethod
+    def get_paginator() -> Optional[Paginator]:
+        if not request:
+            return
+
+        page = load_int_query_parameter(request.args.get("page"))
+        page_size = load_int_query_parameter(request.args.get("page_size"))
+        prepared_paginator = Paginator(page=page, page_size=page_size or Paginator.page_size)
+
+        if prepared_paginator.is_usable():
+            return prepared_paginator
+        return None
+
+    @staticmethod
+    def get_cursor() -> Optional[str]:
+        if not request:
+            return
+        return request.args.get("cursor")
+
+    @staticmethod
+    def _get_sort_keys(entity: Type[db.Entity], sort_params: List) -> List[Tuple[Attribute, bool]]:
+        sort_keys = [(param.attr, True) if isinstance(param, DescWrapper) else (param, False) for param in sort_params]
+        return sort_keys + [(entity.id, False)]
+
+    @staticmethod
+    def _get_row_key(row: Any, sort_keys: List[Tuple[Attribute, bool]]) -> List[Any]:
+        row_key = [getattr(row, attr.name) for attr, _is_descending in sort_keys]
+        return [with_tzinfo(value) if isinstance(value, datetime) else value for value in row_key]
+
+    @staticmethod
+    def _encode_cursor(values: List[Any]) -> str:
+        serialized_values = [
+            value.isoformat() if isinstance(value, datetime) else str(value) if isinstance(value, uuid.UUID) else value
+            for value in values
+        ]
+        return base64.urlsafe_b64encode(json.dumps(serialized_values).encode()).decode()
+
+    @staticmethod
+    def _abort_invalid_cursor() -> NoReturn:
+        abort(make_response({"cursor": [N_("Invalid cursor.")]}, http.HTTPStatus.BAD_REQUEST))
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str, sort_keys: List[Tuple[Attribute, bool]]) -> Optional[List[Any]]:
+        if not cursor:
+            return None
+
+        try:
+            serialized_values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(serialized_values, list) or len(serialized_values) != len(sort_keys):
+                cls._abort_invalid_cursor()
+
+            return [
+                datetime.fromisoformat(value) if attr.py_type is datetime else attr.py_type(value)
+                for (attr, _is_descending), value in zip(sort_keys, serialized_values)
+            ]
+        except (ValueError, TypeError, AttributeError):
+            cls._abort_invalid_cursor()
+
+    @staticmethod
+    def _get_keyset_condition(sort_keys: List[Tuple[Attribute, bool]]) -> str:
+        alternatives = []
+        for index, (attr, is_descending) in enumerate(sort_keys):
+            comparisons = [
+                f"item.{previous_attr.name} == value_{i}" for i, (previous_attr, _) in enumerate(sort_keys[:index])
+            ]
+            comparisons.append(f"item.{attr.name} {'<' if is_descending else '>'} value_{index}")
+            alternatives.append(f"({' and '.join(comparisons)})")
+        return f"lambda item: {' or '.join(alternatives)}"
+
+    def _get_keyset_rows(
+        self, query: Query, sort_keys: List[Tuple[Attribute, bool]], last_values: Optional[List[Any]], limit: int
+    ) -> List:
+        query = query.sort_by(None).sort_by(
+            *(desc(attr) if is_descending else attr for attr, is_descending in sort_keys)
+        )
+
+        if last_values is not None:
+            query = query.filter(
+                self._get_keyset_condition(sort_keys),
+                {f"value_{index}": value for index, value in enumerate(last_values)},
+            )
+        return list(query[:limit])
+
+    def _get_query_sort_keys(self, entity: Type[db.Entity]) -> List[Tuple[Attribute, bool]]:
+        sort_params = self.get_sort_params() if isinstance(self, SortedQueryMixin) else []
+        return self._get_sort_keys(entity, sort_params)
+
+    def get_keyset_page(self, query: Query, entity: Type[db.Entity], cursor: str) -> List:
+        sort_keys = self._get_query_sort_keys(entity)
+        page_size = load_int_query_parameter(request.args.get("page_size"))
+        if page_size is None or page_size < 1:
+            page_size = Paginator.page_size
+
+        rows = self._get_keyset_rows(query, sort_keys, self._decode_cursor(cursor, sort_keys), page_size + 1)
+        page_rows = rows[:page_size]
+
+        if len(rows) > page_size:
+            g.next_cursor = self._encode_cursor(self._get_row_key(page_rows[-1], sort_keys))
+        else:
+            g.next_cursor = None
+        return page_rows
+
+    @staticmethod
+    def _release_session_cache() -> None:
+        session_cache = db._get_cache()
+        # Rolling back drops the previous chunk from the shared db_session, so it is skipped once anything was written.
+        if not session_cache.modified and not session_cache.in_transaction:
+            rollback()
+
+    def iterate_in_chunks(self, query: Query, entity: Type[db.Entity], chunk_size: int) -> Iterator[List]:
+        if not isinstance(query, Query):
+            if query:
+                yield list(query)
+            return
+
+        sort_keys = self._get_query_sort_keys(entity)
+        last_values = None
+
+        while True:
+            rows = self._get_keyset_rows(query, sort_keys, last_values, chunk_size)
+            if not rows:
+                return
+
+            last_values = self._get_row_key(rows[-1], sort_keys)
+            yield rows
+
+            if len(rows) < chunk_size:
+                return
+            self._release_session_cache()
+
+    def get_paginated_query(self, query: Query, entity: Type[db.Entity]) -> Query:
+        if not isinstance(query, Query):
+            return query
+
+        cursor = self.get_cursor()
+        if cursor is not None:
+            return self.get_keyset_page(query, entity, cursor)
+
+        paginator = self.get_paginator()
+        if paginator:
+            return query.page(paginator.page, paginator.page_size)
+        return query
@@ -4,18 +4,23 @@ from flask import jsonify
 from pomodoros import (
     BeginPomodoroOutputBoundary,
     BeginPomodoroOutputDto,
+    FinishOverduePomodorosOutputBoundary,
+    FinishOverduePomodorosOutputDto,
     FinishPomodoroOutputBoundary,
     FinishPomodoroOutputDto,
     PausePomodoroOutputBoundary,
     PausePomodoroOutputDto,
     ResumePomodoroOutputBoundary,
     ResumePomodoroOutputDto,
+    SyncPomodorosOutputBoundary,
+    SyncPomodorosOutputDto,
 )
 from web_app.marshallers.pomodoros import (
     BeginPomodoroSchema,
     FinishPomodoroSchema,
     PausePomodoroSchema,
     ResumePomodoroSchema,
+    SyncPomodorosResultSchema,
 )
 
 
@@ -41,3 +46,14 @@ class JSONFinishPomodoroPresenter(FinishPomodoroOutputBoundary):
     def present(self, output_dto: FinishPomodoroOutputDto) -> None:
         serialized_output_data = FinishPomodoroSchema().dump(output_dto)
         self.response = jsonify(serialized_output_data), http.HTTPStatus.OK
+
+
+class JSONSyncPomodorosPresenter(SyncPomodorosOutputBoundary):
+    def present(self, output_dto: SyncPomodorosOutputDto) -> None:
+        serialized_output_data = SyncPomodorosResultSchema().dump(output_dto)
+        self.response = jsonify(serialized_output_data), http.HTTPStatus.OK
+
+
+class FinishOverduePomodorosPresenter(FinishOverduePomodorosOutputBoundary):
+    def present(self, output_dto: FinishOverduePomodorosOutputDto) -> None:
+        self.response = output_dto.finished_pomodoro_ids
@@ -0,0 +1,80 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Tuple
+
+import redis
+from foundation.interfaces import OwnershipCache
+from foundation.value_objects import UserId
+
+
+class InMemoryOwnershipCache(OwnershipCache):
+    def __init__(self, max_size: int = 10000, ttl: timedelta = timedelta(minutes=5)) -> None:
+        self.max_size = max_size
+        self.ttl = ttl.total_seconds()
+        self._entries: "OrderedDict[str, Tuple[UserId, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[UserId]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            owner_id, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return owner_id
+
+    def set(self, key: str, owner_id: UserId) -> None:
+        with self._lock:
+            self._entries[key] = (owner_id, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class RedisOwnershipCache(OwnershipCache):
+    key_prefix = "ownership:"
+
+    def __init__(self, url: str, ttl: timedelta = timedelta(minutes=5)) -> None:
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[UserId]:
+        try:
+            owner_id = self.client.get(self.key_prefix + key)
+        except redis.RedisError:
+            return None
+        return uuid.UUID(owner_id.decode()) if owner_id is not None else None
+
+    def set(self, key: str, owner_id: UserId) -> None:
+        try:
+            self.client.set(self.key_prefix + key, str(owner_id), ex=self.ttl)
+        except redis.RedisError:
+            pass
+
+    def delete(self, *keys: str) -> None:
+        try:
+            self.client.delete(*(self.key_prefix + key for key in keys))
+        except redis.RedisError:
+            pass
+
+
+def create_ownership_cache(config: dict) -> OwnershipCache:
+    ttl = config["OWNERSHIP_CACHE_TTL"]
+
+    if config.get("OWNERSHIP_CACHE_URL"):
+        return RedisOwnershipCache(config["OWNERSHIP_CACHE_URL"], ttl)
+    return InMemoryOwnershipCache(config["OWNERSHIP_CACHE_SIZE"], ttl)
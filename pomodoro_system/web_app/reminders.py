@@ -0,0 +1,22 @@
+from typing import List
+
+from flask import current_app, render_template
+from flask_mail import Message
+from foundation.i18n import N_
+from pomodoros import QueryTaskReminderDto
+
+
+def send_task_reminders(reminders: List[QueryTaskReminderDto]) -> None:
+    if not reminders:
+        return None
+
+    mail = current_app.extensions["mail"]
+    with mail.connect() as connection:
+        for reminder in reminders:
+            message = Message(
+                subject=N_("Task reminder"),
+                recipients=[reminder.owner_email],
+                body=render_template("security/email/task_reminder.txt", reminder=reminder),
+                html=render_template("security/email/task_reminder.html", reminder=reminder),
+            )
+            connection.send(message)
@@ -14,7 +14,7 @@ from flask_security import UserDatastore
 from foundation.models import User
 from freezegun import freeze_time
 from marshmallow import Schema
-from pomodoros.domain.value_objects import TaskStatus
+from pomodoros.domain.value_objects import PomodoroState, TaskStatus
 from pomodoros_infrastructure import PomodoroModel, ProjectModel, TaskModel
 from pomodoros_infrastructure.tests.factories import ORMPauseFactory, ORMPomodoroFactory, ORMTaskFactory
 from pony.orm import db_session
@@ -134,7 +134,7 @@ def started_orm_pomodoro(orm_task: TaskModel) -> PomodoroModel:
 @pytest.fixture()
 def paused_orm_pomodoro(orm_task: TaskModel) -> PomodoroModel:
     with db_session:
-        started_orm_pomodoro = ORMPomodoroFactory(task=orm_task.id, end_date=None)
+        started_orm_pomodoro = ORMPomodoroFactory(task=orm_task.id, end_date=None, state=PomodoroState.PAUSED.value)
         pause = ORMPauseFactory(start_date=datetime.now(tz=pytz.UTC), end_date=None)
         pause.pomodoro = started_orm_pomodoro
         return started_orm_pomodoro
@@ -1,12 +1,16 @@
 import uuid
+from datetime import datetime
 
+import pytz
 from flask import Flask, testing
-from flask_jwt_extended import get_jti
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jti
 from flask_mail import Mail
 from flask_security.confirmable import generate_confirmation_token
 from flask_security.recoverable import generate_reset_password_token
 from foundation.models import User, UserDateFrameDefinitionModel
+from foundation.tests.query_plans import assert_uses_index
 from pony.orm import db_session, select
+from web_app.authentication.helpers import add_token_to_database, revoke_all_tokens
 from web_app.authentication.models.token import Token
 
 
@@ -102,6 +106,30 @@ def test_access_token_is_revoked_for_banned_user(client: testing.FlaskClient, ba
     assert retrieve_tokens_response.status_code == 401
 
 
+def test_revoke_all_tokens_of_many_users(
+    app: Flask, project_owner, random_project_owner, project_owner_access_token, banned_user_access_token
+):
+    with db_session, app.test_request_context():
+        add_token_to_database(create_access_token(random_project_owner), create_refresh_token(random_project_owner))
+
+        revoked_tokens_count = revoke_all_tokens(project_owner.id, random_project_owner.id)
+
+    with db_session:
+        assert revoked_tokens_count == 3
+        assert not Token.exists(
+            lambda token: token.user_identity in (project_owner.id, random_project_owner.id) and not token.revoked
+        )
+
+
+@db_session
+def test_token_revocation_checks_use_indexes(app: Flask, project_owner):
+    assert_uses_index(Token.select().filter(jti=str(uuid.uuid4()), revoked=True), "idx_tokens__jti_revoked")
+    assert_uses_index(Token.select(lambda token: token.expires <= datetime.now(tz=pytz.UTC)), "idx_tokens__expires")
+    assert_uses_index(
+        Token.select().filter(user_identity=project_owner.id, revoked=False), "idx_tokens__user_identity_active"
+    )
+
+
 def test_confirm_registration(app: Flask, client: testing.FlaskClient, unconfirmed_user):
     with app.test_request_context():
         confirm_token = generate_confirmation_token(unconfirmed_user)
@@ -1,6 +1,10 @@
 from flask import Flask
+from pomodoros.domain.value_objects import PomodoroState
+from pomodoros_infrastructure import PomodoroModel, TaskModel
+from pomodoros_infrastructure.queries.tasks import SQLSearchTasksByOwnerId
+from pomodoros_infrastructure.tests.factories import ORMPauseFactory, ORMPomodoroFactory, ORMTaskFactory
 from pony.orm import db_session
-from web_app.commands import create_admin
+from web_app.commands import backfill_state, create_admin, reconcile_burn_down, reindex_search
 
 
 @db_session
@@ -34,3 +38,68 @@ def test_add_new_admin_with_existing_email_address(app: Flask, user_datastore, u
 
     assert new_admin is not None
     assert not new_admin.has_role("admin")
+
+
+def test_reconcile_burn_down_recounts_finished_pomodoros(app: Flask, orm_task):
+    runner = app.test_cli_runner()
+    with db_session:
+        ORMPomodoroFactory.create_batch(2, task=orm_task.id)
+        ORMPomodoroFactory(task=orm_task.id, end_date=None)
+        TaskModel[orm_task.id].pomodoros_burn_down = 7
+
+    runner.invoke(reconcile_burn_down)
+
+    with db_session:
+        assert TaskModel[orm_task.id].pomodoros_burn_down == 2
+
+
+def test_reindex_search_indexes_existing_tasks(app: Flask, project_owner, orm_project):
+    runner = app.test_cli_runner()
+    with db_session:
+        orm_task = ORMTaskFactory(project=orm_project.id, name="Imported task")
+
+    runner.invoke(reindex_search)
+
+    with db_session:
+        assert [task.id for task in SQLSearchTasksByOwnerId().query(project_owner.id, "imported")] == [orm_task.id]
+
+
+def test_reindex_search_owns_legacy_tasks_first(app: Flask, project_owner, orm_project):
+    runner = app.test_cli_runner()
+    with db_session:
+        orm_task = ORMTaskFactory(project=orm_project.id, name="Legacy task")
+        orm_task.owner_id = None
+
+    runner.invoke(reindex_search)
+
+    with db_session:
+        assert TaskModel[orm_task.id].owner_id == project_owner.id
+        assert [task.id for task in SQLSearchTasksByOwnerId().query(project_owner.id, "legacy")] == [orm_task.id]
+
+
+def test_reconcile_burn_down_counts_legacy_pomodoros_by_end_date(app: Flask, orm_task):
+    runner = app.test_cli_runner()
+    with db_session:
+        ORMPomodoroFactory(task=orm_task.id, state=PomodoroState.RUNNING.value)
+        TaskModel[orm_task.id].pomodoros_burn_down = 0
+
+    runner.invoke(reconcile_burn_down)
+
+    with db_session:
+        assert TaskModel[orm_task.id].pomodoros_burn_down == 1
+
+
+def test_backfill_state_derives_state_of_legacy_pomodoros(app: Flask, orm_task):
+    runner = app.test_cli_runner()
+    with db_session:
+        finished_pomodoro = ORMPomodoroFactory(task=orm_task.id, state=PomodoroState.RUNNING.value)
+        paused_pomodoro = ORMPomodoroFactory(task=orm_task.id, end_date=None, state=PomodoroState.RUNNING.value)
+        ORMPauseFactory(pomodoro=paused_pomodoro, start_date=paused_pomodoro.start_date, end_date=None)
+        running_pomodoro = ORMPomodoroFactory(task=orm_task.id, end_date=None, state=PomodoroState.RUNNING.value)
+
+    runner.invoke(backfill_state)
+
+    with db_session:
+        assert PomodoroModel[finished_pomodoro.id].state == PomodoroState.FINISHED.value
+        assert PomodoroModel[paused_pomodoro.id].state == PomodoroState.PAUSED.value
+        assert PomodoroModel[running_pomodoro.id].state == PomodoroState.RUNNING.value
@@ -0,0 +1,55 @@
+import uuid
+from datetime import timedelta
+
+from web_app.ownership_caches import InMemoryOwnershipCache, RedisOwnershipCache
+
+
+class TestInMemoryOwnershipCache:
+    def test_cache_returns_stored_owner_id(self):
+        cache = InMemoryOwnershipCache()
+        owner_id = uuid.uuid4()
+
+        cache.set("task:1", owner_id)
+
+        assert cache.get("task:1") == owner_id
+        assert cache.get("task:2") is None
+
+    def test_cache_evicts_least_recently_used_entry(self):
+        cache = InMemoryOwnershipCache(max_size=2)
+        first_owner_id, second_owner_id, third_owner_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        cache.set("task:1", first_owner_id)
+        cache.set("task:2", second_owner_id)
+        cache.get("task:1")
+        cache.set("task:3", third_owner_id)
+
+        assert cache.get("task:1") == first_owner_id
+        assert cache.get("task:2") is None
+        assert cache.get("task:3") == third_owner_id
+
+    def test_cache_expires_entries_after_ttl(self):
+        cache = InMemoryOwnershipCache(ttl=timedelta(0))
+
+        cache.set("task:1", uuid.uuid4())
+
+        assert cache.get("task:1") is None
+
+    def test_cache_deletes_entries(self):
+        cache = InMemoryOwnershipCache()
+        cache.set("task:1", uuid.uuid4())
+        cache.set("task:2", uuid.uuid4())
+
+        cache.delete("task:1", "task:2")
+
+        assert cache.get("task:1") is None
+        assert cache.get("task:2") is None
+
+
+class TestRedisOwnershipCache:
+    def test_cache_tolerates_unavailable_server(self):
+        cache = RedisOwnershipCache("redis://localhost:1/0")
+
+        cache.set("task:1", uuid.uuid4())
+        cache.delete("task:1")
+
+        assert cache.get("task:1") is None
@@ -1,11 +1,32 @@
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
 
 import pytz
 from flask import testing
+from foundation.models import db
+from pomodoros.domain.value_objects import PomodoroState
 from pomodoros_infrastructure.repositories import SQLPomodoroRepository
 from pony.orm import db_session
 
 
+class TestActivePomodoroAPI:
+    def test_get_active_pomodoro_returns_paused_pomodoro(
+        self, client: testing.FlaskClient, paused_orm_pomodoro, project_owner_authorization_token
+    ):
+        response = client.get("/pomodoros/active", headers={"Authorization": project_owner_authorization_token})
+
+        assert response.status_code == 200
+        assert response.json["id"] == str(paused_orm_pomodoro.id)
+        assert response.json["state"] == PomodoroState.PAUSED.value
+
+    def test_get_active_pomodoro_without_active_pomodoro(
+        self, client: testing.FlaskClient, orm_task, project_owner_authorization_token
+    ):
+        response = client.get("/pomodoros/active", headers={"Authorization": project_owner_authorization_token})
+
+        assert response.status_code == 204
+
+
 class TestBeginPomodoroAPI:
     def test_begin_pomodoro_with_valid_data(
         self, client: testing.FlaskClient, orm_task, project_owner_authorization_token
@@ -80,6 +101,24 @@ class TestPausePomodoroAPI:
 
         assert response.status_code == 403
 
+    def test_pause_pomodoro_loads_pomodoro_row_once(
+        self, client: testing.FlaskClient, started_orm_pomodoro, project_owner_authorization_token
+    ):
+        db.merge_local_stats()
+        response = client.post(
+            f"/pomodoros/{started_orm_pomodoro.id}/pause",
+            headers={"Authorization": project_owner_authorization_token},
+            json={},
+        )
+        pomodoro_row_queries_count = sum(
+            query_stat.db_count
+            for sql, query_stat in db.local_stats.items()
+            if sql and sql.startswith("SELECT") and 'FROM "pomodoros"' in sql
+        )
+
+        assert response.status_code == 200
+        assert pomodoro_row_queries_count == 1
+
 
 class TestResumePomodoroAPI:
     @db_session(optimistic=False)
@@ -164,3 +203,70 @@ class TestFinishPomodoroAPI:
         )
 
         assert response.status_code == 403
+
+
+class TestSyncPomodorosAPI:
+    def test_sync_pomodoros_with_valid_data(
+        self, client: testing.FlaskClient, orm_task, started_orm_pomodoro, project_owner_authorization_token
+    ):
+        new_pomodoro_id = uuid.uuid4()
+        now = datetime.now(tz=pytz.UTC)
+        events = [
+            {"type": 3, "pomodoro_id": str(started_orm_pomodoro.id), "date": now.isoformat()},
+            {"type": 0, "pomodoro_id": str(new_pomodoro_id), "task_id": str(orm_task.id), "date": now.isoformat()},
+            {"type": 1, "pomodoro_id": str(new_pomodoro_id), "date": (now + timedelta(minutes=1)).isoformat()},
+        ]
+
+        response = client.post(
+            "/pomodoros/sync", headers={"Authorization": project_owner_authorization_token}, json={"events": events}
+        )
+
+        assert response.status_code == 200
+        assert [result["is_applied"] for result in response.json["results"]] == [True, True, True]
+        with db_session:
+            pomodoro_repo = SQLPomodoroRepository()
+            assert pomodoro_repo.get(started_orm_pomodoro.id).is_finished
+            assert pomodoro_repo.get(new_pomodoro_id).current_pause is not None
+
+    def test_sync_pomodoros_without_task_id_for_begin_event(
+        self, client: testing.FlaskClient, project_owner_authorization_token
+    ):
+        events = [{"type": 0, "pomodoro_id": str(uuid.uuid4()), "date": datetime.now(tz=pytz.UTC).isoformat()}]
+
+        response = client.post(
+            "/pomodoros/sync", headers={"Authorization": project_owner_authorization_token}, json={"events": events}
+        )
+
+        assert response.status_code == 400
+
+    def test_sync_pomodoros_with_random_authenticated_user(
+        self, client: testing.FlaskClient, started_orm_pomodoro, random_project_owner_authorization_token
+    ):
+        events = [
+            {"type": 1, "pomodoro_id": str(started_orm_pomodoro.id), "date": datetime.now(tz=pytz.UTC).isoformat()}
+        ]
+
+        response = client.post(
+            "/pomodoros/sync",
+            headers={"Authorization": random_project_owner_authorization_token},
+            json={"events": events},
+        )
+
+        assert response.status_code == 403
+
+    def test_sync_pomodoros_with_random_authenticated_user_and_unknown_pomodoro(
+        self, client: testing.FlaskClient, started_orm_pomodoro, random_project_owner_authorization_token
+    ):
+        now = datetime.now(tz=pytz.UTC).isoformat()
+        events = [
+            {"type": 1, "pomodoro_id": str(uuid.uuid4()), "date": now},
+            {"type": 1, "pomodoro_id": str(started_orm_pomodoro.id), "date": now},
+        ]
+
+        response = client.post(
+            "/pomodoros/sync",
+            headers={"Authorization": random_project_owner_authorization_token},
+            json={"events": events},
+        )
+
+        assert response.status_code == 403
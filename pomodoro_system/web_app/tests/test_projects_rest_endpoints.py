@@ -1,3 +1,4 @@
+import json
 import uuid
 
 import pytest
@@ -74,6 +75,46 @@ class TestProjectsRestAPI:
         assert response.status_code == 200
         assert len(response.json) == expected_length
 
+    def test_get_project_list_as_ndjson_stream(
+        self,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        orm_project,
+        orm_second_project,
+        orm_random_project,
+    ):
+        response = client.get(
+            "projects/",
+            headers={"Authorization": project_owner_authorization_token, "Accept": "application/x-ndjson"},
+        )
+        streamed_projects = [json.loads(line) for line in response.data.decode().splitlines()]
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert [project["id"] for project in streamed_projects] == [str(orm_project.id), str(orm_second_project.id)]
+
+    def test_get_project_list_with_cursor(
+        self,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        orm_project,
+        orm_second_project,
+        orm_random_project,
+    ):
+        first_page_response = client.get(
+            "projects/?page_size=1&cursor=", headers={"Authorization": project_owner_authorization_token}
+        )
+        second_page_response = client.get(
+            f"projects/?page_size=1&cursor={first_page_response.headers['X-Next-Cursor']}",
+            headers={"Authorization": project_owner_authorization_token},
+        )
+
+        assert [project["id"] for project in first_page_response.json + second_page_response.json] == [
+            str(orm_project.id),
+            str(orm_second_project.id),
+        ]
+        assert "X-Next-Cursor" not in second_page_response.headers
+
     @pytest.mark.parametrize(
         "page_size, page, expected_length",
         [
@@ -329,6 +370,18 @@ class TestProjectsRestAPI:
         assert response.status_code == 204
         assert fetched_project.is_removed
 
+    def test_soft_deleted_project_is_no_longer_accessible(
+        self,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        orm_project,
+    ):
+        headers = {"Authorization": project_owner_authorization_token}
+
+        assert client.get(f"projects/{orm_project.id}", headers=headers).status_code == 200
+        assert client.delete(f"projects/{orm_project.id}", headers=headers).status_code == 204
+        assert client.get(f"projects/{orm_project.id}", headers=headers).status_code == 404
+
     @db_session
     def test_delete_project_permanently(
         self,
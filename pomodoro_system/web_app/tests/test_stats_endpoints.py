@@ -0,0 +1,50 @@
+from datetime import date
+
+from flask import testing
+
+
+class TestStatsAPI:
+    def test_get_stats_contains_finished_pomodoro(
+        self,
+        client: testing.FlaskClient,
+        started_orm_pomodoro,
+        project_owner_authorization_token,
+    ):
+        client.patch(
+            f"/pomodoros/{started_orm_pomodoro.id}/finish",
+            headers={"Authorization": project_owner_authorization_token},
+            json={},
+        )
+
+        response = client.get("/stats/", headers={"Authorization": project_owner_authorization_token})
+
+        assert response.status_code == 200
+        assert len(response.json) == 1
+        assert response.json[0]["period_start"] == str(started_orm_pomodoro.start_date.date())
+        assert response.json[0]["completed_pomodoros"] == 1
+
+    def test_get_stats_without_finished_pomodoros(
+        self, client: testing.FlaskClient, started_orm_pomodoro, project_owner_authorization_token
+    ):
+        response = client.get(
+            "/stats/",
+            headers={"Authorization": project_owner_authorization_token},
+            query_string={"granularity": 2},
+        )
+
+        assert response.status_code == 200
+        assert response.json == []
+
+    def test_get_stats_with_invalid_date_range(self, client: testing.FlaskClient, project_owner_authorization_token):
+        response = client.get(
+            "/stats/",
+            headers={"Authorization": project_owner_authorization_token},
+            query_string={"date_from": str(date.today()), "date_to": "2020-01-01"},
+        )
+
+        assert response.status_code == 400
+
+    def test_get_stats_without_authorization_header(self, client: testing.FlaskClient):
+        response = client.get("/stats/", headers={})
+
+        assert response.status_code == 401
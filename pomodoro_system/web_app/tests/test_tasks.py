@@ -1,6 +1,18 @@
+from datetime import datetime, timedelta
+
+import pytz
+from pomodoros.domain.value_objects import PomodoroState, TaskStatus
+from pomodoros_infrastructure import PomodoroModel, TaskModel
+from pomodoros_infrastructure.tests.factories import ORMPomodoroFactory, ORMTaskFactory
 from pony.orm import db_session
 from web_app.authentication.models.token import Token
-from web_app.celery_tasks import remove_expired_tokens
+from web_app.celery.celery_app import create_celery
+from web_app.celery_tasks import (
+    dispatch_task_reminders,
+    finish_overdue_pomodoros,
+    remove_expired_tokens,
+    renew_repeatable_tasks,
+)
 
 
 def test_remove_expired_tokens(expired_project_owner_access_token, now):
@@ -14,3 +26,71 @@ def test_remove_expired_tokens(expired_project_owner_access_token, now):
         expired_tokens_exist = Token.exists(lambda token: token.expires <= now)
 
     assert not expired_tokens_exist
+
+
+def test_finish_overdue_pomodoros(app, orm_task):
+    start_date = datetime.now(tz=pytz.UTC) - timedelta(hours=2)
+    with db_session:
+        pomodoro_length = orm_task.pomodoro_length
+        overdue_pomodoro = ORMPomodoroFactory(
+            task=orm_task.id, start_date=start_date, end_date=None, due_date=start_date + pomodoro_length
+        )
+
+    finish_overdue_pomodoros.apply()
+
+    with db_session:
+        finished_pomodoro = PomodoroModel[overdue_pomodoro.id]
+
+        assert finished_pomodoro.state == PomodoroState.FINISHED.value
+        assert finished_pomodoro.due_date is None
+        assert pytz.UTC.localize(finished_pomodoro.end_date) == start_date + pomodoro_length
+
+
+def test_dispatch_task_reminders(mail, project_owner, orm_project):
+    reminder_date = datetime.now(tz=pytz.UTC) - timedelta(minutes=1)
+    with db_session:
+        orm_task = ORMTaskFactory(
+            project=orm_project.id, reminder_date=reminder_date, pending_reminder_date=reminder_date
+        )
+
+    with mail.record_messages() as outbox:
+        dispatch_task_reminders.apply()
+        dispatch_task_reminders.apply()
+
+        assert len(outbox) == 1
+        assert outbox[0].recipients == [project_owner.email]
+        assert orm_task.name in outbox[0].body
+
+    with db_session:
+        assert TaskModel[orm_task.id].pending_reminder_date is None
+
+
+def test_renew_repeatable_tasks(orm_project):
+    due_date = datetime.now(tz=pytz.UTC)
+    with db_session:
+        orm_task = ORMTaskFactory(
+            project=orm_project.id,
+            status=TaskStatus.COMPLETED.value,
+            due_date=due_date,
+            renewal_interval=timedelta(hours=1),
+            pending_renewal_date=due_date + timedelta(hours=1),
+        )
+
+    renew_repeatable_tasks.apply()
+
+    with db_session:
+        renewed_orm_task = TaskModel.get(name=orm_task.name, status=TaskStatus.ACTIVE.value)
+
+        assert TaskModel[orm_task.id].pending_renewal_date is None
+        assert pytz.UTC.localize(renewed_orm_task.due_date) == due_date + timedelta(hours=1)
+
+
+def test_fold_pomodoro_events_is_scheduled_only_with_event_log(app):
+    app.config["POMODORO_EVENT_LOG"] = False
+    assert "fold-pomodoro-events-every-minute" not in create_celery(app).conf.beat_schedule
+
+    app.config["POMODORO_EVENT_LOG"] = True
+    assert "fold-pomodoro-events-every-minute" in create_celery(app).conf.beat_schedule
+
+    app.config["POMODORO_EVENT_LOG"] = False
+    assert "fold-pomodoro-events-every-minute" not in create_celery(app).conf.beat_schedule
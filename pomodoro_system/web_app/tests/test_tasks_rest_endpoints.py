@@ -1,7 +1,10 @@
+import base64
+import json
 import uuid
 
 import pytest
 from flask import testing
+from foundation.models import db
 from foundation.value_objects import Priority
 from pomodoros_infrastructure.queries.tasks import DueDateFilter
 from pytest_lazyfixture import lazy_fixture
@@ -13,6 +16,19 @@ class TestTasksRestAPI:
 
         assert response.status_code == 200
 
+    def test_get_task_loads_task_row_once(
+        self, client: testing.FlaskClient, project_owner_authorization_token, orm_task
+    ):
+        db.merge_local_stats()
+        response = client.get(f"tasks/{str(orm_task.id)}", headers={"Authorization": project_owner_authorization_token})
+        tasks_queries_count = sum(
+            query_stat.db_count for sql, query_stat in db.local_stats.items() if sql and 'FROM "tasks"' in sql
+        )
+
+        assert response.status_code == 200
+        assert response.json["id"] == str(orm_task.id)
+        assert tasks_queries_count == 1
+
     def test_get_task_with_non_existing_task_id(self, client: testing.FlaskClient, project_owner_authorization_token):
         random_uuid = uuid.uuid4()
         response = client.get(f"tasks/{str(random_uuid)}", headers={"Authorization": project_owner_authorization_token})
@@ -70,6 +86,83 @@ class TestTasksRestAPI:
         assert response.status_code == 200
         assert len(response.json) == expected_length
 
+    @pytest.mark.parametrize("sort_field", ["created_at", "-created_at", "name", "-ordering"])
+    def test_get_task_list_with_cursor_walks_through_all_tasks(
+        self,
+        sort_field,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        orm_project,
+        orm_task,
+        orm_second_task,
+    ):
+        fetched_task_ids = []
+        cursor = ""
+
+        for _ in range(3):
+            response = client.get(
+                f"tasks/?page_size=1&sort={sort_field}&cursor={cursor}",
+                headers={"Authorization": project_owner_authorization_token},
+            )
+            assert response.status_code == 200
+
+            fetched_task_ids.extend(task["id"] for task in response.json)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert sorted(fetched_task_ids) == sorted([str(orm_task.id), str(orm_second_task.id)])
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", base64.urlsafe_b64encode(b"[]").decode()])
+    def test_get_task_list_with_invalid_cursor(
+        self, cursor, client: testing.FlaskClient, project_owner_authorization_token, orm_task
+    ):
+        response = client.get(
+            f"tasks/?page_size=1&cursor={cursor}", headers={"Authorization": project_owner_authorization_token}
+        )
+
+        assert response.status_code == 400
+        assert "cursor" in response.json
+
+    def test_get_task_list_as_ndjson_stream(
+        self,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        orm_project,
+        orm_task,
+        orm_second_task,
+        orm_random_task,
+    ):
+        response = client.get(
+            "tasks/?sort=created_at",
+            headers={"Authorization": project_owner_authorization_token, "Accept": "application/x-ndjson"},
+        )
+        streamed_tasks = [json.loads(line) for line in response.data.decode().splitlines()]
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert [task["id"] for task in streamed_tasks] == [str(orm_task.id), str(orm_second_task.id)]
+
+    def test_get_task_list_as_ndjson_stream_across_chunks(
+        self,
+        app,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        orm_project,
+        orm_task,
+        orm_second_task,
+    ):
+        app.config["STREAM_CHUNK_SIZE"] = 1
+
+        response = client.get(
+            "tasks/?sort=created_at",
+            headers={"Authorization": project_owner_authorization_token, "Accept": "application/x-ndjson"},
+        )
+        streamed_tasks = [json.loads(line) for line in response.data.decode().splitlines()]
+
+        assert response.status_code == 200
+        assert [task["id"] for task in streamed_tasks] == [str(orm_task.id), str(orm_second_task.id)]
+
     @pytest.mark.parametrize(
         "page_size, page, expected_length",
         [
@@ -401,6 +494,37 @@ class TestTasksRestAPI:
         assert response.json["date_frame_definition"] is None
         assert response.json["priority"] == expected_priority_data
 
+    def test_update_task_loads_task_row_once(
+        self, client: testing.FlaskClient, project_owner_authorization_token, orm_task
+    ):
+        db.merge_local_stats()
+        response = client.patch(
+            f"tasks/{str(orm_task.id)}",
+            headers={"Authorization": project_owner_authorization_token},
+            json={"note": "xyz"},
+        )
+        task_row_queries_count = sum(
+            query_stat.db_count
+            for sql, query_stat in db.local_stats.items()
+            if sql and sql.startswith("SELECT") and 'FROM "tasks"\nWHERE "id" = ?' in sql
+        )
+
+        assert response.status_code == 200
+        assert task_row_queries_count == 1
+
+    def test_update_task_keeps_sub_tasks_when_they_are_not_sent(
+        self, client: testing.FlaskClient, project_owner_authorization_token, orm_task_with_sub_tasks
+    ):
+        headers = {"Authorization": project_owner_authorization_token}
+        sub_tasks = client.get(f"tasks/{str(orm_task_with_sub_tasks.id)}", headers=headers).json["sub_tasks"]
+
+        response = client.patch(f"tasks/{str(orm_task_with_sub_tasks.id)}", headers=headers, json={"note": "xyz"})
+
+        assert response.status_code == 200
+        assert sorted(response.json["sub_tasks"], key=lambda sub_task: sub_task["ordering"]) == sorted(
+            sub_tasks, key=lambda sub_task: sub_task["ordering"]
+        )
+
     @pytest.mark.parametrize(
         "data_key, invalid_value",
         [
@@ -591,3 +715,31 @@ class TestTasksRestAPI:
         )
 
         assert response.status_code == 403
+
+    def test_search_tasks(
+        self,
+        client: testing.FlaskClient,
+        project_owner_authorization_token,
+        random_project_owner_authorization_token,
+        task_data,
+    ):
+        task_data["name"] = "Quarterly report"
+        created_task = client.post(
+            "tasks/", headers={"Authorization": project_owner_authorization_token}, json=task_data
+        ).json
+
+        response = client.get("tasks/search?q=quart", headers={"Authorization": project_owner_authorization_token})
+        foreign_response = client.get(
+            "tasks/search?q=quart", headers={"Authorization": random_project_owner_authorization_token}
+        )
+
+        assert response.status_code == 200
+        assert [task["id"] for task in response.json] == [created_task["id"]]
+        assert foreign_response.status_code == 200
+        assert foreign_response.json == []
+
+    def test_search_tasks_without_phrase(self, client: testing.FlaskClient, project_owner_authorization_token):
+        response = client.get("tasks/search", headers={"Authorization": project_owner_authorization_token})
+
+        assert response.status_code == 400
+        assert "q" in response.json
@@ -1,9 +1,9 @@
 import http
 from datetime import date, datetime
-from typing import Optional, Type
+from typing import Iterable, Optional, Type
 
 import marshmallow
-from flask import Blueprint, abort, make_response, request, url_for
+from flask import Blueprint, Response, abort, g, json, make_response, request, stream_with_context, url_for
 from flask_apispec.views import MethodResourceMeta
 from foundation.value_objects import T
 from marshmallow import Schema
@@ -36,6 +36,28 @@ def load_int_query_parameter(query_parameter: str) -> Optional[int]:
             return None
 
 
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def accepts_ndjson() -> bool:
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def stream_ndjson(items: Iterable, schema: Schema) -> Response:
+    def generate_lines():
+        for item in items:
+            yield json.dumps(schema.dump(item)) + "\n"
+
+    return Response(stream_with_context(generate_lines()), mimetype=NDJSON_MIMETYPE)
+
+
+def add_next_cursor_header(response: Response) -> Response:
+    next_cursor = g.get("next_cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+
 class RegistrableBlueprint(Blueprint):
     def __init__(self, *args, **kwargs) -> None:
         self.view_functions = []